@@ -24,62 +24,74 @@ echo "일일 업데이트 시작: $(date '+%Y-%m-%d %H:%M:%S')"
 echo "========================================"
 
 # 토큰 발급 (키움 API 사용 전 필수)
-echo "[1/16] 토큰 발급..."
+echo "[1/19] 토큰 발급..."
 python manage.py get_token
 
 # 휴장일 체크 (휴장이면 스크립트 종료)
-echo "[2/16] 휴장일 체크..."
+echo "[2/19] 휴장일 체크..."
 python manage.py check_market_open || exit 0
 
 # 시황
-echo "[3/16] 지수 차트..."
+echo "[3/19] 지수 차트..."
 python manage.py save_index_chart --mode last --log-level info
 
-echo "[4/16] 시장 동향..."
+echo "[4/19] 시장 동향..."
 python manage.py save_market_trend --mode last --log-level info
 
 # 종목 기본정보
-echo "[5/16] 종목 기본정보..."
+echo "[5/19] 종목 기본정보..."
 python manage.py save_stock_info --code all --log-level info
 
 # 종목 차트
-echo "[6/16] 일봉 차트..."
+echo "[6/19] 일봉 차트..."
 python manage.py save_daily_chart --code all --mode last --log-level info
 
-echo "[7/16] 주봉 차트..."
+echo "[7/19] 주봉 차트..."
 python manage.py save_weekly_chart --code all --mode last --log-level info
 
-echo "[8/16] 월봉 차트..."
+echo "[8/19] 월봉 차트..."
 python manage.py save_monthly_chart --code all --mode last --log-level info
 
 # 업종 (일봉 차트 이후 실행)
-echo "[9/16] 업종..."
+echo "[9/19] 업종..."
 python manage.py save_sector --mode last --log-level info
 
 # 종목 수급 (관심 종목만)
-echo "[10/16] 투자자 매매동향..."
+echo "[10/19] 투자자 매매동향..."
 python manage.py save_investor_trend --code fav --mode last --log-level info
 
-echo "[11/16] 공매도..."
+echo "[11/19] 공매도..."
 python manage.py save_short_selling --code fav --mode last --log-level info
 
 # 종목 뉴스 (관심 종목만)
-echo "[12/16] 공시..."
+echo "[12/19] 공시..."
 python manage.py save_gongsi_stock --code fav --log-level info
 
-echo "[13/16] 리포트..."
+echo "[13/19] 리포트..."
 python manage.py save_fnguide_report --code fav --log-level info
 
-echo "[14/16] 노다지..."
+echo "[14/19] 노다지..."
 python manage.py save_nodaji_stock --code fav --log-level info
 
 # ETF
-echo "[15/16] ETF 차트..."
+echo "[15/19] ETF 차트..."
 python manage.py save_etf_chart --mode last --log-level info
 
-echo "[16/16] ETF 정보..."
+echo "[16/19] ETF 정보..."
 python manage.py save_etf_info --log-level info
 
+# OHLCV 큐브 (차트 수집 이후, 페이지 캐시 이전)
+echo "[17/19] OHLCV 큐브..."
+python manage.py build_ohlcv_cube --log-level info
+
+# 페이지 캐시 (모든 수집 이후 실행)
+echo "[18/19] 페이지 캐시 워밍업..."
+python manage.py warm_page_cache --log-level info
+
+# DB 유지보수 (통계 갱신, WAL 체크포인트)
+echo "[19/19] DB 유지보수..."
+python manage.py sqlite_maintenance --log-level info
+
 echo "========================================"
 echo "일일 업데이트 완료: $(date '+%Y-%m-%d %H:%M:%S')"
 echo "========================================"
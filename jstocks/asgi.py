@@ -14,3 +14,8 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'jstocks.settings')
 
 application = get_asgi_application()
+
+# ASGI 서버는 이벤트 루프가 프로세스 수명 동안 유지되므로 텔레그램 클라이언트/브라우저를 요청 간 공유
+from stocks.external import enable_shared_clients  # noqa: E402
+
+enable_shared_clients()
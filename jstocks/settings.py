@@ -45,6 +45,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'stocks.middleware.ProfilingMiddleware',  # PROFILING_ENABLED=True일 때만 동작
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -78,14 +79,108 @@ WSGI_APPLICATION = 'jstocks.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# SQLite 동시성 설정 (연결마다 init_command 실행)
+# - WAL: 수집 명령어가 쓰는 동안에도 웹 요청의 읽기가 막히지 않음 (쓰기는 여전히 1개씩)
+# - synchronous=NORMAL: WAL에서는 전원 장애 시 마지막 커밋만 유실될 수 있고 DB 손상은 없음
+# - cache_size/mmap_size/temp_store: 페이지 캐시 64MB, 메모리 맵 256MB, 임시 테이블은 메모리
+# - timeout: 잠금 대기 (초), transaction_mode=IMMEDIATE: 트랜잭션 시작 시 쓰기 잠금을 잡아
+#   읽기→쓰기 승격 중 "database is locked"가 바로 나는 경우 방지
+# 정기 유지보수(PRAGMA optimize, WAL 체크포인트)는 sqlite_maintenance 명령어 참고
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': config('SQLITE_CACHE_SIZE', default=-64000, cast=int),  # 음수: KiB 단위
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+    'temp_store': 'MEMORY',
+}
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            'timeout': config('SQLITE_BUSY_TIMEOUT', default=20, cast=int),
+            'transaction_mode': 'IMMEDIATE',
+            'init_command': ';'.join(f'PRAGMA {name}={value}' for name, value in SQLITE_PRAGMAS.items()),
+        },
     }
 }
 
 
+# Cache
+# default: 렌더링된 페이지 HTML (프로세스 메모리, LRU, MAX_ENTRIES 초과 시 오래된 항목부터 제거)
+# shared: 페이지 context (파일, warm_page_cache 명령어와 웹 프로세스가 공유)
+# 키에 데이터 버전이 포함되므로 TIMEOUT은 안전장치 용도 (stocks/cache.py 참고)
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'jstocks-pages',
+        'TIMEOUT': config('PAGE_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('PAGE_CACHE_MAX_ENTRIES', default=50, cast=int),
+        },
+    },
+    'shared': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache',
+        'TIMEOUT': config('PAGE_CACHE_TIMEOUT', default=60 * 60 * 24, cast=int),
+        'OPTIONS': {
+            'MAX_ENTRIES': config('CONTEXT_CACHE_MAX_ENTRIES', default=40, cast=int),
+        },
+    },
+    # 차트 다운샘플링/지표 오버레이 결과 (stocks/charts.py, 검증값별 키), 페이지 HTML 캐시와 분리
+    # 종목/ETF 약 3,300개 x 일/주/월봉 기준 크기
+    'charts': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'jstocks-charts',
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            'MAX_ENTRIES': config('CHART_CACHE_MAX_ENTRIES', default=10000, cast=int),
+        },
+    },
+    # 백그라운드 작업 상태/중복 키/결과 (stocks/jobs.py), 페이지 context에 밀려나지 않도록 분리
+    'jobs': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': BASE_DIR / 'cache' / 'jobs',
+        'TIMEOUT': 60 * 60,
+        'OPTIONS': {
+            'MAX_ENTRIES': config('JOB_CACHE_MAX_ENTRIES', default=1000, cast=int),
+        },
+    },
+}
+
+
+# OHLCV 큐브 (분석용 봉 배열 파일, build_ohlcv_cube 명령어로 생성, stocks/cube.py 참고)
+OHLCV_CUBE_DIR = config('OHLCV_CUBE_DIR', default=str(BASE_DIR / 'cube'))
+
+
+# 시계열 보관 기간 (apply_retention 명령어, stocks/retention.py 참고)
+# 테이블별 보관 일수 (0이면 기간 정리 안 함), 수집 명령어의 --mode all 수집 기간보다 길게 유지
+
+RETENTION_DAYS = {
+    'daily_chart': 365 * 3,         # save_daily_chart --mode all: 2년
+    'investor_trend': 365,          # save_investor_trend --mode all: 180일
+    'short_selling': 365,           # save_short_selling --mode all: 60일
+    'sector': 365,                  # 섹터 페이지 차트: 60거래일
+    'market_trend': 365 * 2,
+    'daily_chart_etf': 365 * 3,     # save_etf_chart --mode all: 2년
+    'weekly_chart_etf': 365 * 6,    # 4년
+    'monthly_chart_etf': 365 * 10,  # 6년
+}
+RETENTION_ARCHIVE_DIR = config('RETENTION_ARCHIVE_DIR', default=str(BASE_DIR / 'archive'))
+# --delisted: 상장폐지(종목 목록에서 빠짐) 후 이 기간이 지난 코드만 정리 (재상장/일시 누락 대비)
+RETENTION_DELISTED_GRACE_DAYS = 90
+
+
+# Profiling
+# 요청별 시간/SQL/템플릿 측정, 최근 PROFILING_HISTORY개 요청을 /profiling/에서 조회 (관리자 전용)
+
+PROFILING_ENABLED = config('PROFILING_ENABLED', default=False, cast=bool)
+PROFILING_HISTORY = config('PROFILING_HISTORY', default=1000, cast=int)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class StocksConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'stocks'
+
+    def ready(self):
+        # 텍스트 저장/삭제 시 통합 검색 색인(search_index) 갱신
+        from .search import connect_signals
+        connect_signals()
@@ -0,0 +1,162 @@
+"""
+데이터 버전 기반 페이지 캐시
+
+대시보드(index), 시황(market), 섹터(sector), ETF(etf) 페이지는 하루 몇 번 바뀌는
+수집 데이터에서만 만들어지므로, 데이터셋별 버전 카운터를 키에 포함해 캐시합니다.
+수집 명령어/새로고침 API가 해당 데이터셋 버전을 올리면 이전 캐시는 더 이상 조회되지 않고
+용량 한도(MAX_ENTRIES)에 따라 정리됩니다.
+
+- 데이터 캐시 ('shared', 파일): 페이지 context, 관리 명령어(warm_page_cache)와 웹 프로세스가 공유
+- 페이지 캐시 ('default', 메모리 LRU): 렌더링된 HTML, 사용자/CSRF 쿠키별로 분리
+- 버전 카운터: SystemSetting (data_version:<데이터셋>)
+"""
+import hashlib
+from django.conf import settings as django_settings
+from django.contrib import messages
+from django.core.cache import caches
+from django.db import transaction
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.shortcuts import render
+
+
+# 데이터셋 → 변경 주체
+DATASETS = {
+    'charts': '일/주/월봉 차트, 지표 상태 (save_daily_chart, save_weekly_chart, save_monthly_chart, build_indicator_state)',
+    'stock_info': '종목 시세/기본정보 (save_stock_info, save_stock_list, refresh_stock)',
+    'reports': '리포트/노다지 (save_fnguide_report, save_nodaji_stock)',
+    'market': '지수/시장 동향 (save_index_chart, save_market_trend, refresh_market_trend)',
+    'sector': '업종 (save_sector, refresh_sector)',
+    'etf': 'ETF 차트/정보 (save_etf_chart, save_etf_info, ETF 추가/삭제)',
+    'watchlist': '관심종목/테마/관심섹터 편집',
+}
+
+# 페이지 → 의존 데이터셋
+PAGE_DATASETS = {
+    'index': ('charts', 'stock_info', 'reports', 'watchlist'),
+    'market': ('market',),
+    'sector': ('sector', 'watchlist'),
+    'etf': ('etf', 'watchlist'),
+}
+
+VERSION_KEY_PREFIX = 'data_version:'
+
+
+# ============ 버전 카운터 ============
+
+def get_data_versions(datasets):
+    """데이터셋별 현재 버전 (없으면 0)"""
+    from .models import SystemSetting
+
+    keys = [VERSION_KEY_PREFIX + name for name in datasets]
+    stored = dict(SystemSetting.objects.filter(key__in=keys).values_list('key', 'value'))
+    return tuple(stored.get(key, '0') for key in keys)
+
+
+def bump_data_version(*datasets):
+    """
+    데이터셋 버전 증가 (해당 데이터셋을 쓰는 페이지 캐시 무효화)
+
+    Args:
+        datasets: DATASETS 키 ('charts', 'market' 등)
+    """
+    from .models import SystemSetting
+
+    for name in datasets:
+        if name not in DATASETS:
+            raise ValueError(f'알 수 없는 데이터셋: {name}')
+        with transaction.atomic():
+            setting, _ = SystemSetting.objects.select_for_update().get_or_create(
+                key=VERSION_KEY_PREFIX + name,
+                defaults={'value': '0'}
+            )
+            setting.value = str(int(setting.value or 0) + 1)
+            setting.save(update_fields=['value', 'updated_at'])
+
+
+# ============ 페이지 캐시 ============
+
+def _context_key(page, versions):
+    return f'page_context:{page}:{"-".join(versions)}'
+
+
+def get_page_context(page, build_context):
+    """
+    페이지 context 조회 (데이터 버전이 같으면 캐시 사용)
+
+    Args:
+        page: PAGE_DATASETS 키
+        build_context: context dict를 만드는 함수 (인자 없음)
+    """
+    versions = get_data_versions(PAGE_DATASETS[page])
+    key = _context_key(page, versions)
+    shared = caches['shared']
+
+    context = shared.get(key)
+    if context is None:
+        context = build_context()
+        shared.set(key, context)
+    return context, versions
+
+
+def _page_key(request, page, versions):
+    """렌더링된 HTML 키 (CSRF 쿠키 없으면 None → 캐시 안 함)"""
+    csrf_cookie = request.COOKIES.get(django_settings.CSRF_COOKIE_NAME)
+    if not csrf_cookie or request.method != 'GET':
+        return None
+    raw = f'{request.user.pk}:{csrf_cookie}:{request.get_full_path()}'
+    digest = hashlib.md5(raw.encode()).hexdigest()
+    return f'page_html:{page}:{"-".join(versions)}:{digest}'
+
+
+def render_cached_page(request, page, template_name, build_context):
+    """
+    데이터 버전 기반 페이지 렌더링
+
+    - 같은 버전/사용자/CSRF 쿠키의 HTML이 있으면 그대로 반환
+    - 없으면 context 캐시(또는 새로 계산)로 렌더링 후 HTML 저장
+    - 표시할 메시지가 있는 요청은 HTML 캐시를 건너뜀
+    """
+    page_cache = caches['default']
+    has_messages = len(messages.get_messages(request)) > 0
+
+    context, versions = get_page_context(page, build_context)
+    page_key = None if has_messages else _page_key(request, page, versions)
+
+    if page_key:
+        content = page_cache.get(page_key)
+        if content is not None:
+            get_token(request)  # CSRF 쿠키 만료 갱신
+            return HttpResponse(content)
+
+    response = render(request, template_name, context)
+    if page_key and response.status_code == 200:
+        page_cache.set(page_key, response.content)
+    return response
+
+
+def warm_page_cache(pages=None):
+    """
+    페이지 context 캐시 미리 채우기 (수집 완료 후 실행)
+
+    Returns:
+        list: [(페이지, 새로 계산 여부)]
+    """
+    from . import views
+
+    builders = {
+        'index': views.build_index_context,
+        'market': views.build_market_context,
+        'sector': views.build_sector_context,
+        'etf': views.build_etf_context,
+    }
+    shared = caches['shared']
+    results = []
+    for page in pages or PAGE_DATASETS:
+        key = _context_key(page, get_data_versions(PAGE_DATASETS[page]))
+        if shared.get(key) is not None:
+            results.append((page, False))
+            continue
+        shared.set(key, builders[page]())
+        results.append((page, True))
+    return results
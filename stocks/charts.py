@@ -0,0 +1,347 @@
+"""
+상세 페이지 차트 데이터 (컬럼형 OHLCV)
+
+종목/ETF 상세 페이지의 일/주/월봉은 HTML에 직접 넣지 않고 차트 데이터 API로 따로 내려줍니다.
+
+- 컬럼형: 필드별 배열 1개 (봉마다 키를 반복하지 않음)
+- 날짜: epoch day (1970-01-01 이후 일수), 클라이언트에서 * 86400 하여 UTC timestamp로 사용
+- 과거 구간: before=<날짜> 키셋 페이지네이션 (차트를 왼쪽으로 스크롤할 때 추가 로드)
+- 검증값: 최신 봉 날짜 + 데이터 버전 (같은 날짜의 봉이 갱신돼도 버전으로 구분)
+- 지표 오버레이: 검증값별로 계산 결과 캐시 (indicators.compute_overlays, 'charts' 캐시: 페이지 HTML 캐시와 분리)
+- 다운샘플링: points(화면 포인트 수)보다 봉이 많으면 캔들은 OHLC 묶음 집계, 라인은 LTTB
+- 신호 차트 일괄 조회: 대시보드 카드 종목들의 최근 120일봉을 쿼리 1번으로 (load_recent_windows)
+  OHLCV 큐브(cube.py)가 최신이면 DB 대신 메모리 맵에서 슬라이싱
+"""
+import hashlib
+import math
+from collections import namedtuple
+from datetime import date, datetime, time, timedelta, timezone
+
+
+EPOCH = date(1970, 1, 1)
+
+TIMEFRAMES = ('daily', 'weekly', 'monthly')
+DEFAULT_LIMITS = {'daily': 240, 'weekly': 104, 'monthly': 72}
+MAX_LIMIT = 5000
+CHART_STYLES = ('candle', 'line')
+
+SIGNAL_WINDOW = 120  # 신호 차트: 최근 120일 (약 6개월)
+MAX_BATCH_CODES = 200
+
+BAR_COLUMNS = (
+    'date', 'opening_price', 'high_price', 'low_price',
+    'closing_price', 'trading_volume',
+)
+RESPONSE_KEYS = ('time', 'open', 'high', 'low', 'close', 'volume')
+
+# 분석용 봉 (모델 인스턴스 대신, 필드명은 봉 모델과 동일)
+Bar = namedtuple('Bar', BAR_COLUMNS)
+
+# 자산 종류 → 소유 FK 필드, 데이터셋(버전 카운터), 봉 모델
+ASSETS = {
+    'stock': {
+        'owner_field': 'stock',
+        'dataset': 'charts',
+        'models': {'daily': 'DailyChart', 'weekly': 'WeeklyChart', 'monthly': 'MonthlyChart'},
+    },
+    'etf': {
+        'owner_field': 'etf',
+        'dataset': 'etf',
+        'models': {'daily': 'DailyChartETF', 'weekly': 'WeeklyChartETF', 'monthly': 'MonthlyChartETF'},
+    },
+}
+
+
+def to_epoch_day(value):
+    return (value - EPOCH).days
+
+
+def bar_queryset(asset, code, timeframe):
+    """종목/ETF 하나의 봉 QuerySet ((소유 FK, -date) 인덱스 사용)"""
+    from . import models
+
+    config = ASSETS[asset]
+    model = getattr(models, config['models'][timeframe])
+    return model.objects.filter(**{f"{config['owner_field']}_id": code})
+
+
+def latest_bar_date(asset, code, timeframe):
+    return bar_queryset(asset, code, timeframe).order_by('-date').values_list('date', flat=True).first()
+
+
+def count_bars(asset, code, timeframe, limit, before=None):
+    """before 이전 봉 수 (최대 limit개까지만 셈, 다운샘플링 묶음 크기 계산용)"""
+    qs = bar_queryset(asset, code, timeframe)
+    if before:
+        qs = qs.filter(date__lt=before)
+    return qs.order_by('-date').values_list('date', flat=True)[:limit].count()
+
+
+def load_columns(asset, code, timeframe, limit, before=None):
+    """
+    최근 N개 봉을 컬럼형으로 조회 (과거 → 현재 순서)
+
+    before가 있으면 그 날짜 이전 봉부터 N개 (키셋 페이지네이션, (소유 FK, -date) 인덱스 범위 스캔)
+
+    Returns:
+        dict: {'time': [epoch day], 'open': [...], 'high', 'low', 'close', 'volume',
+               'has_more': 더 과거 봉 존재 여부}
+    """
+    qs = bar_queryset(asset, code, timeframe)
+    if before:
+        qs = qs.filter(date__lt=before)
+
+    # limit + 1개를 읽어 다음 페이지 존재 여부 확인
+    rows = list(qs.order_by('-date').values_list(*BAR_COLUMNS)[:limit + 1])
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    rows.reverse()
+
+    columns = [list(col) for col in zip(*rows)] if rows else [[] for _ in BAR_COLUMNS]
+    columns[0] = [to_epoch_day(d) for d in columns[0]]
+    result = dict(zip(RESPONSE_KEYS, columns))
+    result['has_more'] = has_more
+    return result
+
+
+def load_chart(asset, code, timeframe, limit, etag, before=None, bucket=1, style='candle'):
+    """
+    차트 응답 데이터 (원본 또는 다운샘플링)
+
+    - candle: bucket개 봉씩 OHLC 묶음 집계 (bucket=1이면 원본)
+    - line: 종가 라인을 LTTB로 (봉 수 / bucket)개 포인트로 축소
+
+    다운샘플링 결과는 검증값(시리즈, 묶음 크기 포함)별로 캐시합니다.
+    """
+    from django.core.cache import caches
+
+    if style == 'candle' and bucket == 1:
+        return load_columns(asset, code, timeframe, limit, before)
+
+    key = f'chart_columns:{etag}'
+    payload = caches['charts'].get(key)
+    if payload is None:
+        columns = load_columns(asset, code, timeframe, limit, before)
+        if style == 'line':
+            threshold = math.ceil(len(columns['time']) / bucket)
+            indices = lttb(columns['time'], columns['close'], threshold)
+            payload = {
+                'time': [columns['time'][i] for i in indices],
+                'close': [columns['close'][i] for i in indices],
+            }
+        else:
+            payload = downsample_ohlc(columns, bucket)
+        payload['has_more'] = columns['has_more']
+        payload['bucket'] = bucket
+        caches['charts'].set(key, payload)
+    return payload
+
+
+def load_overlays(asset, code, timeframe, limit, specs, etag, before=None, bucket=1):
+    """
+    지표 오버레이 계산 (검증값별 캐시, 같은 최신 봉/데이터 버전이면 재계산 없음)
+
+    지표가 첫 표시 봉부터 유효하도록 워밍업 구간을 더 읽어 계산한 뒤 마지막 limit개만 반환합니다.
+    bucket > 1이면 캔들 묶음과 같은 구간으로 맞춰 각 구간의 마지막 값을 사용합니다.
+
+    Returns:
+        dict: {'time': [epoch day], 'indicators': {지표키: 배열 또는 {시리즈명: 배열}}}
+    """
+    from django.core.cache import caches
+    from .indicators import overlay_warmup, compute_overlays
+
+    key = f'chart_overlays:{etag}'
+    payload = caches['charts'].get(key)
+    if payload is None:
+        columns = load_columns(asset, code, timeframe, limit + overlay_warmup(specs), before)
+        size = min(limit, len(columns['time']))
+        times = columns['time'][len(columns['time']) - size:]
+        overlays = compute_overlays(columns, specs, size)
+
+        if bucket > 1:
+            ranges = bucket_ranges(size, bucket)
+            times = [times[start] for start, _ in ranges]
+            overlays = {
+                name: (
+                    {k: [v[end - 1] for _, end in ranges] for k, v in values.items()}
+                    if isinstance(values, dict) else [values[end - 1] for _, end in ranges]
+                )
+                for name, values in overlays.items()
+            }
+
+        payload = {'time': times, 'indicators': overlays}
+        caches['charts'].set(key, payload)
+    return payload
+
+
+def load_recent_windows(asset, codes, size=SIGNAL_WINDOW):
+    """
+    여러 종목의 최근 size개 일봉을 한 번에 조회
+
+    OHLCV 큐브가 최신이면 메모리 맵에서, 아니면 종목별 ROW_NUMBER 윈도 함수 쿼리 1번으로 조회합니다.
+
+    Returns:
+        dict: {종목코드: {'time': [epoch day], 'open': [...], 'high', 'low', 'close', 'volume'}}
+    """
+    from django.db.models import F, Window
+    from django.db.models.functions import RowNumber
+    from . import models
+    from .cube import open_cube
+
+    cube = open_cube(asset, 'daily')
+    if cube is not None:
+        windows = {}
+        for code in codes:
+            recent = cube.recent(code, size)
+            if recent is None or not len(recent['time']):
+                continue
+            windows[code] = {
+                key: recent[field].tolist()
+                for key, field in zip(RESPONSE_KEYS, ('time',) + BAR_COLUMNS[1:])
+            }
+        return windows
+
+    config = ASSETS[asset]
+    owner_id = f"{config['owner_field']}_id"
+    model = getattr(models, config['models']['daily'])
+
+    rows = (
+        model.objects.filter(**{f'{owner_id}__in': codes})
+        .annotate(row_number=Window(RowNumber(), partition_by=F(owner_id), order_by=F('date').desc()))
+        .filter(row_number__lte=size)
+        .order_by(owner_id, 'date')
+        .values_list(owner_id, *BAR_COLUMNS)
+    )
+
+    windows = {}
+    for owner, *bar in rows:
+        columns = windows.setdefault(owner, {key: [] for key in RESPONSE_KEYS})
+        columns['time'].append(to_epoch_day(bar[0]))
+        for key, value in zip(RESPONSE_KEYS[1:], bar[1:]):
+            columns[key].append(value)
+    return windows
+
+
+def load_recent_bars(asset, codes, size):
+    """
+    여러 종목의 최근 size개 일봉을 Bar 목록으로 (최신 → 과거, 카드 신호 계산용)
+
+    Returns:
+        dict: {종목코드: [Bar(date, opening_price, high_price, low_price, closing_price, trading_volume)]}
+    """
+    return {
+        code: [
+            Bar(EPOCH + timedelta(days=day), *values)
+            for day, *values in reversed(list(zip(*(columns[key] for key in RESPONSE_KEYS))))
+        ]
+        for code, columns in load_recent_windows(asset, codes, size).items()
+    }
+
+
+# ============ 다운샘플링 ============
+
+def bucket_size(bars, points):
+    """
+    화면 포인트 수에 맞춘 봉 묶음 크기 (1이면 원본, points 없으면 1)
+
+    Args:
+        bars: 실제로 읽을 봉 수 (요청 limit이 아니라 count_bars 결과, 봉이 limit보다 적은 종목 대비)
+    """
+    if not points:
+        return 1
+    return max(1, math.ceil(bars / points))
+
+
+def bucket_ranges(n, size):
+    """
+    최신 봉부터 size개씩 묶은 구간 [(start, end), ...] (과거 → 현재 순서)
+
+    가장 오래된 구간만 size보다 작을 수 있어, 과거 구간을 이어 붙여도 묶음 경계가 유지됩니다.
+    """
+    ranges = []
+    end = n
+    while end > 0:
+        start = max(0, end - size)
+        ranges.append((start, end))
+        end = start
+    ranges.reverse()
+    return ranges
+
+
+def downsample_ohlc(columns, size):
+    """OHLC 묶음 집계 (시가=첫 봉, 고가=최대, 저가=최소, 종가=마지막 봉, 거래량=합계, 날짜=첫 봉)"""
+    ranges = bucket_ranges(len(columns['time']), size)
+    return {
+        'time': [columns['time'][start] for start, _ in ranges],
+        'open': [columns['open'][start] for start, _ in ranges],
+        'high': [max(columns['high'][start:end]) for start, end in ranges],
+        'low': [min(columns['low'][start:end]) for start, end in ranges],
+        'close': [columns['close'][end - 1] for _, end in ranges],
+        'volume': [sum(columns['volume'][start:end]) for start, end in ranges],
+    }
+
+
+def lttb(xs, ys, threshold):
+    """
+    Largest-Triangle-Three-Buckets 라인 다운샘플링
+
+    첫/마지막 포인트는 유지하고, 나머지 구간마다 이전 선택점·다음 구간 평균과
+    만드는 삼각형 넓이가 가장 큰 포인트를 선택합니다.
+
+    Returns:
+        list: 선택된 인덱스 (오름차순)
+    """
+    n = len(xs)
+    if threshold >= n or threshold < 3:
+        return list(range(n))
+
+    indices = [0]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # 다음 구간 평균점
+        next_start = int((i + 1) * every) + 1
+        next_end = max(min(int((i + 2) * every) + 1, n), next_start + 1)
+        count = next_end - next_start
+        avg_x = sum(xs[next_start:next_end]) / count
+        avg_y = sum(ys[next_start:next_end]) / count
+
+        # 현재 구간에서 삼각형 넓이 최대 포인트
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        best_area = -1
+        best = start
+        for j in range(start, end):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > best_area:
+                best_area = area
+                best = j
+        indices.append(best)
+        a = best
+
+    indices.append(n - 1)
+    return indices
+
+
+def get_validators(asset, code, timeframe, params):
+    """
+    조건부 GET 검증값
+
+    Args:
+        params: 응답 내용을 바꾸는 요청 파라미터 (limit 등)
+
+    Returns:
+        tuple: (ETag 문자열(따옴표 포함), Last-Modified timestamp 또는 None)
+    """
+    from .cache import get_data_versions
+
+    last_date = latest_bar_date(asset, code, timeframe)
+    version = get_data_versions((ASSETS[asset]['dataset'],))[0]
+
+    raw = f'{asset}:{code}:{timeframe}:{params}:{last_date}:{version}'
+    etag = f'"{hashlib.md5(raw.encode()).hexdigest()}"'
+
+    last_modified = None
+    if last_date:
+        last_modified = int(datetime.combine(last_date, time.min, tzinfo=timezone.utc).timestamp())
+    return etag, last_modified
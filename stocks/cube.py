@@ -0,0 +1,402 @@
+"""
+OHLCV 큐브 (분석용 컬럼형 파일 저장소, numpy.memmap)
+
+일/주/월봉 테이블(종목, ETF)을 필드별 int64 배열 파일로 저장해 두고,
+분석 코드(대시보드/ETF 카드, 신호 차트)는 ORM 인스턴스를 만들지 않고 메모리 맵에서 바로 슬라이싱합니다.
+
+- 배열 모양: (거래일 수, 종목 용량), 행 = 날짜(과거 → 현재), 열 = 종목
+  날짜 우선 배치라 새 거래일은 파일 끝에 행을 붙이기만 하면 됨 (append_cube)
+- 빈 칸: MISSING (-1), 상장 전/거래정지 등 봉이 없는 날
+- 파일: <OHLCV_CUBE_DIR>/<자산>_<주기>/meta.json + <필드>.<세대>.bin
+  전체 재구축(build_cube)/증분 갱신(append_cube) 모두 새 세대 파일을 만든 뒤 meta.json을 원자적으로 교체
+  (읽는 쪽이 연 세대 파일은 수정하지 않음)
+- 과거 봉 변경: 수집 명령어가 저장/삭제한 가장 이른 날짜를 mark_cube_changed로 기록하면
+  append_cube가 그 날짜부터 다시 채움 (수정주가 재수집, ETF 최근 30일/12주/12개월 재저장 등)
+- 최신 여부: meta의 데이터 버전이 현재 버전(cache.DATASETS)과 다르면 open_cube는 None
+  → 호출하는 쪽은 ORM 조회로 대체 (큐브 갱신 전 새로고침/종목 추가 등)
+- 읽기: 프로세스별로 meta.json 수정 시각 기준 캐시, 반환 배열은 메모리 맵의 뷰 (복사 없음)
+"""
+import json
+import os
+import shutil
+from bisect import bisect_left
+from datetime import date, timedelta
+from itertools import islice
+from pathlib import Path
+
+from .charts import ASSETS, BAR_COLUMNS, EPOCH, TIMEFRAMES, to_epoch_day
+
+
+FIELDS = BAR_COLUMNS[1:]  # date 제외 (날짜는 meta의 dates)
+MISSING = -1
+CAPACITY_STEP = 256  # 종목 용량 단위 (추가 종목 여유분)
+DTYPE = '<i8'
+FILL_CHUNK = 20000  # 파일 채우기 단위 (행)
+CHANGED_KEY_PREFIX = 'cube_changed_from:'  # SystemSetting: 큐브 작성 후 변경된 가장 이른 봉 날짜
+
+_opened = {}  # (자산, 주기) → (meta 수정 시각, OhlcvCube)
+
+
+def cube_dir(asset, timeframe):
+    from django.conf import settings
+    return Path(settings.OHLCV_CUBE_DIR) / f'{asset}_{timeframe}'
+
+
+def _read_meta(path):
+    try:
+        return json.loads((path / 'meta.json').read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return None
+
+
+def _write_meta(path, meta):
+    """meta.json 원자적 교체 (읽는 쪽은 이전 또는 새 meta만 봄)"""
+    tmp = path / 'meta.json.tmp'
+    tmp.write_text(json.dumps(meta), encoding='utf-8')
+    os.replace(tmp, path / 'meta.json')
+
+
+def _field_path(path, field, generation):
+    return path / f'{field}.{generation}.bin'
+
+
+def _capacity(count):
+    return (count // CAPACITY_STEP + 1) * CAPACITY_STEP
+
+
+def _current_version(asset):
+    from .cache import get_data_versions
+    return get_data_versions((ASSETS[asset]['dataset'],))[0]
+
+
+def _source(asset, timeframe):
+    """(봉 모델, 소유 FK 컬럼명)"""
+    from . import models
+
+    config = ASSETS[asset]
+    return getattr(models, config['models'][timeframe]), f"{config['owner_field']}_id"
+
+
+def _fill(arrays, row_of, col_of, asset, timeframe, date_from=None, codes=None):
+    """봉 테이블을 스트리밍 조회해 FILL_CHUNK행 단위로 배열에 채움"""
+    import numpy as np
+
+    model, owner_id = _source(asset, timeframe)
+    qs = model.objects.all()
+    if date_from is not None:
+        qs = qs.filter(date__gte=date_from)
+    if codes is not None:
+        qs = qs.filter(**{f'{owner_id}__in': codes})
+    bars = qs.values_list(owner_id, *BAR_COLUMNS).iterator(chunk_size=FILL_CHUNK)
+
+    while chunk := list(islice(bars, FILL_CHUNK)):
+        rows = np.fromiter((row_of[to_epoch_day(bar[1])] for bar in chunk), dtype=np.intp, count=len(chunk))
+        cols = np.fromiter((col_of[bar[0]] for bar in chunk), dtype=np.intp, count=len(chunk))
+        for i, field in enumerate(FIELDS, start=2):
+            arrays[field][rows, cols] = np.fromiter((bar[i] for bar in chunk), dtype=DTYPE, count=len(chunk))
+
+
+# ============ 변경 기록 ============
+
+def _changed_key(asset, timeframe):
+    return f'{CHANGED_KEY_PREFIX}{asset}_{timeframe}'
+
+
+def mark_cube_changed(asset, timeframe, since):
+    """
+    since 이후(포함) 봉이 추가/수정/삭제됨을 기록 (기록된 날짜보다 이를 때만 갱신)
+
+    수집 명령어가 저장을 마친 뒤 1번 호출합니다. 전체 삭제는 date.min으로 기록 (다음 append_cube가 재구축).
+    """
+    from django.db import transaction
+    from .models import SystemSetting
+
+    value = since.isoformat()
+    with transaction.atomic():
+        setting, created = SystemSetting.objects.select_for_update().get_or_create(
+            key=_changed_key(asset, timeframe),
+            defaults={'value': value}
+        )
+        if not created and (not setting.value or value < setting.value):
+            setting.value = value
+            setting.save(update_fields=['value', 'updated_at'])
+
+
+def _changed_from(asset, timeframe):
+    """기록된 변경 시작일 → (date 또는 None, 저장값)"""
+    from .models import SystemSetting
+
+    value = SystemSetting.objects.filter(key=_changed_key(asset, timeframe)).values_list('value', flat=True).first()
+    return (date.fromisoformat(value) if value else None), value
+
+
+def _clear_changed(asset, timeframe, value):
+    """반영한 변경 기록 삭제 (큐브 작성 중 더 이른 날짜가 기록됐으면 남겨둠)"""
+    from .models import SystemSetting
+
+    if value:
+        SystemSetting.objects.filter(key=_changed_key(asset, timeframe), value=value).delete()
+
+
+# ============ 쓰기 ============
+
+def build_cube(asset, timeframe):
+    """
+    전체 재구축 (새 세대 파일 작성 후 meta 교체, 이전 세대 파일 삭제)
+
+    Returns:
+        dict: meta
+    """
+    import numpy as np
+
+    version = _current_version(asset)
+    _, changed_value = _changed_from(asset, timeframe)
+    path = cube_dir(asset, timeframe)
+    path.mkdir(parents=True, exist_ok=True)
+    old_meta = _read_meta(path)
+    generation = (old_meta['generation'] + 1) if old_meta else 1
+
+    # 날짜/종목 축 먼저 확정
+    model, owner_id = _source(asset, timeframe)
+    dates = [to_epoch_day(d) for d in model.objects.values_list('date', flat=True).distinct().order_by('date')]
+    codes = list(model.objects.values_list(owner_id, flat=True).distinct().order_by(owner_id))
+    capacity = _capacity(len(codes))
+
+    row_of = {d: i for i, d in enumerate(dates)}
+    col_of = {c: i for i, c in enumerate(codes)}
+    shape = (max(len(dates), 1), capacity)
+    arrays = {
+        field: np.memmap(_field_path(path, field, generation), dtype=DTYPE, mode='w+', shape=shape)
+        for field in FIELDS
+    }
+    for array in arrays.values():
+        array[:] = MISSING
+    _fill(arrays, row_of, col_of, asset, timeframe)
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    meta = {
+        'asset': asset,
+        'timeframe': timeframe,
+        'generation': generation,
+        'version': version,
+        'fields': list(FIELDS),
+        'dates': dates,
+        'codes': codes,
+        'capacity': capacity,
+    }
+    _write_meta(path, meta)
+
+    if old_meta:
+        for field in FIELDS:
+            _field_path(path, field, old_meta['generation']).unlink(missing_ok=True)
+    _clear_changed(asset, timeframe, changed_value)
+    return meta
+
+
+def append_cube(asset, timeframe):
+    """
+    증분 갱신 (수집 후 실행)
+
+    마지막 저장일(또는 mark_cube_changed로 기록된 더 이른 변경일)부터 봉을 다시 채우고, 이후 날짜는 행으로 추가합니다.
+    새 종목은 빈 열에 전체 이력을 채우며, 용량이 부족하거나 큐브가 없거나
+    큐브에 없는 과거 날짜가 생기면(날짜 축 중간 삽입 불가) 전체 재구축합니다.
+    기존 세대 파일을 복사한 새 세대에 쓰고 meta.json을 교체하므로 읽는 쪽이 연 파일은 바뀌지 않습니다.
+
+    Returns:
+        tuple: (meta, 재구축 여부)
+    """
+    import numpy as np
+
+    version = _current_version(asset)
+    changed_from, changed_value = _changed_from(asset, timeframe)
+    path = cube_dir(asset, timeframe)
+    meta = _read_meta(path)
+    if meta is None or meta['fields'] != list(FIELDS) or not meta['dates']:
+        return build_cube(asset, timeframe), True
+
+    model, owner_id = _source(asset, timeframe)
+    codes = list(meta['codes'])
+    col_of = {c: i for i, c in enumerate(codes)}
+    all_codes = list(model.objects.values_list(owner_id, flat=True).distinct().order_by(owner_id))
+    new_codes = [c for c in all_codes if c not in col_of]
+    if len(codes) + len(new_codes) > meta['capacity']:
+        return build_cube(asset, timeframe), True
+
+    last_day = meta['dates'][-1]
+    date_from = EPOCH + timedelta(days=last_day)
+    if changed_from is not None and changed_from < date_from:
+        if to_epoch_day(changed_from) < meta['dates'][0]:
+            return build_cube(asset, timeframe), True
+        date_from = changed_from
+    recent_days = [
+        to_epoch_day(d)
+        for d in model.objects.filter(date__gte=date_from).values_list('date', flat=True).distinct().order_by('date')
+    ]
+    known_days = set(meta['dates'])
+    if any(d < last_day and d not in known_days for d in recent_days):
+        return build_cube(asset, timeframe), True
+    dates = meta['dates'] + [d for d in recent_days if d > last_day]
+    # 새 종목의 과거 봉 중 큐브에 없는 날짜가 있으면 재구축
+    if new_codes:
+        known_days.update(dates)
+        new_code_days = model.objects.filter(**{f'{owner_id}__in': new_codes}).values_list('date', flat=True).distinct()
+        if any(to_epoch_day(d) not in known_days for d in new_code_days):
+            return build_cube(asset, timeframe), True
+
+    for code in new_codes:
+        col_of[code] = len(codes)
+        codes.append(code)
+
+    # 새 세대 파일: 이전 세대 복사 → 행 추가 → 변경 구간(date_from 이후 행)은 비운 뒤 다시 채움
+    generation = meta['generation'] + 1
+    rows = len(dates)
+    start_row = bisect_left(meta['dates'], to_epoch_day(date_from))
+    row_bytes = meta['capacity'] * np.dtype(DTYPE).itemsize
+    arrays = {}
+    for field in FIELDS:
+        file_path = _field_path(path, field, generation)
+        shutil.copyfile(_field_path(path, field, meta['generation']), file_path)
+        with open(file_path, 'r+b') as f:
+            f.truncate(rows * row_bytes)
+        array = np.memmap(file_path, dtype=DTYPE, mode='r+', shape=(rows, meta['capacity']))
+        array[start_row:] = MISSING
+        arrays[field] = array
+
+    row_of = {d: i for i, d in enumerate(dates)}
+    _fill(arrays, row_of, col_of, asset, timeframe, date_from=date_from)
+    if new_codes:
+        _fill(arrays, row_of, col_of, asset, timeframe, codes=new_codes)
+
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    old_generation = meta['generation']
+    meta = dict(meta, generation=generation, dates=dates, codes=codes, version=version)
+    _write_meta(path, meta)
+
+    for field in FIELDS:
+        _field_path(path, field, old_generation).unlink(missing_ok=True)
+    _clear_changed(asset, timeframe, changed_value)
+    return meta, False
+
+
+# ============ 읽기 ============
+
+class OhlcvCube:
+    """
+    열린 큐브 (필드별 (거래일, 종목 용량) 메모리 맵, 읽기 전용)
+
+    Attributes:
+        dates: 거래일 epoch day 배열 (과거 → 현재)
+        codes: 종목코드 목록 (열 순서)
+        arrays: {필드: np.memmap}
+    """
+
+    def __init__(self, path, meta):
+        import numpy as np
+
+        self.meta = meta
+        self.codes = meta['codes']
+        self.dates = np.asarray(meta['dates'], dtype=DTYPE)
+        self._col_of = {c: i for i, c in enumerate(self.codes)}
+        shape = (len(meta['dates']), meta['capacity'])
+        self.arrays = {
+            field: np.memmap(_field_path(path, field, meta['generation']), dtype=DTYPE, mode='r', shape=shape)
+            for field in meta['fields']
+        }
+
+    def column(self, code):
+        return self._col_of.get(code)
+
+    def date_slice(self, start=None, end=None):
+        """날짜 구간 [start, end]의 행 slice (date 또는 epoch day)"""
+        import numpy as np
+
+        lo = 0 if start is None else int(np.searchsorted(self.dates, _as_day(start), side='left'))
+        hi = len(self.dates) if end is None else int(np.searchsorted(self.dates, _as_day(end), side='right'))
+        return slice(lo, hi)
+
+    def series(self, code, field, rows=slice(None)):
+        """종목 하나의 필드 배열 (뷰, 빈 날은 MISSING), 종목이 없으면 None"""
+        col = self.column(code)
+        if col is None:
+            return None
+        return self.arrays[field][rows, col]
+
+    def recent(self, code, size):
+        """
+        종목의 최근 size개 봉 (빈 날 제외, 과거 → 현재)
+
+        Returns:
+            dict: {'time': epoch day 배열, 필드: 배열} 또는 None (종목 없음)
+        """
+        import numpy as np
+
+        col = self.column(code)
+        if col is None:
+            return None
+        valid = np.flatnonzero(self.arrays['closing_price'][:, col] != MISSING)[-size:]
+        if len(valid) and valid[-1] - valid[0] + 1 == len(valid):
+            rows = slice(int(valid[0]), int(valid[-1]) + 1)  # 연속 구간이면 뷰 그대로
+        else:
+            rows = valid
+        result = {'time': self.dates[rows]}
+        for field, array in self.arrays.items():
+            result[field] = array[rows, col]
+        return result
+
+
+def _as_day(value):
+    return value if isinstance(value, int) else to_epoch_day(value)
+
+
+def open_cube(asset, timeframe, require_current=True):
+    """
+    큐브 열기 (프로세스별 캐시)
+
+    Args:
+        require_current: 데이터 버전이 큐브 작성 시점과 다르면 None (ORM으로 대체하도록)
+
+    Returns:
+        OhlcvCube 또는 None (큐브 없음/오래됨/numpy 없음)
+    """
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return None
+
+    path = cube_dir(asset, timeframe)
+    try:
+        mtime = (path / 'meta.json').stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _opened.get((asset, timeframe))
+    if cached and cached[0] == mtime:
+        cube = cached[1]
+    else:
+        meta = _read_meta(path)
+        if meta is None or not meta['dates']:
+            return None
+        try:
+            cube = OhlcvCube(path, meta)
+        except (FileNotFoundError, ValueError):
+            return None  # 재구축 중 이전 세대 파일 삭제됨
+        _opened[(asset, timeframe)] = (mtime, cube)
+
+    if require_current and cube.meta['version'] != _current_version(asset):
+        return None
+    return cube
+
+
+def cube_targets(asset=None, timeframe=None):
+    """(자산, 주기) 목록 (None이면 전체)"""
+    return [
+        (a, t)
+        for a in ([asset] if asset else ASSETS)
+        for t in ([timeframe] if timeframe else TIMEFRAMES)
+    ]
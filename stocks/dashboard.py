@@ -0,0 +1,113 @@
+"""
+대시보드 카드 집계 (DashboardCard) 재구축
+
+리포트/노다지 카드는 수집 명령어 완료 시 한 번만 집계해 두고,
+대시보드는 거래일 distinct 조회와 종목별 그룹핑 없이 집계 테이블만 읽습니다.
+"""
+from collections import defaultdict
+from django.db import transaction
+
+
+REPORT_TRADING_DAYS = 3  # 리포트 카드: 최근 3거래일
+NODAJI_TRADING_DAYS = 5  # 노다지 카드: 최근 5거래일
+
+
+def get_window_start(trading_days):
+    """최근 N거래일 구간의 시작일 (일봉 기준, 데이터 없으면 None)"""
+    from .models import DailyChart
+
+    dates = list(DailyChart.objects.values_list('date', flat=True)
+                 .order_by('-date').distinct()[:trading_days])
+    return min(dates) if dates else None
+
+
+def rebuild_report_cards():
+    """
+    리포트 카드 집계 재구축
+
+    종목별로 집계 구간 내 가장 최신 날짜의 목표가 최고 리포트를 대표로 저장하고,
+    구간 내 전체 리포트 개수를 함께 저장합니다.
+
+    Returns:
+        int: 저장된 카드 수
+    """
+    from .models import Report, DashboardCard
+
+    window_start = get_window_start(REPORT_TRADING_DAYS)
+    cards = []
+
+    if window_start:
+        reports = Report.objects.filter(date__gte=window_start).only(
+            'id', 'stock_id', 'date', 'title', 'provider', 'target_price'
+        )
+
+        stock_reports = defaultdict(list)
+        for report in reports:
+            stock_reports[report.stock_id].append(report)
+
+        for stock_id, rpts in stock_reports.items():
+            # 가장 최신 날짜 기준, 목표가 가장 높은 것 선택
+            latest_date = max(r.date for r in rpts)
+            best_report = max(
+                (r for r in rpts if r.date == latest_date),
+                key=lambda r: r.target_price or 0
+            )
+            cards.append(DashboardCard(
+                card_type='report',
+                stock_id=stock_id,
+                window_start=window_start,
+                source_id=best_report.id,
+                date=best_report.date,
+                title=best_report.title,
+                provider=best_report.provider,
+                target_price=best_report.target_price,
+                total_count=len(rpts),
+            ))
+
+    with transaction.atomic():
+        DashboardCard.objects.filter(card_type='report').delete()
+        DashboardCard.objects.bulk_create(cards)
+    return len(cards)
+
+
+def rebuild_nodaji_cards():
+    """
+    노다지 카드 집계 재구축
+
+    종목별로 집계 구간 내 가장 최신 노다지 기사를 저장합니다.
+
+    Returns:
+        int: 저장된 카드 수
+    """
+    from .models import Nodaji, DashboardCard
+
+    window_start = get_window_start(NODAJI_TRADING_DAYS)
+    cards = []
+
+    if window_start:
+        nodajis = Nodaji.objects.filter(date__gte=window_start).only(
+            'id', 'stock_id', 'date', 'title', 'link'
+        ).order_by('-date', '-id')
+
+        counts = defaultdict(int)
+        latest = {}
+        for nodaji in nodajis:
+            counts[nodaji.stock_id] += 1
+            latest.setdefault(nodaji.stock_id, nodaji)
+
+        for stock_id, nodaji in latest.items():
+            cards.append(DashboardCard(
+                card_type='nodaji',
+                stock_id=stock_id,
+                window_start=window_start,
+                source_id=nodaji.id,
+                date=nodaji.date,
+                title=nodaji.title,
+                link=nodaji.link,
+                total_count=counts[stock_id],
+            ))
+
+    with transaction.atomic():
+        DashboardCard.objects.filter(card_type='nodaji').delete()
+        DashboardCard.objects.bulk_create(cards)
+    return len(cards)
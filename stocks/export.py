@@ -0,0 +1,219 @@
+"""
+데이터 내보내기 (일봉/수급/공매도/업종/시장 매매동향/ETF 봉 → CSV, Parquet)
+
+export_data 명령어, /api/export/<table>/ 엔드포인트, apply_retention 보관 파일이 같은 코드를 사용합니다.
+
+- 조회: values_list().iterator(chunk_size)로 DB 커서에서 조금씩 읽음 (모델 인스턴스, 전체 목록 생성 없음)
+- 쓰기: CHUNK_SIZE행마다 CSV 텍스트 / Parquet row group 1개를 만들어 바로 내보냄
+- 따라서 행 수와 관계없이 메모리 사용량은 청크 1개 크기로 일정
+- Parquet은 pyarrow 필요 (없으면 CSV만 가능)
+"""
+import csv
+import io
+from datetime import date
+
+
+CHUNK_SIZE = 20000  # 청크(CSV 텍스트 조각, Parquet row group)당 행 수
+FORMATS = ('csv', 'parquet')
+
+# 테이블 이름: (모델, 코드 필터 필드)
+EXPORT_TABLES = {
+    'daily_chart': ('DailyChart', 'stock'),
+    'investor_trend': ('InvestorTrend', 'stock'),
+    'short_selling': ('ShortSelling', 'stock'),
+    'sector': ('Sector', 'code'),
+    'market_trend': ('MarketTrend', 'market'),
+    'daily_chart_etf': ('DailyChartETF', 'etf'),
+    'weekly_chart_etf': ('WeeklyChartETF', 'etf'),
+    'monthly_chart_etf': ('MonthlyChartETF', 'etf'),
+}
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def parse_codes(text):
+    """쉼표/공백 구분 코드 목록"""
+    return [code for code in (text or '').replace(',', ' ').split() if code]
+
+
+def parse_date(text):
+    """YYYY-MM-DD 또는 YYYYMMDD (없으면 None, 형식 오류는 ValueError)"""
+    if not text:
+        return None
+    text = text.strip()
+    if len(text) == 8 and text.isdigit():
+        text = f'{text[:4]}-{text[4:6]}-{text[6:]}'
+    return date.fromisoformat(text)
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class TableExport:
+    """
+    테이블 1개 내보내기
+
+    Args:
+        table: EXPORT_TABLES 키
+        start, end: 일자 범위 (포함, None이면 제한 없음)
+        codes: 종목코드/업종코드/시장 목록 (비어 있으면 전체)
+
+    chunks(fmt)는 bytes 조각을 차례로 반환하며, 모두 소비한 뒤 rows에 행 수가 남습니다.
+    """
+
+    def __init__(self, table, start=None, end=None, codes=None, chunk_size=CHUNK_SIZE):
+        from django.apps import apps
+
+        if table not in EXPORT_TABLES:
+            raise ValueError(f'지원하지 않는 테이블입니다: {table} (가능: {", ".join(EXPORT_TABLES)})')
+        model_name, code_field = EXPORT_TABLES[table]
+        self.table = table
+        self.model = apps.get_model('stocks', model_name)
+        self.code_field = code_field
+        self.start = start
+        self.end = end
+        self.codes = list(codes or [])
+        self.chunk_size = chunk_size
+        self.rows = 0
+
+        # id 제외, 외래키는 종목코드(stock_id)를 code 컬럼으로 (업종 마스터 등 그 외 외래키는 제외)
+        self.fields = [
+            f for f in self.model._meta.concrete_fields
+            if not f.primary_key and (not f.is_relation or f.name == code_field)
+        ]
+        self.columns = ['code' if f.is_relation else f.attname for f in self.fields]
+
+    def filename(self, fmt):
+        parts = [self.table]
+        if self.start or self.end:
+            parts.append(f'{self.start or ""}_{self.end or ""}'.replace('-', ''))
+        return '-'.join(parts) + f'.{fmt}'
+
+    def filtered(self):
+        """일자/코드 조건만 적용한 모델 QuerySet (정렬 없음, apply_retention 삭제에도 사용)"""
+        qs = self.model.objects.order_by()
+        if self.start:
+            qs = qs.filter(date__gte=self.start)
+        if self.end:
+            qs = qs.filter(date__lte=self.end)
+        if self.codes:
+            qs = qs.filter(**{f'{self.code_field}__in': self.codes})
+        return qs
+
+    def queryset(self):
+        qs = self.filtered()
+        # (코드, 날짜) 순서: unique 인덱스 순서대로 읽어 정렬용 임시 B-tree 없이 스트리밍
+        order = [self.code_field, 'date'] + (['market'] if self.table == 'sector' else [])
+        return qs.order_by(*order).values_list(*[f.attname for f in self.fields])
+
+    def iter_batches(self):
+        """CHUNK_SIZE행씩 튜플 목록"""
+        batch = []
+        for row in self.queryset().iterator(chunk_size=self.chunk_size):
+            batch.append(row)
+            if len(batch) >= self.chunk_size:
+                self.rows += len(batch)
+                yield batch
+                batch = []
+        if batch:
+            self.rows += len(batch)
+            yield batch
+
+    def chunks(self, fmt):
+        if fmt == 'csv':
+            return self.csv_chunks()
+        if fmt == 'parquet':
+            return self.parquet_chunks()
+        raise ValueError(f'지원하지 않는 형식입니다: {fmt} (가능: {", ".join(FORMATS)})')
+
+    # ============ CSV ============
+
+    def csv_chunks(self):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        # 엑셀에서 한글 깨짐 방지용 BOM
+        yield '\ufeff'.encode('utf-8')
+        writer.writerow(self.columns)
+        for batch in self.iter_batches():
+            writer.writerows(batch)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+        if buffer.tell():
+            yield buffer.getvalue().encode('utf-8')
+
+    # ============ Parquet ============
+
+    def arrow_schema(self):
+        import pyarrow as pa
+        from django.db import models
+
+        types = []
+        for field in self.fields:
+            if field.is_relation or isinstance(field, (models.CharField, models.TextField)):
+                types.append(pa.string())
+            elif isinstance(field, models.DateTimeField):
+                types.append(pa.timestamp('us', tz='UTC'))
+            elif isinstance(field, models.DateField):
+                types.append(pa.date32())
+            elif isinstance(field, models.DecimalField):
+                types.append(pa.decimal128(field.max_digits, field.decimal_places))
+            elif isinstance(field, models.FloatField):
+                types.append(pa.float64())
+            elif isinstance(field, models.BooleanField):
+                types.append(pa.bool_())
+            else:
+                types.append(pa.int64())
+        return pa.schema([pa.field(name, t) for name, t in zip(self.columns, types)])
+
+    def parquet_chunks(self):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        schema = self.arrow_schema()
+        sink = _ChunkSink()
+        writer = pq.ParquetWriter(sink, schema, compression='zstd')
+        try:
+            for batch in self.iter_batches():
+                table = pa.Table.from_arrays(
+                    [pa.array(column, type=schema.field(i).type) for i, column in enumerate(zip(*batch))],
+                    schema=schema,
+                )
+                writer.write_table(table, row_group_size=len(batch))
+                yield sink.take()
+        finally:
+            writer.close()
+        yield sink.take()
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 출력 버퍼 (row group마다 take()로 비움, 탐색 불필요)"""
+
+    def __init__(self):
+        super().__init__()
+        self._buffer = bytearray()
+        self._position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._buffer += data
+        self._position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self._position
+
+    def take(self):
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
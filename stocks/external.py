@@ -0,0 +1,140 @@
+"""
+외부 I/O 클라이언트 (비동기 뷰용: 텔레그램 검색, headless 브라우저 스크래핑)
+
+ASGI 서버에서는 이벤트 루프가 프로세스 수명 동안 유지되므로
+텔레그램 클라이언트와 Chromium 브라우저를 한 번만 띄워 모든 요청이 공유합니다.
+요청은 이벤트 루프에서 대기만 하므로 느린 검색 여러 개가 동시에 진행되고,
+일반 페이지(동기 뷰)는 스레드에서 따로 처리됩니다.
+
+- 텔레그램: 연결 1개를 공유 (세션 파일 잠금 충돌 없음)
+- 브라우저: 요청마다 새 context/page, 동시 페이지 수는 MAX_BROWSER_PAGES로 제한
+- 고정 대기(wait_for_timeout) 대신 결과 셀렉터가 나타날 때까지만 대기
+
+WSGI/runserver처럼 요청마다 이벤트 루프가 새로 만들어지는 환경(enable_shared_clients 미호출)과
+백그라운드 작업 스레드(jobs.py, 자체 이벤트 루프)에서는 공유하지 않고 매번 열고 닫습니다.
+"""
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+from decouple import config
+
+
+TELEGRAM_SESSION = 'telegram_session'
+MAX_BROWSER_PAGES = 4
+SELECTOR_TIMEOUT = 8000  # 결과 셀렉터 최대 대기 (ms), 결과 없음 페이지는 이 시간 후 파싱
+SCROLL_IDLE_TIMEOUT = 3000  # 스크롤 후 추가 로드 대기 (ms)
+
+_shared = False
+_telegram = None
+_browser = None
+_playwright = None
+_page_slots = None
+_lock = None
+
+
+def enable_shared_clients():
+    """요청 간 클라이언트 공유 활성화 (ASGI 진입점에서 호출)"""
+    global _shared
+    _shared = True
+
+
+def _use_shared():
+    """공유 클라이언트 사용 여부 (ASGI 서버의 이벤트 루프 = 메인 스레드에서만)"""
+    return _shared and threading.current_thread() is threading.main_thread()
+
+
+def _get_lock():
+    global _lock
+    if _lock is None:
+        _lock = asyncio.Lock()
+    return _lock
+
+
+# ============ 텔레그램 ============
+
+def _new_telegram_client():
+    from telethon import TelegramClient
+    return TelegramClient(TELEGRAM_SESSION, config('TELEGRAM_API_ID'), config('TELEGRAM_API_HASH'))
+
+
+@asynccontextmanager
+async def telegram_client():
+    """
+    텔레그램 클라이언트
+
+    Usage:
+        async with telegram_client() as client:
+            msgs = await client.get_messages(...)
+    """
+    global _telegram
+
+    if not _use_shared():
+        async with _new_telegram_client() as client:
+            yield client
+        return
+
+    async with _get_lock():
+        if _telegram is None:
+            _telegram = _new_telegram_client()
+        if not _telegram.is_connected():
+            await _telegram.start()
+    yield _telegram
+
+
+# ============ headless 브라우저 ============
+
+@asynccontextmanager
+async def browser_page():
+    """headless Chromium 페이지 (사용 후 닫힘)"""
+    global _playwright, _browser, _page_slots
+    from playwright.async_api import async_playwright
+
+    if not _use_shared():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                yield await browser.new_page()
+            finally:
+                await browser.close()
+        return
+
+    async with _get_lock():
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+        if _page_slots is None:
+            _page_slots = asyncio.Semaphore(MAX_BROWSER_PAGES)
+
+    async with _page_slots:
+        context = await _browser.new_context()
+        try:
+            yield await context.new_page()
+        finally:
+            await context.close()
+
+
+async def render_html(url, selector=None, wait_until='domcontentloaded', timeout=30000, scroll=False):
+    """
+    페이지 렌더링 후 HTML 반환
+
+    Args:
+        selector: 결과 요소 셀렉터 (나타나면 바로 진행, SELECTOR_TIMEOUT 후에는 현재 HTML 사용)
+        scroll: 끝까지 스크롤 후 추가 로드(네트워크 idle)까지 대기
+    """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+    async with browser_page() as page:
+        await page.goto(url, wait_until=wait_until, timeout=timeout)
+        if selector:
+            try:
+                await page.wait_for_selector(selector, timeout=SELECTOR_TIMEOUT)
+            except PlaywrightTimeoutError:
+                pass  # 결과 없음
+        if scroll:
+            await page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
+            try:
+                await page.wait_for_load_state('networkidle', timeout=SCROLL_IDLE_TIMEOUT)
+            except PlaywrightTimeoutError:
+                pass
+        return await page.content()
@@ -0,0 +1,102 @@
+"""
+압축 저장 텍스트 필드 (리포트/요약 HTML 본문용)
+
+에디터(Quill)가 만든 HTML은 태그/스타일 반복이 많아 zlib으로 1/3~1/5 크기로 줄어듭니다.
+파이썬에서는 일반 문자열로 보이고, DB에는 다음과 같이 저장됩니다 (SQLite 동적 타입, BLOB 컬럼).
+
+- 빈 문자열: '' (TEXT) → summary='' / exclude(summary='') 같은 빈 값 조회는 그대로 동작
+- COMPRESS_MIN_LENGTH 바이트 미만: 원문 (TEXT) → 짧은 값은 압축 이득이 없음
+- 그 외: b'z' + zlib 압축 데이터 (BLOB)
+
+압축 전 저장된 TEXT 값도 그대로 읽히므로 기존 행은 마이그레이션 전후 모두 정상 조회됩니다.
+본문 내용 검색(icontains 등)은 압축 값에는 동작하지 않습니다. (통합 검색은 search_index 사용)
+
+CompressedTextQuerySet은 목록 조회에서 압축 본문을 기본 제외(defer)하고,
+본문이 필요한 곳에서만 full()로 함께 조회합니다.
+"""
+import zlib
+
+from django.db import models
+
+
+COMPRESS_MIN_LENGTH = 256  # 이 크기(바이트) 미만은 압축하지 않음
+COMPRESS_LEVEL = 6
+ZLIB_PREFIX = b'z'
+
+
+def compress_text(value):
+    """문자열 → DB 저장 값 (빈 값/짧은 값은 문자열 그대로)"""
+    if not value:
+        return value
+    data = value.encode('utf-8')
+    if len(data) < COMPRESS_MIN_LENGTH:
+        return value
+    return ZLIB_PREFIX + zlib.compress(data, COMPRESS_LEVEL)
+
+
+def decompress_text(value):
+    """DB 저장 값 → 문자열 (압축 전 TEXT 값은 그대로)"""
+    if value is None or isinstance(value, str):
+        return value
+    data = bytes(value)
+    if data[:1] == ZLIB_PREFIX:
+        return zlib.decompress(data[1:]).decode('utf-8')
+    raise ValueError(f'알 수 없는 압축 형식입니다: {data[:1]!r}')
+
+
+class CompressedTextField(models.TextField):
+    """zlib 압축 저장 TextField (BLOB 컬럼, 파이썬 값은 str)"""
+
+    def get_internal_type(self):
+        return 'BinaryField'
+
+    def from_db_value(self, value, expression, connection):
+        return decompress_text(value)
+
+    def to_python(self, value):
+        if isinstance(value, (bytes, memoryview)):
+            return decompress_text(value)
+        return super().to_python(value)
+
+    def get_db_prep_value(self, value, connection, prepared=False):
+        if not prepared:
+            value = self.get_prep_value(value)
+        if isinstance(value, str):
+            value = compress_text(value)
+        if isinstance(value, bytes):
+            return connection.Database.Binary(value)
+        return value
+
+
+def compressed_field_names(model):
+    return [f.attname for f in model._meta.concrete_fields if isinstance(f, CompressedTextField)]
+
+
+class CompressedTextQuerySet(models.QuerySet):
+    """압축 본문 필드를 기본 제외하는 QuerySet (CompressedTextManager에서 사용)"""
+
+    def full(self):
+        """압축 본문까지 함께 조회 (상세/편집/요약 페이지용)"""
+        return self.defer(None)
+
+    def with_exists(self):
+        """본문 없이 존재 여부만 <필드>_exists로 조회 (목록의 '요약 있음' 표시용)"""
+        return self.annotate(**{
+            f'{name}_exists': models.ExpressionWrapper(~models.Q(**{name: ''}), output_field=models.BooleanField())
+            for name in compressed_field_names(self.model)
+        })
+
+
+class CompressedTextManager(models.Manager.from_queryset(CompressedTextQuerySet)):
+    """
+    목록 조회에서 압축 본문 필드를 제외하는 기본 매니저
+
+    - 본문은 인스턴스에서 처음 접근할 때 행마다 추가 쿼리로 로드되므로
+      목록에서 본문을 쓰는 곳은 반드시 .full()로 조회
+    - only()에 본문 필드를 넣어도 기본 defer가 우선하므로 본문이 필요하면 .full().only(...)
+    """
+
+    def get_queryset(self):
+        qs = super().get_queryset()
+        fields = compressed_field_names(self.model)
+        return qs.defer(*fields) if fields else qs
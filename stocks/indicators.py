@@ -0,0 +1,489 @@
+"""
+종목별 롤링 지표 상태 (IndicatorState) 계산
+
+일봉이 하루 추가될 때마다 전체 구간을 다시 합산하지 않고
+누적합/단조 덱/EMA 점화식으로 새 봉 1개당 O(1)로 지표를 갱신합니다.
+
+- 이동평균: 구간별 종가 누적합 (들어오는 값 더하고, 빠지는 값 빼기)
+- 최대 거래량: 구간별 단조 감소 덱 (맨 앞이 구간 최대값)
+- EMA: ema = ema + alpha * (close - ema)
+- 최근 봉 스냅샷: 신호 추적(최근 5거래일)과 MA60 기울기(5일 전) 판단용
+
+차트 오버레이 지표(SMA/EMA/볼린저/RSI/MACD/ATR/OBV/VWAP)는 봉 배열 전체를 numpy 배열 연산으로 계산합니다.
+(구간 합 = 합성곱, EMA/Wilder 평활 = 1차 점화식의 누적합 닫힌 식)
+"""
+from collections import deque
+
+import numpy as np
+
+
+MA_PERIODS = (5, 10, 20, 60, 120)
+VOLUME_PERIODS = (20, 60)
+EMA_PERIODS = (12, 26)
+SPARKLINE_SIZE = 10
+HISTORY_SIZE = 6  # 오늘 + 5거래일 전 (MA60 기울기 판단용)
+
+BAR_FIELDS = (
+    'date', 'opening_price', 'high_price', 'low_price',
+    'closing_price', 'trading_volume', 'trading_value',
+)
+
+
+class RollingState:
+    """
+    롤링 지표 상태 (메모리 표현)
+
+    IndicatorState.state(JSON)와 상호 변환되며, push()로 봉을 하나씩 반영합니다.
+    """
+
+    def __init__(self, data=None):
+        data = data or {}
+        max_period = max(MA_PERIODS)
+        self.bar_count = data.get('bar_count', 0)
+        # 가장 긴 이평 구간 + 1 (빠지는 값 참조용)
+        self.closes = deque(data.get('closes', []), maxlen=max_period + 1)
+        self.sums = {p: data.get('sums', {}).get(str(p), 0) for p in MA_PERIODS}
+        self.volume_deques = {
+            p: deque(tuple(item) for item in data.get('volume_deques', {}).get(str(p), []))
+            for p in VOLUME_PERIODS
+        }
+        self.emas = {p: data.get('emas', {}).get(str(p)) for p in EMA_PERIODS}
+        self.bars = deque(data.get('bars', []), maxlen=HISTORY_SIZE)
+
+    # ============ 갱신 ============
+
+    def push(self, bar):
+        """
+        새 일봉 1개 반영 (날짜 오름차순으로 호출)
+
+        Args:
+            bar: DailyChart 필드명을 키로 가진 dict (BAR_FIELDS)
+        """
+        self.bar_count += 1
+        seq = self.bar_count
+        close = bar['closing_price']
+        volume = bar['trading_volume']
+
+        # 이동평균 누적합
+        self.closes.append(close)
+        for p in MA_PERIODS:
+            self.sums[p] += close
+            if len(self.closes) > p:
+                self.sums[p] -= self.closes[-p - 1]
+
+        # 최대 거래량 (단조 감소 덱)
+        for p in VOLUME_PERIODS:
+            dq = self.volume_deques[p]
+            while dq and dq[-1][1] <= volume:
+                dq.pop()
+            dq.append((seq, volume))
+            while dq[0][0] <= seq - p:
+                dq.popleft()
+
+        # EMA (첫 봉은 종가로 시작)
+        for p in EMA_PERIODS:
+            prev = self.emas[p]
+            alpha = 2 / (p + 1)
+            self.emas[p] = close if prev is None else prev + alpha * (close - prev)
+
+        # 최근 봉 스냅샷
+        date = bar['date']
+        self.bars.append({
+            'date': date if isinstance(date, str) else date.strftime('%Y-%m-%d'),
+            'opening_price': bar['opening_price'],
+            'high_price': bar['high_price'],
+            'low_price': bar['low_price'],
+            'closing_price': close,
+            'trading_volume': volume,
+            'trading_value': bar.get('trading_value') or 0,
+            'ma20': self.ma(20),
+            'ma60': self.ma(60),
+            'max_volume_20': self.max_volume(20),
+            'max_volume_60': self.max_volume(60),
+        })
+
+    # ============ 조회 ============
+
+    def ma(self, period):
+        """최신 봉 기준 이동평균 (봉 수 부족 시 None)"""
+        if self.bar_count < period:
+            return None
+        return self.sums[period] / period
+
+    def max_volume(self, period):
+        """최신 봉 기준 구간 최대 거래량 (봉 수 부족 시 None)"""
+        dq = self.volume_deques[period]
+        if self.bar_count < period or not dq:
+            return None
+        return dq[0][1]
+
+    def ema(self, period):
+        return self.emas[period]
+
+    @property
+    def last_date(self):
+        return self.bars[-1]['date'] if self.bars else None
+
+    def recent_bars(self):
+        """최근 봉 스냅샷 (최신순, 인덱스 0 = 오늘)"""
+        return list(reversed(self.bars))
+
+    def sparkline(self, size=SPARKLINE_SIZE):
+        """최근 종가 (과거 → 현재 순서)"""
+        return list(self.closes)[-size:]
+
+    # ============ 직렬화 ============
+
+    def to_dict(self):
+        return {
+            'bar_count': self.bar_count,
+            'closes': list(self.closes),
+            'sums': {str(p): v for p, v in self.sums.items()},
+            'volume_deques': {str(p): [list(item) for item in dq] for p, dq in self.volume_deques.items()},
+            'emas': {str(p): v for p, v in self.emas.items()},
+            'bars': list(self.bars),
+        }
+
+    def to_fields(self):
+        """IndicatorState 모델 필드 값"""
+        from datetime import date as date_cls
+
+        last_date = self.last_date
+        return {
+            'last_date': date_cls.fromisoformat(last_date) if last_date else None,
+            'bar_count': self.bar_count,
+            'ma5': self.ma(5),
+            'ma10': self.ma(10),
+            'ma20': self.ma(20),
+            'ma60': self.ma(60),
+            'ma120': self.ma(120),
+            'max_volume_20': self.max_volume(20),
+            'max_volume_60': self.max_volume(60),
+            'ema12': self.ema(12),
+            'ema26': self.ema(26),
+            'state': self.to_dict(),
+        }
+
+
+def _save_state(stock, rolling):
+    from .models import IndicatorState
+
+    IndicatorState.objects.update_or_create(stock=stock, defaults=rolling.to_fields())
+    return rolling
+
+
+def rebuild_indicator_state(stock):
+    """
+    DailyChart 전체 구간으로 상태 재구축 (O(n))
+
+    과거 봉 수정/삽입 등 증분 갱신이 불가능한 경우에 사용합니다.
+    """
+    from .models import DailyChart
+
+    rolling = RollingState()
+    bars = DailyChart.objects.filter(stock=stock).order_by('date').values(*BAR_FIELDS)
+    for bar in bars.iterator():
+        rolling.push(bar)
+    return _save_state(stock, rolling)
+
+
+def update_indicator_state(stock, bars):
+    """
+    새로 저장한 일봉을 상태에 반영
+
+    - 최신 반영일 이후의 봉만 들어오면 봉당 O(1) 증분 갱신
+    - 최신 봉을 같은 값으로 다시 저장한 경우 변경 없음
+    - 그 외(상태 없음, 과거 봉 수정, 최신 봉 값 변경)는 전체 재구축
+
+    Args:
+        stock: Info 인스턴스
+        bars: DailyChart 필드명을 키로 가진 dict 리스트
+    """
+    from .models import IndicatorState
+
+    if not bars:
+        return None
+
+    try:
+        row = IndicatorState.objects.get(stock=stock)
+        rolling = RollingState(row.state)
+    except IndicatorState.DoesNotExist:
+        return rebuild_indicator_state(stock)
+
+    last_date = rolling.last_date
+    if not last_date:
+        return rebuild_indicator_state(stock)
+
+    bars = sorted(bars, key=lambda b: b['date'])
+    new_bars = []
+    for bar in bars:
+        bar_date = bar['date'].strftime('%Y-%m-%d')
+        if bar_date > last_date:
+            new_bars.append(bar)
+        elif bar_date == last_date and _same_bar(rolling.bars[-1], bar):
+            continue
+        else:
+            return rebuild_indicator_state(stock)
+
+    if not new_bars:
+        return rolling
+
+    for bar in new_bars:
+        rolling.push(bar)
+    return _save_state(stock, rolling)
+
+
+def _same_bar(snapshot, bar):
+    return all(snapshot.get(f) == bar.get(f) for f in BAR_FIELDS[1:])
+
+
+def get_indicator_states(stocks):
+    """
+    여러 종목의 롤링 상태를 한 번에 조회
+
+    Returns:
+        dict: {종목코드: RollingState}
+    """
+    from .models import IndicatorState
+
+    rows = IndicatorState.objects.filter(stock__in=stocks).values_list('stock_id', 'state')
+    return {code: RollingState(state) for code, state in rows}
+
+
+# ============ 차트 오버레이 지표 ============
+# 봉 배열(과거 → 현재) 전체를 numpy 배열 연산으로 한 번에 계산, 구간 부족 구간은 None
+# 내부 계산은 NaN으로 빈 구간을 표시한 float 배열 (_로 시작하는 함수), 공개 함수는 리스트로 변환해 반환
+
+FILTER_CHUNK_EXP = 300  # 점화식 닫힌 식 계산 시 구간당 감쇠 지수 한도 (decay ** -k가 float 범위를 넘지 않도록)
+
+
+def _as_array(values):
+    return np.asarray(values, dtype=np.float64)
+
+
+def _to_list(array):
+    """NaN → None 리스트 (JSON 응답용)"""
+    return np.where(np.isnan(array), None, array).tolist()
+
+
+def _rolling_sum(array, period):
+    """구간 합 (결과 i = array[i - period + 1 : i + 1] 합, 앞 period - 1개는 NaN)"""
+    result = np.full(len(array), np.nan)
+    if len(array) >= period:
+        result[period - 1:] = np.convolve(array, np.ones(period), 'valid')
+    return result
+
+
+def _linear_filter(values, seed, decay, weight):
+    """
+    1차 점화식 y[i] = decay * y[i - 1] + weight * values[i] (y[-1] = seed)
+
+    y[k] = decay^(k+1) * (seed + Σ weight * values[j] / decay^(j+1)) 닫힌 식을 누적합으로 계산하고,
+    decay^-k가 넘치지 않도록 FILTER_CHUNK_EXP 기준 구간으로 나눠 이어 붙입니다.
+    """
+    result = np.empty(len(values))
+    if decay == 0:
+        result[:] = weight * values
+        return result
+    chunk = max(1, int(FILTER_CHUNK_EXP / -np.log(decay)))
+    prev = seed
+    for start in range(0, len(values), chunk):
+        part = values[start:start + chunk]
+        powers = decay ** np.arange(1, len(part) + 1)
+        result[start:start + len(part)] = powers * (prev + np.cumsum(weight * part / powers))
+        prev = result[start + len(part) - 1]
+    return result
+
+
+def _sma(values, period):
+    return _rolling_sum(values, period) / period
+
+
+def _ema(values, period):
+    """지수이동평균 (첫 period개 단순평균으로 시작)"""
+    result = np.full(len(values), np.nan)
+    if len(values) < period:
+        return result
+    alpha = 2 / (period + 1)
+    seed = values[:period].mean()
+    result[period - 1] = seed
+    result[period:] = _linear_filter(values[period:], seed, 1 - alpha, alpha)
+    return result
+
+
+def _wilder(values, period, start=0):
+    """Wilder 평활 (RSI/ATR), values[start:]부터 유효"""
+    result = np.full(len(values), np.nan)
+    if len(values) - start < period:
+        return result
+    seed = values[start:start + period].mean()
+    result[start + period - 1] = seed
+    result[start + period:] = _linear_filter(values[start + period:], seed, (period - 1) / period, 1 / period)
+    return result
+
+
+def _macd(closes, fast, slow, signal):
+    line = _ema(closes, fast) - _ema(closes, slow)
+
+    # 시그널: MACD 유효 구간에 대한 EMA
+    valid = np.flatnonzero(~np.isnan(line))
+    signal_line = np.full(len(line), np.nan)
+    if len(valid):
+        signal_line[valid[0]:] = _ema(line[valid[0]:], signal)
+    return line, signal_line, line - signal_line
+
+
+def sma(values, period):
+    return _to_list(_sma(_as_array(values), period))
+
+
+def ema(values, period):
+    """지수이동평균 (첫 period개 단순평균으로 시작)"""
+    return _to_list(_ema(_as_array(values), period))
+
+
+def bollinger(closes, period=20, k=2):
+    """볼린저 밴드 (중심선 = SMA, 폭 = k * 모표준편차)"""
+    closes = _as_array(closes)
+    middle = _sma(closes, period)
+    variance = np.maximum(_rolling_sum(closes * closes, period) / period - middle * middle, 0)
+    width = k * np.sqrt(variance)
+    return {'upper': _to_list(middle + width), 'middle': _to_list(middle), 'lower': _to_list(middle - width)}
+
+
+def rsi(closes, period=14):
+    closes = _as_array(closes)
+    changes = np.diff(closes, prepend=closes[:1])
+    avg_gain = _wilder(np.maximum(changes, 0), period, start=1)
+    avg_loss = _wilder(np.maximum(-changes, 0), period, start=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = 100 - 100 / (1 + avg_gain / avg_loss)
+    flat = avg_loss == 0  # 하락 없음: 상승만 있으면 100, 변동 없으면 50
+    result[flat] = np.where(avg_gain[flat] > 0, 100.0, 50.0)
+    return _to_list(result)
+
+
+def macd(closes, fast=12, slow=26, signal=9):
+    line, signal_line, hist = _macd(_as_array(closes), fast, slow, signal)
+    return {'macd': _to_list(line), 'signal': _to_list(signal_line), 'hist': _to_list(hist)}
+
+
+def atr(highs, lows, closes, period=14):
+    highs, lows, closes = _as_array(highs), _as_array(lows), _as_array(closes)
+    true_ranges = highs - lows
+    if len(closes) > 1:
+        prev_close = closes[:-1]
+        true_ranges[1:] = np.maximum.reduce([
+            true_ranges[1:], np.abs(highs[1:] - prev_close), np.abs(lows[1:] - prev_close),
+        ])
+    return _to_list(_wilder(true_ranges, period))
+
+
+def obv(closes, volumes):
+    if not len(closes):
+        return []
+    signs = np.sign(np.diff(_as_array(closes))).astype(np.int64)
+    flows = signs * np.asarray(volumes[1:], dtype=np.int64)
+    return np.concatenate(([0], np.cumsum(flows))).tolist()
+
+
+def vwap(highs, lows, closes, volumes, period=20):
+    """구간 VWAP (대표가 = (고가 + 저가 + 종가) / 3, 거래량 가중)"""
+    volumes = _as_array(volumes)
+    typical = (_as_array(highs) + _as_array(lows) + _as_array(closes)) / 3
+    volume_sum = _rolling_sum(volumes, period)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = _rolling_sum(typical * volumes, period) / volume_sum
+    result[~(volume_sum > 0)] = np.nan
+    return _to_list(result)
+
+
+# 지표명 → (계산 함수, 기본 파라미터)
+# 계산 함수는 컬럼 dict(open/high/low/close/volume)와 파라미터를 받음
+OVERLAYS = {
+    'sma': (lambda c, period: sma(c['close'], period), (20,)),
+    'ema': (lambda c, period: ema(c['close'], period), (20,)),
+    'bb': (lambda c, period, k: bollinger(c['close'], period, k), (20, 2)),
+    'rsi': (lambda c, period: rsi(c['close'], period), (14,)),
+    'macd': (lambda c, fast, slow, signal: macd(c['close'], fast, slow, signal), (12, 26, 9)),
+    'atr': (lambda c, period: atr(c['high'], c['low'], c['close'], period), (14,)),
+    'obv': (lambda c: obv(c['close'], c['volume']), ()),
+    'vwap': (lambda c, period: vwap(c['high'], c['low'], c['close'], c['volume'], period), (20,)),
+}
+MAX_OVERLAY_PERIOD = 250
+# 실수를 허용하는 파라미터 위치 (나머지는 기간이므로 정수만 허용: 리스트 인덱스/슬라이스에 사용)
+FLOAT_OVERLAY_PARAMS = {'bb': (1,)}  # 볼린저 밴드 표준편차 배수 k
+
+
+def parse_overlay_specs(value):
+    """
+    지표 요청 파싱 ("sma:20,bb:20:2,macd" → [('sma', (20,)), ...])
+
+    Raises:
+        ValueError: 알 수 없는 지표 또는 잘못된 파라미터
+    """
+    specs = []
+    for token in filter(None, (t.strip() for t in value.split(','))):
+        name, *raw_params = token.split(':')
+        if name not in OVERLAYS:
+            raise ValueError(f'알 수 없는 지표: {name}')
+        defaults = OVERLAYS[name][1]
+        if len(raw_params) > len(defaults):
+            raise ValueError(f'{name} 파라미터는 최대 {len(defaults)}개입니다.')
+
+        params = []
+        for index, (raw, default) in enumerate(zip(raw_params + [None] * len(defaults), defaults)):
+            if raw is None:
+                params.append(default)
+                continue
+            allow_float = index in FLOAT_OVERLAY_PARAMS.get(name, ())
+            try:
+                param = float(raw) if allow_float and '.' in raw else int(raw)
+            except ValueError:
+                kind = '숫자' if allow_float else '정수'
+                raise ValueError(f'{name} 파라미터는 {kind}여야 합니다: {raw}')
+            if not 0 < param <= MAX_OVERLAY_PERIOD:
+                raise ValueError(f'{name} 파라미터는 1 ~ {MAX_OVERLAY_PERIOD} 범위입니다.')
+            params.append(param)
+        specs.append((name, tuple(params)))
+    return specs
+
+
+def overlay_key(name, params):
+    return ':'.join([name, *(str(p) for p in params)])
+
+
+def overlay_warmup(specs):
+    """지표가 첫 표시 봉부터 유효하도록 앞에 더 읽을 봉 수 (EMA 계열은 수렴 여유 포함)"""
+    warmup = 0
+    for name, params in specs:
+        periods = [int(p) for p in params]
+        if name in ('ema', 'macd', 'rsi', 'atr'):
+            warmup = max(warmup, 3 * sum(periods[-2:] if name == 'macd' else periods))
+        elif periods:
+            warmup = max(warmup, periods[0])
+    return warmup
+
+
+def compute_overlays(columns, specs, size):
+    """
+    컬럼형 봉 데이터로 지표 계산, 마지막 size개만 반환
+
+    Returns:
+        dict: {지표키: 배열 또는 {시리즈명: 배열}}
+    """
+    result = {}
+    for name, params in specs:
+        func = OVERLAYS[name][0]
+        values = func(columns, *params)
+        if isinstance(values, dict):
+            result[overlay_key(name, params)] = {k: _round_tail(v, size) for k, v in values.items()}
+        else:
+            result[overlay_key(name, params)] = _round_tail(values, size)
+    return result
+
+
+def _round_tail(values, size):
+    tail = values[-size:] if size else []
+    return [round(v, 2) if v is not None else None for v in tail]
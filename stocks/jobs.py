@@ -0,0 +1,174 @@
+"""
+느린 외부 조회 API의 백그라운드 작업 모드
+
+요청 파라미터에 job=1을 붙이면 작업을 큐에 넣고 작업 ID를 바로 반환합니다 (202).
+클라이언트는 /api/jobs/<작업 ID>/를 폴링해 진행 상태와 결과를 받습니다.
+
+- 작업 실행: 고정 크기 스레드 풀 (JOB_WORKERS), 외부 사이트가 느려도 웹 워커를 점유하지 않음
+- 결과 캐시: (API, 파라미터)별로 TTL 동안 보관, 같은 검색은 작업 없이 바로 반환 (일반 요청 포함)
+- 중복 요청: 같은 (API, 파라미터) 작업이 진행 중이면 그 작업 ID를 반환
+  (JOB_STALE_AFTER초 넘게 queued/running인 작업은 워커 재시작 등으로 멈춘 것으로 보고 새로 등록)
+- 저장소: 'jobs' 캐시 (파일, 프로세스 간 공유, 페이지 context용 'shared'와 분리)
+"""
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.core.cache import caches
+from django.db import connections
+from django.http import JsonResponse
+from django.urls import reverse
+
+
+JOB_WORKERS = 2
+JOB_STATE_TTL = 3600  # 작업 상태 보관 (초)
+JOB_STALE_AFTER = 300  # 이 시간(초) 넘게 queued/running이면 멈춘 작업
+SEARCH_RESULT_TTL = 600  # 검색 결과 캐시 (초)
+
+IGNORED_PARAMS = ('job', 'csrfmiddlewaretoken')
+
+_executor = ThreadPoolExecutor(max_workers=JOB_WORKERS, thread_name_prefix='stocks-job')
+
+
+def _store():
+    return caches['jobs']
+
+
+def _request_key(name, request, args, kwargs):
+    """(API, 경로 인자, 요청 파라미터) 키"""
+    params = [(k, v) for k, v in sorted(request.GET.lists()) if k not in IGNORED_PARAMS]
+    if request.method == 'POST':
+        params += [(k, v) for k, v in sorted(request.POST.lists()) if k not in IGNORED_PARAMS]
+    raw = json.dumps([name, request.method, list(args), sorted(kwargs.items()), params], ensure_ascii=False)
+    return f'{name}:{hashlib.md5(raw.encode()).hexdigest()}'
+
+
+def _is_job_request(request):
+    return request.GET.get('job') == '1' or request.POST.get('job') == '1'
+
+
+def _update_job(job_id, **fields):
+    key = f'job:{job_id}'
+    job = _store().get(key) or {'job_id': job_id}
+    job.update(fields)
+    _store().set(key, job, JOB_STATE_TTL)
+
+
+def _is_stale(job):
+    """queued/running 상태로 JOB_STALE_AFTER초가 지난 작업 (실행 중 워커가 재시작되면 상태가 갱신되지 않음)"""
+    if job['status'] not in ('queued', 'running'):
+        return False
+    since = job.get('started_at') or job['created_at']
+    return time.time() - since > JOB_STALE_AFTER
+
+
+def get_job(job_id):
+    """
+    작업 상태 (멈춘 작업은 error로 반환)
+
+    Returns:
+        dict: {'job_id', 'endpoint', 'status': queued/running/done/error, 'elapsed': 초,
+               'status_code', 'result': 완료 시 API 응답} 또는 None
+    """
+    job = _store().get(f'job:{job_id}')
+    if job is None:
+        return None
+    if _is_stale(job):
+        job.update(status='error', status_code=504, result={'error': '작업이 응답하지 않습니다. 다시 요청해주세요.'})
+    end = job.get('finished_at') or time.time()
+    job['elapsed'] = round(end - job['created_at'], 1)
+    return job
+
+
+def _run_job(job_id, view, request, args, kwargs, key, ttl):
+    """작업 스레드: 뷰 실행 → 결과 저장 (비동기 뷰는 이 스레드의 이벤트 루프에서)"""
+    _update_job(job_id, status='running', started_at=time.time())
+    try:
+        if iscoroutinefunction(view):
+            response = asyncio.run(view(request, *args, **kwargs))
+        else:
+            response = view(request, *args, **kwargs)
+        payload = json.loads(response.content)
+        if ttl and response.status_code == 200:
+            _store().set(f'job_result:{key}', payload, ttl)
+        _update_job(
+            job_id,
+            status='done' if response.status_code == 200 else 'error',
+            status_code=response.status_code,
+            result=payload,
+            finished_at=time.time(),
+        )
+    except Exception as e:
+        _update_job(job_id, status='error', status_code=500, result={'error': str(e)}, finished_at=time.time())
+    finally:
+        # 멈춘 작업으로 판단돼 새 작업이 등록됐으면 그 작업의 키는 남겨둠
+        if _store().get(f'job_active:{key}') == job_id:
+            _store().delete(f'job_active:{key}')
+        connections.close_all()  # 스레드 DB 연결 정리
+
+
+def _submit(view, request, args, kwargs, key, ttl):
+    """작업 등록 (같은 키의 작업이 진행 중이면 그 작업 ID, 멈춘 작업이면 새로 등록)"""
+    job_id = _store().get(f'job_active:{key}')
+    job = get_job(job_id) if job_id else None
+    if job is None or job['status'] not in ('queued', 'running'):
+        job_id = uuid.uuid4().hex
+        _update_job(job_id, endpoint=view.__name__, status='queued', created_at=time.time())
+        _store().set(f'job_active:{key}', job_id, JOB_STATE_TTL)
+        _executor.submit(_run_job, job_id, view, request, args, kwargs, key, ttl)
+
+    return JsonResponse({
+        'success': True,
+        'job_id': job_id,
+        'status': 'queued',
+        'status_url': reverse('stocks:job_status', args=[job_id]),
+    }, status=202)
+
+
+def background_job(ttl=None):
+    """
+    느린 조회 API에 작업 모드(job=1)와 결과 캐시 적용
+
+    Args:
+        ttl: 결과 캐시 시간 (초), None이면 캐시 안 함 (데이터를 저장하는 API 등)
+    """
+    def decorator(view):
+        def before(request, args, kwargs):
+            """캐시된 결과 또는 작업 등록 응답 (해당 없으면 None)"""
+            key = _request_key(view.__name__, request, args, kwargs)
+            cached = _store().get(f'job_result:{key}') if ttl else None
+            if cached is not None:
+                if _is_job_request(request):
+                    return JsonResponse({'success': True, 'status': 'done', 'cached': True, 'result': cached}), key
+                return JsonResponse(cached), key
+            if _is_job_request(request):
+                return _submit(view, request, args, kwargs, key, ttl), key
+            return None, key
+
+        def after(response, key):
+            if ttl and response.status_code == 200:
+                _store().set(f'job_result:{key}', json.loads(response.content), ttl)
+            return response
+
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                response, key = await sync_to_async(before)(request, args, kwargs)
+                if response is None:
+                    response = await view(request, *args, **kwargs)
+                    await sync_to_async(after)(response, key)
+                return response
+        else:
+            @wraps(view)
+            def wrapper(request, *args, **kwargs):
+                response, key = before(request, args, kwargs)
+                if response is None:
+                    response = after(view(request, *args, **kwargs), key)
+                return response
+        return wrapper
+    return decorator
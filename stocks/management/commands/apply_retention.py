@@ -0,0 +1,164 @@
+import time
+from datetime import date
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+from stocks.cache import bump_data_version
+from stocks.cube import mark_cube_changed
+from stocks.export import FORMATS, parquet_available
+from stocks.logger import StockLogger
+from stocks.retention import (
+    CUBE_TABLES, DELETE_CHUNK_SIZE, DELETE_PAUSE, DELISTED_GRACE_DAYS, RETENTION_TABLES,
+    delete_chunked, expired_exports, free_page_ratio, write_archive,
+)
+
+
+class Command(BaseCommand):
+    help = '''
+시계열 테이블 보관 기간 정리 (보관 파일 저장 후 삭제)
+
+settings.RETENTION_DAYS의 테이블별 보관 기간 이전 행과 (--delisted) 유예 기간이 지난 상장폐지 종목/ETF의 행을
+보관 디렉토리에 Parquet 파일로 저장한 뒤 청크 단위로 삭제합니다.
+삭제 후 통계를 갱신하고, 빈 페이지 비율이 --vacuum-threshold 이상이면 VACUUM을 실행합니다.
+
+옵션:
+  --table            (선택) daily_chart / investor_trend / short_selling / sector / market_trend /
+                            daily_chart_etf / weekly_chart_etf / monthly_chart_etf (여러 개 가능, 기본값: 전체)
+  --days             (선택) 보관 일수 (지정한 테이블 모두에 적용, 기본값: settings.RETENTION_DAYS)
+  --delisted         (선택) 상장폐지 종목/ETF의 행도 정리
+                            (종목: save_stock_list가 기록한 상폐일 기준, 시가총액 미달 비활성 종목은 제외 /
+                             ETF: 비활성이면서 유예 기간 동안 일봉 없음)
+  --grace-days       (선택) 상장폐지 후 유예 일수 (기본값: settings.RETENTION_DELISTED_GRACE_DAYS)
+  --format           (선택) parquet / csv (기본값: parquet, pyarrow 필요)
+  --archive-dir      (선택) 보관 디렉토리 (기본값: settings.RETENTION_ARCHIVE_DIR)
+  --no-archive       (선택) 보관 파일 없이 삭제
+  --chunk-size       (선택) 트랜잭션당 삭제 행 수 (기본값: 5000)
+  --pause            (선택) 청크 사이 대기 초 (기본값: 0.05)
+  --vacuum-threshold (선택) VACUUM 실행 기준 빈 페이지 비율 (기본값: 0.25, 0이면 항상, 1이면 안 함)
+  --dry-run          (선택) 삭제 대상 행 수만 출력
+  --log-level        (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py apply_retention --dry-run
+  python manage.py apply_retention --delisted
+  python manage.py apply_retention --table sector --days 180
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--table',
+            type=str,
+            nargs='+',
+            choices=list(RETENTION_TABLES.keys()),
+            help='정리할 테이블 (기본값: 전체)'
+        )
+        parser.add_argument('--days', type=int, help='보관 일수 (기본값: settings.RETENTION_DAYS)')
+        parser.add_argument('--delisted', action='store_true', help='상장폐지 종목/ETF의 행도 정리')
+        parser.add_argument(
+            '--grace-days',
+            type=int,
+            help='상장폐지 후 유예 일수 (기본값: settings.RETENTION_DELISTED_GRACE_DAYS)'
+        )
+        parser.add_argument(
+            '--format',
+            type=str,
+            default='parquet',
+            choices=list(FORMATS),
+            help='보관 파일 형식 (기본값: parquet)'
+        )
+        parser.add_argument('--archive-dir', type=str, help='보관 디렉토리 (기본값: settings.RETENTION_ARCHIVE_DIR)')
+        parser.add_argument('--no-archive', action='store_true', help='보관 파일 없이 삭제')
+        parser.add_argument('--chunk-size', type=int, default=DELETE_CHUNK_SIZE, help='트랜잭션당 삭제 행 수 (기본값: 5000)')
+        parser.add_argument('--pause', type=float, default=DELETE_PAUSE, help='청크 사이 대기 초 (기본값: 0.05)')
+        parser.add_argument(
+            '--vacuum-threshold',
+            type=float,
+            default=0.25,
+            help='VACUUM 실행 기준 빈 페이지 비율 (기본값: 0.25)'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='삭제 대상 행 수만 출력')
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'apply_retention')
+        fmt = options['format']
+        archive = not options['no_archive'] and not options['dry_run']
+        archive_dir = options.get('archive_dir') or settings.RETENTION_ARCHIVE_DIR
+
+        if archive and fmt == 'parquet' and not parquet_available():
+            self.log.error('pyarrow가 설치되어 있지 않습니다. (pip install pyarrow 또는 --format csv)')
+            return
+
+        if options.get('grace_days') is None:
+            options['grace_days'] = getattr(settings, 'RETENTION_DELISTED_GRACE_DAYS', DELISTED_GRACE_DAYS)
+
+        tables = options.get('table') or list(RETENTION_TABLES)
+        mode = '확인만' if options['dry_run'] else (f'보관: {archive_dir} ({fmt})' if archive else '보관 안 함')
+        self.log.info(f'보관 기간 정리 시작 ({len(tables)}개 테이블, {mode})')
+        self.log.separator()
+
+        total_deleted = 0
+        for table in tables:
+            days = options['days'] if options.get('days') is not None else settings.RETENTION_DAYS.get(table, 0)
+            deleted = self.apply_table(table, days, options, archive, fmt, archive_dir)
+            if deleted:
+                total_deleted += deleted
+                if table in CUBE_TABLES:
+                    mark_cube_changed(*CUBE_TABLES[table], date.min)
+                bump_data_version(RETENTION_TABLES[table][0])
+
+        self.log.separator()
+        if options['dry_run']:
+            self.log.info('확인 완료 (삭제 안 함)', success=True)
+            return
+
+        if total_deleted:
+            self.maintain(options['vacuum_threshold'])
+        self.log.info(f'완료: 총 {total_deleted:,}행 삭제', success=True)
+
+    def apply_table(self, table, days, options, archive, fmt, archive_dir):
+        """테이블 1개 정리 → 삭제 행 수"""
+        exports = expired_exports(table, days=days, delisted=options['delisted'], grace_days=options['grace_days'])
+        if not exports:
+            self.log.debug(f'{table}: 정리 조건 없음 (보관 일수 {days})')
+            return 0
+
+        deleted = 0
+        for label, export in exports:
+            count = export.filtered().count()
+            if not count:
+                self.log.debug(f'{table} ({label}): 대상 없음')
+                continue
+            if options['dry_run']:
+                self.log.info(f'{table} ({label}): {count:,}행 삭제 예정')
+                continue
+
+            begin = time.perf_counter()
+            if archive:
+                try:
+                    path = write_archive(export, fmt, archive_dir)
+                except Exception as e:
+                    # 보관에 실패하면 삭제하지 않음
+                    self.log.error(f'{table} ({label}): 보관 실패, 삭제 건너뜀 - {e}')
+                    continue
+                self.log.debug(f'{table} ({label}): {export.rows:,}행 보관 → {path}')
+
+            count = delete_chunked(export.filtered(), chunk_size=options['chunk_size'], pause=options['pause'])
+            deleted += count
+            self.log.info(f'{table} ({label}): {count:,}행 삭제 ({time.perf_counter() - begin:.1f}초)')
+        return deleted
+
+    def maintain(self, vacuum_threshold):
+        """삭제 후 통계 갱신 + 빈 페이지가 많으면 VACUUM"""
+        if connection.vendor != 'sqlite':
+            return
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA analysis_limit=1000')
+            cursor.execute('PRAGMA optimize')
+            ratio = free_page_ratio(cursor)
+            if ratio >= vacuum_threshold:
+                begin = time.perf_counter()
+                cursor.execute('VACUUM')
+                self.log.info(f'VACUUM 완료 (빈 페이지 {ratio:.0%}, {time.perf_counter() - begin:.1f}초)')
+            else:
+                self.log.info(f'VACUUM 생략 (빈 페이지 {ratio:.0%} < {vacuum_threshold:.0%}, 새 행 저장에 재사용)')
@@ -0,0 +1,182 @@
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from stocks.logger import StockLogger
+
+
+# 대시보드 읽기와 비슷한 쿼리: 관심 종목들의 최근 일봉
+READ_SQL = '''
+    SELECT stock_id, date, closing_price, trading_volume
+    FROM bench_chart
+    WHERE stock_id IN ({}) AND date >= ?
+    ORDER BY stock_id, date DESC
+'''
+
+
+class Command(BaseCommand):
+    help = '''
+SQLite 동시성 벤치마크 (수집 쓰기 1개 + 대시보드 읽기 N개)
+
+임시 DB 파일에 일봉 형태 테이블을 만들고, 수집 명령어처럼 큰 트랜잭션으로 계속 쓰는 동안
+읽기 스레드들이 대시보드 쿼리를 반복 실행하며 지연 시간을 측정합니다.
+기존 설정(rollback journal)과 settings.SQLITE_PRAGMAS(WAL 등)를 차례로 비교합니다.
+운영 DB는 사용하지 않습니다.
+
+옵션:
+  --readers   (선택) 읽기 스레드 수 (기본값: 4)
+  --duration  (선택) 모드별 측정 시간 (초, 기본값: 5)
+  --batch     (선택) 쓰기 트랜잭션당 행 수 (기본값: 5000)
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py bench_sqlite_concurrency
+  python manage.py bench_sqlite_concurrency --readers 8 --duration 10
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument('--readers', type=int, default=4, help='읽기 스레드 수 (기본값: 4)')
+        parser.add_argument('--duration', type=float, default=5, help='모드별 측정 시간 (초, 기본값: 5)')
+        parser.add_argument('--batch', type=int, default=5000, help='쓰기 트랜잭션당 행 수 (기본값: 5000)')
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'bench_sqlite_concurrency')
+        timeout = settings.DATABASES['default'].get('OPTIONS', {}).get('timeout', 5)
+
+        profiles = {
+            'rollback journal (기존)': {'journal_mode': 'DELETE'},
+            'WAL (settings.SQLITE_PRAGMAS)': settings.SQLITE_PRAGMAS,
+        }
+
+        self.log.info(
+            f'읽기 {options["readers"]}개, 쓰기 배치 {options["batch"]}행, '
+            f'모드별 {options["duration"]}초, 잠금 대기 {timeout}초'
+        )
+        self.log.separator()
+
+        for label, pragmas in profiles.items():
+            with tempfile.TemporaryDirectory() as tmp:
+                path = Path(tmp) / 'bench.sqlite3'
+                self._prepare(path, pragmas)
+                result = self._run(path, pragmas, timeout, options)
+            self._report(label, result)
+
+        self.log.separator()
+        self.log.info('완료', success=True)
+
+    # ============ 준비 ============
+
+    def _connect(self, path, pragmas, timeout):
+        conn = sqlite3.connect(path, timeout=timeout, isolation_level=None, check_same_thread=False)
+        for name, value in pragmas.items():
+            conn.execute(f'PRAGMA {name}={value}')
+        return conn
+
+    def _prepare(self, path, pragmas):
+        """종목 200개 x 250일 초기 데이터"""
+        conn = self._connect(path, pragmas, 5)
+        conn.execute('''
+            CREATE TABLE bench_chart (
+                id INTEGER PRIMARY KEY,
+                stock_id TEXT NOT NULL,
+                date TEXT NOT NULL,
+                closing_price INTEGER,
+                trading_volume INTEGER,
+                UNIQUE (stock_id, date)
+            )
+        ''')
+        start = date(2024, 1, 1)
+        rows = [
+            (f'{code:06d}', (start + timedelta(days=day)).isoformat(), 10000 + day, 1000 * day)
+            for code in range(200)
+            for day in range(250)
+        ]
+        conn.execute('BEGIN')
+        conn.executemany(
+            'INSERT INTO bench_chart (stock_id, date, closing_price, trading_volume) VALUES (?, ?, ?, ?)', rows
+        )
+        conn.execute('COMMIT')
+        conn.close()
+
+    # ============ 측정 ============
+
+    def _run(self, path, pragmas, timeout, options):
+        stop = threading.Event()
+        latencies = []
+        errors = []
+        writes = [0]
+        lock = threading.Lock()
+
+        def writer():
+            conn = self._connect(path, pragmas, timeout)
+            day = 1000
+            while not stop.is_set():
+                rows = [
+                    (f'{code:06d}', (date(2024, 1, 1) + timedelta(days=day + i // 200)).isoformat(), code, code)
+                    for i, code in enumerate(range(options['batch']))
+                ]
+                try:
+                    conn.execute('BEGIN IMMEDIATE')
+                    conn.executemany(
+                        'INSERT OR REPLACE INTO bench_chart (stock_id, date, closing_price, trading_volume) '
+                        'VALUES (?, ?, ?, ?)', rows
+                    )
+                    conn.execute('COMMIT')
+                    writes[0] += len(rows)
+                except sqlite3.OperationalError as e:
+                    if conn.in_transaction:
+                        conn.execute('ROLLBACK')
+                    with lock:
+                        errors.append(f'write: {e}')
+                day += options['batch'] // 200 + 1
+            conn.close()
+
+        def reader(index):
+            conn = self._connect(path, pragmas, timeout)
+            codes = [f'{(index * 20 + i) % 200:06d}' for i in range(20)]
+            sql = READ_SQL.format(','.join('?' * len(codes)))
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    conn.execute(sql, codes + ['2024-06-01']).fetchall()
+                    elapsed = time.perf_counter() - start
+                    with lock:
+                        latencies.append(elapsed * 1000)
+                except sqlite3.OperationalError as e:
+                    with lock:
+                        errors.append(f'read: {e}')
+            conn.close()
+
+        threads = [threading.Thread(target=writer)]
+        threads += [threading.Thread(target=reader, args=(i,)) for i in range(options['readers'])]
+        for thread in threads:
+            thread.start()
+        time.sleep(options['duration'])
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+        return {'latencies': latencies, 'errors': errors, 'writes': writes[0], 'duration': options['duration']}
+
+    def _report(self, label, result):
+        latencies = sorted(result['latencies'])
+        self.log.info(f'[{label}]')
+        if latencies:
+            def pick(pct):
+                return latencies[min(len(latencies) - 1, int(len(latencies) * pct / 100))]
+            self.log.info(
+                f'  읽기 {len(latencies)}회 ({len(latencies) / result["duration"]:.0f}/s) | '
+                f'p50 {pick(50):.1f}ms, p95 {pick(95):.1f}ms, p99 {pick(99):.1f}ms, 최대 {latencies[-1]:.1f}ms'
+            )
+        else:
+            self.log.info('  읽기 0회')
+        self.log.info(f'  쓰기 {result["writes"]:,}행 ({result["writes"] / result["duration"]:,.0f}/s)')
+        if result['errors']:
+            self.log.warning(f'  잠금 오류 {len(result["errors"])}건 (예: {result["errors"][0]})')
+        else:
+            self.log.info('  잠금 오류 없음')
@@ -0,0 +1,99 @@
+from django.core.management.base import BaseCommand
+from stocks.models import Info, IndicatorState
+from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.indicators import rebuild_indicator_state
+
+
+class Command(BaseCommand):
+    help = '''
+롤링 지표 상태 재구축 (DailyChart 기반)
+
+일봉 저장 시 자동으로 증분 갱신되므로, 최초 1회 또는 상태가 어긋났을 때만 실행합니다.
+
+옵션:
+  --code      (필수*) 종목코드 또는 "all" / "fav"
+              - all: 전체 종목
+              - fav: 관심 종목만 (interest_level 설정된 종목)
+  --clear     (선택) 지표 상태 전체 삭제
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py build_indicator_state --code 005930
+  python manage.py build_indicator_state --code all --log-level info
+  python manage.py build_indicator_state --clear
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            type=str,
+            help='종목코드 또는 "all" / "fav"'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='지표 상태 전체 삭제'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        # --clear 옵션 처리
+        if options.get('clear'):
+            deleted_count, _ = IndicatorState.objects.all().delete()
+            self.stdout.write(self.style.SUCCESS(f'IndicatorState 데이터 {deleted_count}건 삭제 완료'))
+            bump_data_version('charts')
+            return
+
+        # 필수 옵션 체크
+        if not options.get('code'):
+            self.print_help('manage.py', 'build_indicator_state')
+            return
+
+        self.log = StockLogger(self.stdout, self.style, options, 'build_indicator_state')
+
+        code = options['code']
+        if code.lower() == 'all':
+            stocks = Info.objects.filter(is_active=True)
+        elif code.lower() == 'fav':
+            stocks = Info.objects.filter(is_active=True, interest_level__isnull=False)
+        else:
+            stocks = Info.objects.filter(code=code)
+
+        stocks = list(stocks.only('code', 'name').order_by('code'))
+        total = len(stocks)
+        self.log.info(f'지표 상태 재구축 시작 (대상: {total}개 종목)')
+        self.log.separator()
+
+        success_count = 0
+        no_data_list = []
+        error_list = []
+
+        for idx, stock in enumerate(stocks, 1):
+            try:
+                rolling = rebuild_indicator_state(stock)
+                if rolling.bar_count:
+                    self.log.debug(f'[{idx}/{total}] {stock.code} {stock.name}: {rolling.bar_count}봉 (최종 {rolling.last_date})')
+                    success_count += 1
+                else:
+                    self.log.debug(f'[{idx}/{total}] {stock.code} {stock.name}: 데이터 없음')
+                    no_data_list.append((stock.code, stock.name))
+            except Exception as e:
+                self.log.error(f'[{idx}/{total}] {stock.code} {stock.name}: 실패 - {str(e)}')
+                error_list.append((stock.code, stock.name, str(e)))
+
+        # 최종 리포트
+        self.log.separator()
+        if error_list:
+            self.log.info(f'완료 | 성공: {success_count}개, 데이터없음: {len(no_data_list)}개, 오류: {len(error_list)}개', success=True)
+            self.log.info('')
+            self.log.info('[오류 목록]')
+            for code, name, err in error_list:
+                self.log.error(f'  {code} {name}: {err}')
+        elif no_data_list:
+            self.log.info(f'완료 | 성공: {success_count}개, 데이터없음: {len(no_data_list)}개', success=True)
+        else:
+            self.log.info(f'완료 | 성공: {success_count}개', success=True)
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('charts')
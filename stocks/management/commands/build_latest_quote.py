@@ -0,0 +1,60 @@
+import time
+from django.core.management.base import BaseCommand
+from stocks.models import LatestQuote
+from stocks.logger import StockLogger
+from stocks.quotes import refresh_latest_quotes
+
+
+class Command(BaseCommand):
+    help = '''
+최신 시세 스냅샷 재구축 (DailyChart + Info 기반)
+
+일봉/종목정보 수집 후 자동으로 갱신되므로, 최초 1회 또는 스냅샷이 어긋났을 때만 실행합니다.
+
+옵션:
+  --code      (선택) 종목코드 (쉼표 구분, 기본값: 전체 활성 종목)
+  --clear     (선택) 스냅샷 전체 삭제 후 재구축
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py build_latest_quote
+  python manage.py build_latest_quote --code 005930,000660
+  python manage.py build_latest_quote --clear
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--code',
+            type=str,
+            help='종목코드 (쉼표 구분, 기본값: 전체)'
+        )
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='스냅샷 전체 삭제 후 재구축'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'build_latest_quote')
+
+        codes = None
+        if options.get('code'):
+            codes = [c.strip() for c in options['code'].split(',') if c.strip()]
+
+        if options.get('clear'):
+            deleted_count, _ = LatestQuote.objects.all().delete()
+            self.log.info(f'LatestQuote 데이터 {deleted_count}건 삭제')
+
+        self.log.info(f'최신 시세 스냅샷 재구축 시작 (대상: {"전체" if codes is None else f"{len(codes)}개 종목"})')
+        begin = time.perf_counter()
+        count = refresh_latest_quotes(codes)
+        no_bar = LatestQuote.objects.filter(date__isnull=True)
+        if codes is not None:
+            no_bar = no_bar.filter(stock__in=codes)
+        no_bar_count = no_bar.count()
+
+        self.log.separator()
+        if no_bar_count:
+            self.log.info(f'일봉 없음 (Info 시세 사용): {no_bar_count}개')
+        self.log.info(f'완료 | {count}개 종목 ({time.perf_counter() - begin:.1f}초)', success=True)
@@ -0,0 +1,82 @@
+import time
+from django.core.management.base import BaseCommand
+from stocks.logger import StockLogger
+from stocks.charts import ASSETS, TIMEFRAMES
+
+
+class Command(BaseCommand):
+    help = '''
+OHLCV 큐브 생성/갱신 (차트 수집 완료 후 실행)
+
+일/주/월봉 테이블(종목, ETF)을 필드별 int64 배열 파일로 저장합니다.
+분석 코드는 numpy.memmap으로 열어 ORM 없이 종목/기간을 슬라이싱합니다.
+
+옵션:
+  --asset     (선택) stock / etf (기본값: 전체)
+  --timeframe (선택) daily / weekly / monthly (기본값: 전체)
+  --mode      (선택) append: 마지막 저장일 이후만 추가 (기본값)
+                     all: 전체 재구축
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py build_ohlcv_cube
+  python manage.py build_ohlcv_cube --asset stock --timeframe daily --mode all
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--asset',
+            type=str,
+            choices=list(ASSETS.keys()),
+            help='자산 종류 (기본값: 전체)'
+        )
+        parser.add_argument(
+            '--timeframe',
+            type=str,
+            choices=list(TIMEFRAMES),
+            help='봉 주기 (기본값: 전체)'
+        )
+        parser.add_argument(
+            '--mode',
+            type=str,
+            default='append',
+            choices=['append', 'all'],
+            help='append: 증분 추가, all: 전체 재구축 (기본값: append)'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'build_ohlcv_cube')
+
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.log.error('numpy가 설치되어 있지 않습니다. (pip install numpy)')
+            return
+
+        from stocks.cube import append_cube, build_cube, cube_targets
+
+        targets = cube_targets(options.get('asset'), options.get('timeframe'))
+        self.log.info(f'OHLCV 큐브 {options["mode"]} 시작 ({len(targets)}개)')
+        self.log.separator()
+
+        for asset, timeframe in targets:
+            start = time.perf_counter()
+            try:
+                if options['mode'] == 'all':
+                    meta, rebuilt = build_cube(asset, timeframe), True
+                else:
+                    meta, rebuilt = append_cube(asset, timeframe)
+            except Exception as e:
+                self.log.error(f'{asset}_{timeframe}: {e}')
+                continue
+
+            elapsed = time.perf_counter() - start
+            action = '재구축' if rebuilt else '추가'
+            self.log.info(
+                f'{asset}_{timeframe}: {action} | 거래일 {len(meta["dates"])}개, '
+                f'종목 {len(meta["codes"])}/{meta["capacity"]}개 ({elapsed:.1f}초)'
+            )
+
+        self.log.separator()
+        self.log.info('완료', success=True)
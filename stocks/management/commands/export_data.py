@@ -0,0 +1,93 @@
+import time
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from stocks.logger import StockLogger
+from stocks.export import EXPORT_TABLES, FORMATS, TableExport, parse_codes, parse_date, parquet_available
+
+
+class Command(BaseCommand):
+    help = '''
+데이터 내보내기 (오프라인 분석용 CSV / Parquet)
+
+DB 커서에서 청크 단위로 읽어 바로 파일에 쓰므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+
+옵션:
+  --table     (필수) daily_chart / investor_trend / short_selling / sector / market_trend /
+                     daily_chart_etf / weekly_chart_etf / monthly_chart_etf (여러 개 가능)
+  --format    (선택) csv / parquet (기본값: csv, parquet은 pyarrow 필요)
+  --start     (선택) 시작일 YYYY-MM-DD 또는 YYYYMMDD
+  --end       (선택) 종료일 YYYY-MM-DD 또는 YYYYMMDD
+  --codes     (선택) 종목코드/ETF코드/업종코드/시장 (쉼표 구분, 기본값: 전체)
+  --output    (선택) 저장 디렉토리 (기본값: export)
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py export_data --table daily_chart --start 2024-01-01
+  python manage.py export_data --table investor_trend short_selling --codes 005930,000660 --format parquet
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--table',
+            type=str,
+            nargs='+',
+            required=True,
+            choices=list(EXPORT_TABLES.keys()),
+            help='내보낼 테이블 (여러 개 가능)'
+        )
+        parser.add_argument(
+            '--format',
+            type=str,
+            default='csv',
+            choices=list(FORMATS),
+            help='파일 형식 (기본값: csv)'
+        )
+        parser.add_argument('--start', type=str, help='시작일 (YYYY-MM-DD 또는 YYYYMMDD)')
+        parser.add_argument('--end', type=str, help='종료일 (YYYY-MM-DD 또는 YYYYMMDD)')
+        parser.add_argument('--codes', type=str, help='종목코드/업종코드/시장 (쉼표 구분)')
+        parser.add_argument('--output', type=str, default='export', help='저장 디렉토리 (기본값: export)')
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'export_data')
+        fmt = options['format']
+
+        if fmt == 'parquet' and not parquet_available():
+            self.log.error('pyarrow가 설치되어 있지 않습니다. (pip install pyarrow)')
+            return
+
+        try:
+            start = parse_date(options.get('start'))
+            end = parse_date(options.get('end'))
+        except ValueError:
+            self.log.error('날짜 형식이 올바르지 않습니다. (YYYY-MM-DD 또는 YYYYMMDD)')
+            return
+        codes = parse_codes(options.get('codes'))
+
+        output = Path(options['output'])
+        output.mkdir(parents=True, exist_ok=True)
+
+        self.log.info(f'데이터 내보내기 시작 ({fmt}, {len(options["table"])}개 테이블) → {output}')
+        self.log.separator()
+
+        for table in options['table']:
+            export = TableExport(table, start=start, end=end, codes=codes)
+            path = output / export.filename(fmt)
+            tmp_path = path.with_name(path.name + '.tmp')
+            begin = time.perf_counter()
+            try:
+                with open(tmp_path, 'wb') as f:
+                    for chunk in export.chunks(fmt):
+                        f.write(chunk)
+                tmp_path.replace(path)
+            except Exception as e:
+                tmp_path.unlink(missing_ok=True)
+                self.log.error(f'{table}: {e}')
+                continue
+
+            elapsed = time.perf_counter() - begin
+            size = path.stat().st_size / 1024 / 1024
+            self.log.info(f'{table}: {export.rows:,}행, {size:.1f}MB ({elapsed:.1f}초) → {path.name}')
+
+        self.log.separator()
+        self.log.info('완료', success=True)
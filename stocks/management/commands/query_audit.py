@@ -0,0 +1,95 @@
+import sys
+from django.core.management.base import BaseCommand
+from django.db import connection
+from stocks.logger import StockLogger
+from stocks.query_audit import (
+    audit_queries, covering_index, explain, find_issues, propose_index, scanned_tables,
+)
+
+
+class Command(BaseCommand):
+    help = '''
+쿼리 실행 계획 점검 (EXPLAIN QUERY PLAN)
+
+화면/수집 명령어의 주요 ORM 쿼리(stocks/query_audit.py)의 실행 계획을 조회해
+전체 스캔과 임시 B-tree(정렬/중복 제거)를 찾고, 필요한 인덱스를 제안합니다.
+데이터와 통계가 있는 DB(운영 DB 또는 복사본)에서 실행해야 실제와 같은 계획이 나옵니다.
+
+옵션:
+  --name      (선택) 쿼리 이름 접두어 (여러 개 가능, 예: sector edit.report)
+  --strict    (선택) 문제가 있으면 종료 코드 1 (배포 전 점검/CI용)
+  --log-level (선택) debug / info / warning / error (기본값: info, debug면 전체 실행 계획 출력)
+
+예시:
+  python manage.py query_audit
+  python manage.py query_audit --name sector --log-level debug
+  python manage.py query_audit --strict
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument('--name', type=str, nargs='+', help='쿼리 이름 접두어 (기본값: 전체)')
+        parser.add_argument('--strict', action='store_true', help='문제가 있으면 종료 코드 1')
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'query_audit')
+
+        if connection.vendor != 'sqlite':
+            self.log.error(f'SQLite DB가 아닙니다: {connection.vendor}')
+            return
+
+        queries = audit_queries()
+        if options.get('name'):
+            queries = [q for q in queries if q.name.startswith(tuple(options['name']))]
+        if not queries:
+            self.log.error('점검할 쿼리가 없습니다. (--name 확인)')
+            return
+
+        with connection.cursor() as cursor:
+            has_stats = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sqlite_stat1'"
+            ).fetchone()
+        self.log.info(f'쿼리 실행 계획 점검 시작 ({len(queries)}개 쿼리)')
+        if not has_stats:
+            self.log.warning('통계(sqlite_stat1)가 없습니다. 실행 계획이 운영과 다를 수 있습니다. (sqlite_maintenance 실행 후 점검)')
+        self.log.separator()
+
+        failed = 0
+        for query in queries:
+            plan = explain(query.queryset)
+            issues = find_issues(plan, query.allow)
+            if not issues:
+                self.log.debug(f'[OK] {query.name} ({query.source})')
+                for line in plan:
+                    self.log.debug(f'    {line}')
+                continue
+
+            failed += 1
+            self.log.warning(f'[문제] {query.name} ({query.source}): {", ".join(issues)}')
+            for line in plan:
+                self.log.info(f'    {line}')
+            self.log.info(f'    → {self.suggestion(query.queryset, plan)}')
+
+        self.log.separator()
+        if failed:
+            self.log.warning(f'완료: {len(queries)}개 중 {failed}개 쿼리에 문제 있음')
+            if options['strict']:
+                sys.exit(1)
+        else:
+            self.log.info(f'완료: {len(queries)}개 쿼리 모두 인덱스 사용', success=True)
+
+    def suggestion(self, queryset, plan):
+        """인덱스 제안 문구"""
+        model = queryset.model
+        if any(line.strip().startswith('SCAN (subquery') for line in plan):
+            return '서브쿼리(윈도 함수 등) 결과 정렬: 인덱스로 해결 불가, 대상 행이 적으면 allow에 추가'
+        joined = [t for t in scanned_tables(plan) if t != model._meta.db_table]
+        if joined:
+            return f'조인 테이블 전체 스캔({", ".join(joined)}): 조인 조건 컬럼 인덱스 확인, 작은 테이블이면 allow에 추가'
+        fields = propose_index(queryset)
+        if not fields:
+            return "인덱스로 해결 불가 (LIKE '%...%' 등): 조건 추가 또는 검색 색인(search_index) 사용"
+        existing = covering_index(model, fields)
+        if existing:
+            return f'기존 인덱스 {existing}로 가능: 통계 갱신(sqlite_maintenance) 후 다시 점검'
+        return f'{model.__name__}.Meta.indexes에 추가: models.Index(fields={fields})'
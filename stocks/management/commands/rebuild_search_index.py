@@ -0,0 +1,47 @@
+import time
+from django.core.management.base import BaseCommand
+from stocks.logger import StockLogger
+from stocks.search import SOURCES, rebuild
+
+
+class Command(BaseCommand):
+    help = '''
+통합 검색 색인(search_index, FTS5) 재구축
+
+저장/삭제 시그널로 색인이 자동 갱신되지만, 시그널이 없는 bulk_create/update()나
+DB 직접 수정으로 어긋난 색인을 원본 테이블 기준으로 다시 만듭니다.
+
+옵션:
+  --kind      (선택) stock / telegram / sector_telegram / news / sector_news /
+                     report / nodaji / youtube / sector_youtube (여러 개 가능, 기본값: 전체)
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py rebuild_search_index
+  python manage.py rebuild_search_index --kind report nodaji
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--kind',
+            type=str,
+            nargs='+',
+            choices=list(SOURCES.keys()),
+            help='재색인 대상 (기본값: 전체)'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'rebuild_search_index')
+        kinds = options.get('kind') or list(SOURCES)
+
+        self.log.info(f'검색 색인 재구축 시작 ({len(kinds)}개 대상)')
+        self.log.separator()
+
+        start = time.perf_counter()
+        counts = rebuild(kinds=kinds)
+        for kind, count in counts.items():
+            self.log.info(f'{SOURCES[kind][2]} ({kind}): {count:,}건')
+
+        self.log.separator()
+        self.log.info(f'완료: 총 {sum(counts.values()):,}건 ({time.perf_counter() - start:.1f}초)', success=True)
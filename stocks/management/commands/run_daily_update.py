@@ -37,6 +37,7 @@ class Command(BaseCommand):
             ('save_fnguide_report', {'code': 'fav'}, '리포트'),
             ('save_nodaji_stock', {'code': 'fav'}, '노다지'),
             ('save_etf_chart', {'mode': 'last'}, 'ETF 차트'),
+            ('warm_page_cache', {}, '페이지 캐시 워밍업'),
         ]
 
         total = len(tasks)
@@ -1,9 +1,13 @@
 import requests
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.core.management.base import BaseCommand
 from stocks.utils import get_valid_token
-from stocks.models import Info, DailyChart
+from stocks.models import Info, DailyChart, IndicatorState
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.cube import mark_cube_changed
+from stocks.indicators import update_indicator_state
+from stocks.quotes import refresh_latest_quotes
 
 
 class Command(BaseCommand):
@@ -47,7 +51,10 @@ class Command(BaseCommand):
         # --clear 옵션 처리
         if options.get('clear'):
             deleted_count, _ = DailyChart.objects.all().delete()
+            IndicatorState.objects.all().delete()
             self.stdout.write(self.style.SUCCESS(f'DailyChart 데이터 {deleted_count}건 삭제 완료'))
+            mark_cube_changed('stock', 'daily', date.min)
+            bump_data_version('charts')
             return
 
         # 필수 옵션 체크
@@ -57,6 +64,7 @@ class Command(BaseCommand):
 
         # 로거 초기화
         self.log = StockLogger(self.stdout, self.style, options, 'save_daily_chart')
+        self.changed_from = None  # 저장한 가장 이른 봉 날짜 (OHLCV 큐브 증분 갱신 범위)
 
         # 1. 토큰 가져오기
         token = get_valid_token()
@@ -76,6 +84,16 @@ class Command(BaseCommand):
         else:
             self.process_single_stock(token, code, mode)
 
+        # 종목 목록용 최신 시세 스냅샷 갱신
+        refresh_latest_quotes(None if process_all else [code])
+
+        # OHLCV 큐브가 다시 채울 범위 (수정주가 재수집 등 과거 봉 변경 포함)
+        if self.changed_from:
+            mark_cube_changed('stock', 'daily', self.changed_from)
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('charts')
+
     def process_single_stock(self, token, stock_code, mode):
         """단일 종목 처리"""
         try:
@@ -338,26 +356,29 @@ class Command(BaseCommand):
 
         created_count = 0
         updated_count = 0
+        saved_bars = []  # 지표 상태 갱신용
 
         for item in data_list:
             try:
                 # 날짜 파싱
                 date = self.parse_date(item['dt'])
+                defaults = {
+                    'opening_price': self.parse_number(item.get('open_pric')),
+                    'high_price': self.parse_number(item.get('high_pric')),
+                    'low_price': self.parse_number(item.get('low_pric')),
+                    'closing_price': self.parse_number(item.get('cur_prc')),
+                    'price_change': self.parse_number(item.get('pred_pre')),
+                    'trading_volume': self.parse_number(item.get('trde_qty')),
+                    'trading_value': self.parse_number(item.get('trde_prica')),
+                }
 
                 # 데이터 저장 (있으면 업데이트, 없으면 생성)
                 daily_chart, created = DailyChart.objects.update_or_create(
                     stock=stock,
                     date=date,
-                    defaults={
-                        'opening_price': self.parse_number(item.get('open_pric')),
-                        'high_price': self.parse_number(item.get('high_pric')),
-                        'low_price': self.parse_number(item.get('low_pric')),
-                        'closing_price': self.parse_number(item.get('cur_prc')),
-                        'price_change': self.parse_number(item.get('pred_pre')),
-                        'trading_volume': self.parse_number(item.get('trde_qty')),
-                        'trading_value': self.parse_number(item.get('trde_prica')),
-                    }
+                    defaults=defaults
                 )
+                saved_bars.append({'date': date, **defaults})
 
                 if created:
                     created_count += 1
@@ -368,6 +389,16 @@ class Command(BaseCommand):
                 if not silent:
                     self.log.error(f'저장 실패 ({item.get("dt")}): {str(e)}')
 
+        if saved_bars:
+            first = min(bar['date'] for bar in saved_bars)
+            self.changed_from = min(self.changed_from or first, first)
+
+        # 롤링 지표 상태 갱신 (새 봉은 O(1), 과거 봉 변경 시 재구축)
+        try:
+            update_indicator_state(stock, saved_bars)
+        except Exception as e:
+            self.log.error(f'지표 상태 갱신 실패 ({stock_code}): {str(e)}')
+
         if silent:
             return f'신규 {created_count}, 업데이트 {updated_count}'
         else:
@@ -1,9 +1,15 @@
 import requests
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.core.management.base import BaseCommand
 from stocks.models import InfoETF, DailyChartETF, WeeklyChartETF, MonthlyChartETF
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.cube import mark_cube_changed
+
+
+# 네이버 차트 주기 → OHLCV 큐브 주기
+CUBE_TIMEFRAMES = {'day': 'daily', 'week': 'weekly', 'month': 'monthly'}
 
 
 class Command(BaseCommand):
@@ -59,10 +65,14 @@ ETF 차트 조회 및 저장 (네이버 금융 API)
             self.stdout.write(self.style.SUCCESS(
                 f'ETF 차트 데이터 삭제 완료 (일봉: {d1}, 주봉: {d2}, 월봉: {d3})'
             ))
+            for timeframe in ('daily', 'weekly', 'monthly'):
+                mark_cube_changed('etf', timeframe, date.min)
+            bump_data_version('etf')
             return
 
         # 로거 초기화
         self.log = StockLogger(self.stdout, self.style, options, 'save_etf_chart')
+        self.changed_from = {}  # 주기별 저장한 가장 이른 봉 날짜 (OHLCV 큐브 증분 갱신 범위)
 
         # 파라미터 설정
         code = options['code']
@@ -75,6 +85,13 @@ ETF 차트 조회 및 저장 (네이버 금융 API)
         else:
             self.process_single_etf(code, mode)
 
+        # OHLCV 큐브가 다시 채울 범위 (최근 30일/12주/12개월 재저장 포함)
+        for timeframe, since in self.changed_from.items():
+            mark_cube_changed('etf', timeframe, since)
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('etf')
+
     def process_single_etf(self, etf_code, mode):
         """단일 ETF 처리"""
         try:
@@ -252,6 +269,8 @@ ETF 차트 조회 및 저장 (네이버 금융 API)
                     }
                 )
 
+                cube_timeframe = CUBE_TIMEFRAMES[timeframe]
+                self.changed_from[cube_timeframe] = min(self.changed_from.get(cube_timeframe, date), date)
                 if created:
                     created_count += 1
                 else:
@@ -4,6 +4,7 @@ from bs4 import BeautifulSoup
 from django.core.management.base import BaseCommand
 from stocks.models import InfoETF
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
 
 
 class Command(BaseCommand):
@@ -42,6 +43,9 @@ ETF 정보 업데이트 (네이버 금융 크롤링)
         else:
             self.process_single_etf(code)
 
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('etf')
+
     def process_single_etf(self, etf_code):
         """단일 ETF 처리"""
         try:
@@ -4,6 +4,8 @@ from datetime import datetime
 from django.core.management.base import BaseCommand
 from stocks.models import Info, Report
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.dashboard import rebuild_report_cards
 
 
 class Command(BaseCommand):
@@ -57,6 +59,8 @@ class Command(BaseCommand):
                 # 전체 삭제
                 deleted_count, _ = Report.objects.all().delete()
                 self.stdout.write(self.style.SUCCESS(f'Report 데이터 {deleted_count}건 삭제 완료'))
+            rebuild_report_cards()
+            bump_data_version('reports')
             return
 
         # 필수 옵션 체크
@@ -80,6 +84,13 @@ class Command(BaseCommand):
         else:
             self.process_single_stock(options['code'])
 
+        # 대시보드 리포트 카드 집계 재구축
+        card_count = rebuild_report_cards()
+        self.log.info(f'대시보드 리포트 카드 집계 | {card_count}개 종목')
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('reports')
+
     def process_single_stock(self, stock_code):
         """단일 종목 처리"""
         try:
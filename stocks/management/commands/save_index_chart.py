@@ -5,6 +5,7 @@ from decimal import Decimal
 from django.core.management.base import BaseCommand
 from stocks.models import IndexChart
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
 
 
 class Command(BaseCommand):
@@ -52,6 +53,7 @@ class Command(BaseCommand):
         if options.get('clear'):
             deleted_count, _ = IndexChart.objects.all().delete()
             self.stdout.write(self.style.SUCCESS(f'IndexChart 데이터 {deleted_count}건 삭제 완료'))
+            bump_data_version('market')
             return
 
         self.log = StockLogger(self.stdout, self.style, options, 'save_index_chart')
@@ -81,6 +83,9 @@ class Command(BaseCommand):
         self.log.separator()
         self.log.info(f'완료 | 신규: {total_created}개, 업데이트: {total_updated}개', success=True)
 
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('market')
+
     def process_index(self, code, mode):
         """지수 데이터 처리, (created, updated) 반환"""
         self.log.separator()
@@ -5,6 +5,7 @@ from bs4 import BeautifulSoup
 from django.core.management.base import BaseCommand
 from stocks.models import MarketTrend
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
 
 
 class Command(BaseCommand):
@@ -56,6 +57,7 @@ class Command(BaseCommand):
         if options.get('clear'):
             deleted_count, _ = MarketTrend.objects.all().delete()
             self.stdout.write(self.style.SUCCESS(f'MarketTrend 데이터 {deleted_count}건 삭제 완료'))
+            bump_data_version('market')
             return
 
         self.log = StockLogger(self.stdout, self.style, options, 'save_market_trend')
@@ -86,6 +88,9 @@ class Command(BaseCommand):
         self.log.separator()
         self.log.info(f'완료 | 신규: {total_created}개, 업데이트: {total_updated}개', success=True)
 
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('market')
+
     def process_market(self, market_name, max_page):
         """Collect data for each market, return (created, updated)"""
         self.log.separator()
@@ -3,8 +3,9 @@ import time
 import requests
 from django.core.management.base import BaseCommand
 from stocks.utils import get_valid_token
-from stocks.models import Sector, DailyChart
+from stocks.models import Sector, SectorMaster, DailyChart
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
 
 
 class Command(BaseCommand):
@@ -41,6 +42,7 @@ class Command(BaseCommand):
         if options.get('clear'):
             deleted_count = Sector.objects.all().delete()[0]
             self.stdout.write(self.style.SUCCESS(f'Sector 데이터 {deleted_count}건 삭제 완료'))
+            bump_data_version('sector')
             return
 
         self.log = StockLogger(self.stdout, self.style, options, 'save_sector')
@@ -92,6 +94,9 @@ class Command(BaseCommand):
         self.log.separator()
         self.log.info(f'완료 | 총 {total_saved}개 저장', success=True)
 
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('sector')
+
     def fetch_and_save_market(self, token, mrkt_tp, market_name, trade_date, date_str):
         """Fetch and save sector data for a market"""
         params = {
@@ -116,6 +121,9 @@ class Command(BaseCommand):
     def save_to_db(self, sector_list, market, trade_date):
         """Save sector data to DB"""
         saved_count = 0
+        masters = SectorMaster.objects.sync(market, {
+            item.get('inds_cd'): item.get('inds_nm', '') for item in sector_list if item.get('inds_cd')
+        })
 
         for item in sector_list:
             try:
@@ -124,6 +132,7 @@ class Command(BaseCommand):
                     date=trade_date,
                     market=market,
                     defaults={
+                        'master': masters[item.get('inds_cd')],
                         'name': item.get('inds_nm', ''),
                         'individual_net_buying': self.parse_number(item.get('ind_netprps')),
                         'foreign_net_buying': self.parse_number(item.get('frgnr_netprps')),
@@ -6,6 +6,8 @@ from django.core.management.base import BaseCommand
 from stocks.models import Info
 from stocks.utils import get_valid_token
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.quotes import refresh_latest_quotes
 
 
 # 기본 최소 시가총액 (1000억)
@@ -68,6 +70,12 @@ class Command(BaseCommand):
             # 단일 종목 처리
             self.process_single_stock(token, code)
 
+        # 종목 목록용 최신 시세 스냅샷 갱신 (시가총액/PER/PBR/ROE)
+        refresh_latest_quotes(None if process_all else [code])
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('stock_info')
+
     def process_single_stock(self, token, stock_code):
         """단일 종목 처리"""
         try:
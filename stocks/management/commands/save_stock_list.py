@@ -1,9 +1,12 @@
+from datetime import date
 import requests
 import json
 from django.core.management.base import BaseCommand
 from stocks.models import Info
 from stocks.utils import get_valid_token
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.quotes import refresh_latest_quotes
 
 
 # 시장구분 코드
@@ -51,7 +54,7 @@ class Command(BaseCommand):
                 tables = [
                     'financial', 'daily_chart', 'weekly_chart', 'monthly_chart',
                     'investor_trend', 'short_selling', 'gongsi', 'nodaji', 'report',
-                    'schedule', 'info_sectors', 'info'
+                    'schedule', 'indicator_state', 'latest_quote', 'dashboard_card', 'info_sectors', 'info'
                 ]
                 for table in tables:
                     try:
@@ -60,6 +63,7 @@ class Command(BaseCommand):
                     except Exception as e:
                         self.stdout.write(f'  {table} 스킵 ({e})')
             self.stdout.write(self.style.SUCCESS('Info 및 연결된 모든 테이블 삭제 완료'))
+            bump_data_version('stock_info')
             return
 
         token = get_valid_token()
@@ -98,6 +102,12 @@ class Command(BaseCommand):
 
                     self.sync_stocks(market, stock_list)
 
+        # 종목 목록용 최신 시세 스냅샷 갱신 (신규/상장폐지/종목명 변경 반영)
+        refresh_latest_quotes()
+
+        # 페이지 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('stock_info')
+
     def sync_stocks(self, market, stock_list):
         """종목 목록 동기화 (INSERT/UPDATE/상폐 체크)"""
         # API에서 가져온 종목 코드 집합
@@ -127,6 +137,7 @@ class Command(BaseCommand):
                     existing.name = item.get('name', '')
                     existing.market = market
                     existing.is_active = True
+                    existing.delisted_at = None
                     existing.save()
                     self.log.debug(f'  [업데이트] {code} {item.get("name")} ({old_market}, active={old_active} → {market}, active=True)')
                     updated_count += 1
@@ -149,8 +160,9 @@ class Command(BaseCommand):
             for code in delisted_codes:
                 stock = Info.objects.get(code=code)
                 self.log.error(f'  [상폐] {code} {stock.name}')
-                # is_active = False 처리
+                # is_active = False 처리 + 상폐일 기록 (apply_retention --delisted 기준)
                 stock.is_active = False
+                stock.delisted_at = date.today()
                 stock.save()
             self.log.error('!' * 70)
 
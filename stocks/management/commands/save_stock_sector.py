@@ -3,7 +3,7 @@ import json
 import time
 from django.core.management.base import BaseCommand
 from stocks.utils import get_valid_token
-from stocks.models import Info, Sector
+from stocks.models import Info, SectorMaster
 from stocks.logger import StockLogger
 
 
@@ -34,9 +34,8 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         # --clear 옵션 처리
         if options.get('clear'):
-            # 모든 Info의 sectors M2M 관계 삭제
-            for info in Info.objects.all():
-                info.sectors.clear()
+            # 모든 종목-업종 매핑(Info.sectors) 삭제
+            Info.sectors.through.objects.all().delete()
             self.stdout.write(self.style.SUCCESS('모든 종목-업종 매핑 삭제 완료'))
             return
 
@@ -50,22 +49,16 @@ class Command(BaseCommand):
             self.log.error('토큰이 없습니다. python manage.py get_token을 먼저 실행하세요.')
             return
 
-        # 2. Sector 테이블 확인
-        sector_count = Sector.objects.count()
-        if sector_count == 0:
-            self.log.error('Sector 테이블이 비어있습니다!')
+        # 2. 업종 마스터 가져오기 (save_sector 실행 시 생성)
+        sectors_list = list(SectorMaster.objects.order_by('code', 'market'))
+        if not sectors_list:
+            self.log.error('업종 마스터(SectorMaster)가 비어있습니다!')
             self.log.debug('먼저 python manage.py save_sector --mode all 실행')
             return
 
-        self.log.debug(f'Sector 데이터 확인 완료 ({sector_count:,}개 레코드)')
-
-        # 3. 고유한 (업종코드, 시장) 조합 가져오기
-        sectors = Sector.objects.values('code', 'market').distinct().order_by('code', 'market')
-        sectors_list = list(sectors)
-
         self.log.info(f'종목-업종 매핑 시작 (대상: {len(sectors_list)}개 업종)')
 
-        # 4. 각 업종에 대해 API 호출 및 매핑
+        # 3. 각 업종에 대해 API 호출 및 매핑
         self.process_all_sectors(token, sectors_list)
 
     def process_all_sectors(self, token, sectors_list):
@@ -76,9 +69,9 @@ class Command(BaseCommand):
         total_added = 0
         total_unchanged = 0
 
-        for idx, sector_info in enumerate(sectors_list, start=1):
-            sector_code = sector_info['code']
-            market = sector_info['market']
+        for idx, sector in enumerate(sectors_list, start=1):
+            sector_code = sector.code
+            market = sector.market
 
             self.log.debug(f'[{idx}/{total_count}] 업종 {sector_code} ({market}) 처리 중...')
 
@@ -109,17 +102,6 @@ class Command(BaseCommand):
             stock_list = response_data[data_key]
             self.log.debug(f'  → {len(stock_list)}개 종목 발견')
 
-            # Sector 객체 가져오기 (최신 날짜)
-            sector = Sector.objects.filter(
-                code=sector_code,
-                market=market
-            ).order_by('-date').first()
-
-            if not sector:
-                self.log.debug(f'  → Sector 객체 없음')
-                fail_count += 1
-                continue
-
             # 종목-업종 매핑
             added_count, unchanged_count = self.map_stocks_to_sector(stock_list, sector)
             total_added += added_count
@@ -142,33 +124,23 @@ class Command(BaseCommand):
             self.log.info(f'완료 | 변경없음: {total_unchanged}개', success=True)
 
     def map_stocks_to_sector(self, stock_list, sector):
-        """종목 리스트와 업종을 매핑"""
-        added_count = 0
-        unchanged_count = 0
+        """종목 리스트와 업종을 매핑 (업종당 조회 2번 + 추가 1번)"""
+        stock_codes = {stock_data.get('stk_cd') for stock_data in stock_list if stock_data.get('stk_cd')}
+        existing = set(sector.stocks.values_list('code', flat=True))
 
-        for stock_data in stock_list:
-            stock_code = stock_data.get('stk_cd')
+        new_stocks = []
+        for info in Info.objects.filter(code__in=stock_codes).only('code', 'name').order_by('code'):
+            if info.code not in existing:
+                new_stocks.append(info)
+                self.log.info(f'  + {info.name}({info.code}) → {sector.name}')
 
-            if not stock_code:
-                continue
-
-            try:
-                info = Info.objects.get(code=stock_code)
-
-                # 이미 매핑되어 있는지 확인
-                if sector in info.sectors.all():
-                    unchanged_count += 1
-                else:
-                    info.sectors.add(sector)
-                    added_count += 1
-                    self.log.info(f'  + {info.name}({stock_code}) → {sector.name}')
-
-            except Info.DoesNotExist:
-                pass
-            except Exception as e:
-                self.log.error(f'매핑 실패 ({stock_code}): {str(e)}')
+        try:
+            sector.stocks.add(*new_stocks)
+        except Exception as e:
+            self.log.error(f'매핑 실패 ({sector.name}): {str(e)}')
+            return 0, 0
 
-        return added_count, unchanged_count
+        return len(new_stocks), len(stock_codes & existing)
 
     def find_data_key(self, response_data):
         """응답에서 데이터 배열 키 찾기"""
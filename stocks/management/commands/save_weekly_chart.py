@@ -1,9 +1,11 @@
 import requests
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from django.core.management.base import BaseCommand
 from stocks.utils import get_valid_token
 from stocks.models import Info, WeeklyChart
 from stocks.logger import StockLogger
+from stocks.cache import bump_data_version
+from stocks.cube import mark_cube_changed
 
 
 class Command(BaseCommand):
@@ -48,6 +50,8 @@ class Command(BaseCommand):
         if options.get('clear'):
             deleted_count, _ = WeeklyChart.objects.all().delete()
             self.stdout.write(self.style.SUCCESS(f'WeeklyChart 데이터 {deleted_count}건 삭제 완료'))
+            mark_cube_changed('stock', 'weekly', date.min)
+            bump_data_version('charts')
             return
 
         # 필수 옵션 체크
@@ -57,6 +61,7 @@ class Command(BaseCommand):
 
         # 로거 초기화
         self.log = StockLogger(self.stdout, self.style, options, 'save_weekly_chart')
+        self.changed_from = None  # 저장한 가장 이른 봉 날짜 (OHLCV 큐브 증분 갱신 범위)
 
         # 1. 토큰 가져오기
         token = get_valid_token()
@@ -76,6 +81,13 @@ class Command(BaseCommand):
         else:
             self.process_single_stock(token, code, mode)
 
+        # OHLCV 큐브가 다시 채울 범위 (과거 봉 변경 포함)
+        if self.changed_from:
+            mark_cube_changed('stock', 'weekly', self.changed_from)
+
+        # 차트 캐시 무효화 (데이터 버전 증가)
+        bump_data_version('charts')
+
     def process_single_stock(self, token, stock_code, mode):
         """단일 종목 처리"""
         try:
@@ -359,6 +371,7 @@ class Command(BaseCommand):
                     }
                 )
 
+                self.changed_from = min(self.changed_from or date, date)
                 if created:
                     created_count += 1
                 else:
@@ -0,0 +1,85 @@
+from pathlib import Path
+from django.core.management.base import BaseCommand
+from django.db import connection
+from stocks.logger import StockLogger
+
+
+class Command(BaseCommand):
+    help = '''
+SQLite 정기 유지보수 (일일 업데이트 마지막 단계)
+
+PRAGMA optimize로 쿼리 플래너 통계를 갱신하고,
+WAL 체크포인트로 WAL 파일 내용을 DB 파일에 반영한 뒤 WAL 파일을 비웁니다.
+
+옵션:
+  --checkpoint (선택) PASSIVE / FULL / RESTART / TRUNCATE (기본값: TRUNCATE)
+  --vacuum     (선택) VACUUM으로 빈 페이지 정리 (대량 삭제/본문 압축 마이그레이션 후, 실행 중 쓰기 잠금)
+  --log-level  (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py sqlite_maintenance
+  python manage.py sqlite_maintenance --checkpoint PASSIVE
+  python manage.py sqlite_maintenance --vacuum
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--checkpoint',
+            type=str,
+            default='TRUNCATE',
+            choices=['PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'],
+            help='WAL 체크포인트 모드 (기본값: TRUNCATE)'
+        )
+        parser.add_argument(
+            '--vacuum',
+            action='store_true',
+            help='VACUUM으로 빈 페이지 정리 (DB 파일 크기 축소)'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'sqlite_maintenance')
+
+        if connection.vendor != 'sqlite':
+            self.log.error(f'SQLite DB가 아닙니다: {connection.vendor}')
+            return
+
+        db_path = Path(connection.settings_dict['NAME'])
+        wal_path = db_path.with_name(db_path.name + '-wal')
+
+        self.log.info(f'SQLite 유지보수 시작: {db_path.name}')
+        self.log.separator()
+
+        with connection.cursor() as cursor:
+            journal_mode = cursor.execute('PRAGMA journal_mode').fetchone()[0]
+            self.log.info(f'journal_mode: {journal_mode}')
+            if journal_mode.lower() != 'wal':
+                self.log.warning('WAL 모드가 아닙니다. (settings.SQLITE_PRAGMAS 확인)')
+
+            # 쿼리 플래너 통계 갱신 (필요한 테이블만, 테이블당 최대 1000행 샘플)
+            cursor.execute('PRAGMA analysis_limit=1000')
+            cursor.execute('PRAGMA optimize')
+            self.log.info('PRAGMA optimize 완료')
+
+            db_before = db_path.stat().st_size
+            if options['vacuum']:
+                # WAL 모드에서는 정리된 내용이 WAL에 기록되고 아래 체크포인트 후 DB 파일에 반영됨
+                cursor.execute('VACUUM')
+                self.log.info('VACUUM 완료')
+
+            wal_before = wal_path.stat().st_size if wal_path.exists() else 0
+            busy, log_frames, checkpointed = cursor.execute(
+                f'PRAGMA wal_checkpoint({options["checkpoint"]})'
+            ).fetchone()
+            wal_after = wal_path.stat().st_size if wal_path.exists() else 0
+
+        if busy:
+            self.log.warning(f'체크포인트 일부 미완료 (사용 중인 읽기/쓰기 있음): {checkpointed}/{log_frames} 프레임')
+        else:
+            self.log.info(f'WAL 체크포인트({options["checkpoint"]}): {checkpointed}/{log_frames} 프레임')
+        self.log.info(f'WAL 파일: {wal_before / 1024 / 1024:.1f}MB → {wal_after / 1024 / 1024:.1f}MB')
+        if options['vacuum']:
+            self.log.info(f'DB 파일: {db_before / 1024 / 1024:.1f}MB → {db_path.stat().st_size / 1024 / 1024:.1f}MB')
+
+        self.log.separator()
+        self.log.info('완료', success=True)
@@ -0,0 +1,47 @@
+from django.core.management.base import BaseCommand
+from stocks.logger import StockLogger
+from stocks.cache import PAGE_DATASETS, warm_page_cache
+
+
+class Command(BaseCommand):
+    help = '''
+페이지 캐시 워밍업 (수집 완료 후 실행)
+
+현재 데이터 버전 기준으로 대시보드/시황/섹터/ETF 페이지 context를 미리 계산해
+공유 캐시('shared')에 저장합니다. 이미 같은 버전이 캐시되어 있으면 건너뜁니다.
+
+옵션:
+  --page      (선택) index / market / sector / etf (기본값: 전체)
+  --log-level (선택) debug / info / warning / error (기본값: info)
+
+예시:
+  python manage.py warm_page_cache
+  python manage.py warm_page_cache --page index
+'''
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--page',
+            type=str,
+            choices=list(PAGE_DATASETS.keys()),
+            help='워밍업할 페이지 (기본값: 전체)'
+        )
+        StockLogger.add_arguments(parser)
+
+    def handle(self, *args, **options):
+        self.log = StockLogger(self.stdout, self.style, options, 'warm_page_cache')
+
+        pages = [options['page']] if options.get('page') else None
+        self.log.info(f'페이지 캐시 워밍업 시작 (대상: {", ".join(pages or PAGE_DATASETS)})')
+        self.log.separator()
+
+        built_count = 0
+        for page, built in warm_page_cache(pages):
+            if built:
+                built_count += 1
+                self.log.info(f'{page}: 캐시 생성')
+            else:
+                self.log.info(f'{page}: 최신 캐시 있음 (스킵)')
+
+        self.log.separator()
+        self.log.info(f'완료 | 생성: {built_count}개', success=True)
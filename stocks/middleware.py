@@ -1,9 +1,16 @@
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
 from django.shortcuts import redirect
 from django.conf import settings
 
 
 class LoginRequiredMiddleware:
-    """모든 페이지에 로그인을 필수로 요구하는 미들웨어"""
+    """
+    모든 페이지에 로그인을 필수로 요구하는 미들웨어
+
+    동기/비동기 모두 지원 (ASGI에서 비동기 뷰가 스레드를 점유하지 않도록)
+    """
+    sync_capable = True
+    async_capable = True
 
     def __init__(self, get_response):
         self.get_response = get_response
@@ -12,10 +19,117 @@ class LoginRequiredMiddleware:
             f'/{self.login_url}/',
             '/admin/',
         ]
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def is_open_url(self, path):
+        return any(path.startswith(url) for url in self.open_urls)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
         if not request.user.is_authenticated:
-            if not any(request.path.startswith(url) for url in self.open_urls):
+            if not self.is_open_url(request.path):
                 return redirect(self.login_url)
 
         return self.get_response(request)
+
+    async def __acall__(self, request):
+        user = await request.auser()
+        if not user.is_authenticated:
+            if not self.is_open_url(request.path):
+                return redirect(self.login_url)
+
+        return await self.get_response(request)
+
+
+class ProfilingMiddleware:
+    """
+    요청 프로파일링 미들웨어 (PROFILING_ENABLED=True일 때만 로드, stocks/profiling.py 참고)
+
+    미들웨어 목록 맨 앞에 두어 다른 미들웨어 시간까지 포함해 측정합니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        from django.core.exceptions import MiddlewareNotUsed
+        from . import profiling
+
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        profiling.install()
+
+        self.get_response = get_response
+        self.profiling = profiling
+        self.history_size = settings.PROFILING_HISTORY
+        self.excluded = ('/profiling/', '/' + settings.STATIC_URL.lstrip('/'))  # 프로파일 페이지, 정적 파일 제외
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if request.path.startswith(self.excluded):
+            return self.get_response(request)
+
+        token, profile = self.profiling.start(request)
+        profiler = self.profiling.new_profiler() if self.profiling.claim_cprofile(request) else None
+        response = None
+        try:
+            if profiler:
+                response = profiler.runcall(self.get_response, request)
+            else:
+                response = self.get_response(request)
+            return response
+        finally:
+            self._finish(token, profile, profiler, request, response)
+
+    async def __acall__(self, request):
+        if request.path.startswith(self.excluded):
+            return await self.get_response(request)
+
+        token, profile = self.profiling.start(request)
+        profiler = self.profiling.new_profiler() if self.profiling.claim_cprofile(request) else None
+        # cProfile은 enable()을 호출한 스레드만 기록하므로, 동기 뷰는 뷰가 실행되는 요청별 스레드
+        # (thread_sensitive 실행 스레드)에서 켜고 끔. 비동기 뷰는 이벤트 루프 스레드에서 켬
+        # (같은 이벤트 루프에서 동시에 실행된 코드도 섞일 수 있음)
+        in_view_thread = profiler is not None and not self.is_async_view(request)
+        response = None
+        try:
+            if profiler:
+                await self._toggle(profiler.enable, in_view_thread)
+            response = await self.get_response(request)
+            return response
+        finally:
+            if profiler:
+                await self._toggle(profiler.disable, in_view_thread)
+            self._finish(token, profile, profiler, request, response)
+
+    @staticmethod
+    async def _toggle(func, in_view_thread):
+        """cProfile enable/disable (in_view_thread면 동기 뷰가 실행되는 thread_sensitive 스레드에서)"""
+        if in_view_thread:
+            await sync_to_async(func, thread_sensitive=True)()
+        else:
+            func()
+
+    @staticmethod
+    def is_async_view(request):
+        """요청 경로의 뷰가 비동기 뷰인지 (해석 실패 시 동기로 간주)"""
+        from django.urls import Resolver404, resolve
+
+        try:
+            match = resolve(request.path_info)
+        except Resolver404:
+            return False
+        return iscoroutinefunction(match.func)
+
+    def _finish(self, token, profile, profiler, request, response):
+        if response is None:  # 예외 (Django 예외 처리 전 단계)
+            self.profiling.discard(token)
+            return
+        self.profiling.finish(token, profile, request, response, self.history_size)
+        if profiler:
+            self.profiling.save_cprofile(profiler, request)
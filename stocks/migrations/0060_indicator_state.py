@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-19 00:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0059_remove_integrated_report_add_question_report'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IndicatorState',
+            fields=[
+                ('stock', models.OneToOneField(help_text='종목 정보 (Info 모델 참조)', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='indicator_state', serialize=False, to='stocks.info', verbose_name='종목')),
+                ('last_date', models.DateField(blank=True, help_text='상태에 마지막으로 반영된 일봉 일자', null=True, verbose_name='최종 반영일')),
+                ('bar_count', models.IntegerField(default=0, help_text='상태에 반영된 전체 일봉 개수', verbose_name='반영 봉 수')),
+                ('ma5', models.FloatField(blank=True, null=True, verbose_name='MA5')),
+                ('ma10', models.FloatField(blank=True, null=True, verbose_name='MA10')),
+                ('ma20', models.FloatField(blank=True, null=True, verbose_name='MA20')),
+                ('ma60', models.FloatField(blank=True, null=True, verbose_name='MA60')),
+                ('ma120', models.FloatField(blank=True, null=True, verbose_name='MA120')),
+                ('max_volume_20', models.BigIntegerField(blank=True, null=True, verbose_name='20일 최대 거래량')),
+                ('max_volume_60', models.BigIntegerField(blank=True, null=True, verbose_name='60일 최대 거래량')),
+                ('ema12', models.FloatField(blank=True, null=True, verbose_name='EMA12')),
+                ('ema26', models.FloatField(blank=True, null=True, verbose_name='EMA26')),
+                ('state', models.JSONField(blank=True, default=dict, help_text='종가 링버퍼, 구간 누적합, 거래량 단조 덱, 최근 봉 스냅샷', verbose_name='롤링 상태')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '지표 상태',
+                'verbose_name_plural': '지표 상태',
+                'db_table': 'indicator_state',
+                'indexes': [models.Index(fields=['-last_date'], name='indicator_s_last_da_b01c45_idx')],
+            },
+        ),
+    ]
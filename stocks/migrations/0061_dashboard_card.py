@@ -0,0 +1,38 @@
+# Generated by Django 5.2.8 on 2026-10-19 00:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0060_indicator_state'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardCard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('card_type', models.CharField(choices=[('report', '리포트'), ('nodaji', '노다지')], max_length=10, verbose_name='카드 종류')),
+                ('window_start', models.DateField(help_text='거래일 기준 집계 구간 시작일', verbose_name='집계 시작일')),
+                ('source_id', models.IntegerField(help_text='Report.id 또는 Nodaji.id', verbose_name='원본 ID')),
+                ('date', models.DateField(verbose_name='작성일')),
+                ('title', models.CharField(max_length=500, verbose_name='제목')),
+                ('provider', models.CharField(blank=True, max_length=100, verbose_name='제공처')),
+                ('target_price', models.BigIntegerField(blank=True, null=True, verbose_name='목표가')),
+                ('link', models.URLField(blank=True, max_length=500, verbose_name='링크')),
+                ('total_count', models.IntegerField(default=1, help_text='집계 구간 내 해당 종목 전체 건수', verbose_name='건수')),
+                ('built_at', models.DateTimeField(auto_now=True, verbose_name='집계일시')),
+                ('stock', models.ForeignKey(help_text='종목 정보 (Info 모델 참조)', on_delete=django.db.models.deletion.CASCADE, related_name='dashboard_cards', to='stocks.info', verbose_name='종목')),
+            ],
+            options={
+                'verbose_name': '대시보드 카드 집계',
+                'verbose_name_plural': '대시보드 카드 집계',
+                'db_table': 'dashboard_card',
+                'indexes': [models.Index(fields=['card_type', 'stock'], name='dashboard_c_card_ty_5c08e3_idx')],
+                'unique_together': {('card_type', 'stock')},
+            },
+        ),
+    ]
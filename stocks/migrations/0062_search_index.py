@@ -0,0 +1,36 @@
+# Generated by Django 5.2.8 on 2026-10-19 09:00
+
+from django.db import migrations
+
+
+def build_search_index(apps, schema_editor):
+    """기존 텍스트 전체 색인"""
+    from stocks.search import rebuild
+
+    rebuild(get_model=apps.get_model)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0061_dashboard_card'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql='''
+                CREATE VIRTUAL TABLE search_index USING fts5(
+                    title,
+                    body,
+                    kind UNINDEXED,
+                    object_id UNINDEXED,
+                    stock_code UNINDEXED,
+                    sector_id UNINDEXED,
+                    date UNINDEXED,
+                    tokenize = 'trigram'
+                )
+            ''',
+            reverse_sql='DROP TABLE search_index',
+        ),
+        migrations.RunPython(build_search_index, migrations.RunPython.noop),
+    ]
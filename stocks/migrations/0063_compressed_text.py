@@ -0,0 +1,137 @@
+# Generated by Django 5.2.8 on 2026-10-19 12:00
+
+import stocks.fields
+from django.db import migrations
+
+
+COMPRESSED_FIELDS = [
+    ('Info', 'insight_summary_html'),
+    ('Info', 'insight_report_html'),
+    ('CustomSector', 'basic_report'),
+    ('SectorQuestionReport', 'report'),
+    ('Report', 'summary'),
+    ('Nodaji', 'summary'),
+    ('YoutubeVideo', 'summary'),
+    ('News', 'summary'),
+    ('TelegramMessage', 'summary'),
+    ('SectorTelegramMessage', 'summary'),
+    ('SectorNews', 'summary'),
+    ('SectorYoutubeVideo', 'summary'),
+]
+
+
+def _rewrite(apps, schema_editor, column_type, min_length, convert):
+    """column_type(text/blob)으로 저장된 본문을 convert(값)로 바꿔 다시 저장 (500행씩)"""
+    quote = schema_editor.quote_name
+    with schema_editor.connection.cursor() as cursor:
+        for model_name, field_name in COMPRESSED_FIELDS:
+            model = apps.get_model('stocks', model_name)
+            table = quote(model._meta.db_table)
+            pk = quote(model._meta.pk.column)
+            column = quote(model._meta.get_field(field_name).column)
+
+            cursor.execute(
+                f'SELECT {pk} FROM {table} WHERE typeof({column}) = %s AND length(CAST({column} AS BLOB)) >= %s',
+                [column_type, min_length]
+            )
+            pks = [row[0] for row in cursor.fetchall()]
+            for i in range(0, len(pks), 500):
+                chunk = pks[i:i + 500]
+                cursor.execute(
+                    f'SELECT {pk}, {column} FROM {table} WHERE {pk} IN ({", ".join(["%s"] * len(chunk))})',
+                    chunk
+                )
+                cursor.executemany(
+                    f'UPDATE {table} SET {column} = %s WHERE {pk} = %s',
+                    [(convert(value), key) for key, value in cursor.fetchall()]
+                )
+
+
+def compress_existing(apps, schema_editor):
+    """
+    기존 TEXT 본문을 압축 형식으로 다시 저장
+
+    압축 전 값도 그대로 읽히므로 정합성이 아니라 용량 절감용이며,
+    비워진 페이지는 sqlite_maintenance --vacuum 실행 후 DB 파일 크기에 반영됩니다.
+    """
+    from stocks.fields import COMPRESS_MIN_LENGTH, compress_text
+
+    _rewrite(apps, schema_editor, 'text', COMPRESS_MIN_LENGTH, compress_text)
+
+
+def decompress_existing(apps, schema_editor):
+    """되돌리기: 압축 본문을 TEXT로 다시 저장"""
+    from stocks.fields import decompress_text
+
+    _rewrite(apps, schema_editor, 'blob', 1, decompress_text)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0062_search_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='customsector',
+            name='basic_report',
+            field=stocks.fields.CompressedTextField(blank=True, default='', help_text='기초리포트 (HTML 형식)', verbose_name='기초리포트'),
+        ),
+        migrations.AlterField(
+            model_name='info',
+            name='insight_report_html',
+            field=stocks.fields.CompressedTextField(blank=True, default='', help_text='투자포인트/리스크/일정 상세 리포트 (HTML 형식)', verbose_name='인사이트(리포트)'),
+        ),
+        migrations.AlterField(
+            model_name='info',
+            name='insight_summary_html',
+            field=stocks.fields.CompressedTextField(blank=True, default='', help_text='투자포인트/리스크/일정 요약 (HTML 형식)', verbose_name='인사이트(요약)'),
+        ),
+        migrations.AlterField(
+            model_name='news',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='뉴스 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='nodaji',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='기사 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='report',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='리포트 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='sectornews',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='뉴스 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='sectorquestionreport',
+            name='report',
+            field=stocks.fields.CompressedTextField(blank=True, default='', help_text='리포트 (HTML 형식)', verbose_name='리포트'),
+        ),
+        migrations.AlterField(
+            model_name='sectortelegrammessage',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='메시지 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='sectoryoutubevideo',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='영상 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='telegrammessage',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='메시지 요약 내용', verbose_name='요약'),
+        ),
+        migrations.AlterField(
+            model_name='youtubevideo',
+            name='summary',
+            field=stocks.fields.CompressedTextField(blank=True, help_text='영상 요약 내용', verbose_name='요약'),
+        ),
+        migrations.RunPython(compress_existing, decompress_existing),
+    ]
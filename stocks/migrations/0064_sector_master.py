@@ -0,0 +1,96 @@
+# Generated by Django 5.2.8 on 2026-10-19 15:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_sector_master(apps, schema_editor):
+    """
+    업종 마스터 생성 + 시계열/종목 매핑 연결
+
+    - (업종코드, 시장)별 마스터 1건, 이름은 최신 일자 기준
+    - Sector.master 채움
+    - 기존 종목-업종 매핑(날짜별 Sector 행)을 마스터 기준으로 옮김 (중복 제거)
+    """
+    Sector = apps.get_model('stocks', 'Sector')
+    SectorMaster = apps.get_model('stocks', 'SectorMaster')
+    Info = apps.get_model('stocks', 'Info')
+
+    names = {}
+    for code, market, name in Sector.objects.order_by('date').values_list('code', 'market', 'name'):
+        names[(code, market)] = name
+    SectorMaster.objects.bulk_create(
+        [SectorMaster(code=code, market=market, name=name) for (code, market), name in names.items()],
+        batch_size=500,
+    )
+    master_ids = {(m.code, m.market): m.id for m in SectorMaster.objects.all()}
+
+    for (code, market), master_id in master_ids.items():
+        Sector.objects.filter(code=code, market=market).update(master_id=master_id)
+
+    OldLink = Info.sectors.through
+    NewLink = Info.sector_masters.through
+    links = {
+        (info_id, master_ids[(code, market)])
+        for info_id, code, market in OldLink.objects.values_list('info_id', 'sector__code', 'sector__market')
+    }
+    NewLink.objects.bulk_create(
+        [NewLink(info_id=info_id, sectormaster_id=master_id) for info_id, master_id in sorted(links)],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0063_compressed_text'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SectorMaster',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.CharField(help_text='업종 고유 코드 (API: inds_cd)', max_length=20, verbose_name='업종코드')),
+                ('market', models.CharField(choices=[('KOSPI', 'KOSPI'), ('KOSDAQ', 'KOSDAQ')], max_length=10, verbose_name='시장구분')),
+                ('name', models.CharField(help_text='최근 수집한 업종 이름 (API: inds_nm)', max_length=100, verbose_name='업종명')),
+            ],
+            options={
+                'verbose_name': '업종마스터',
+                'verbose_name_plural': '업종마스터',
+                'db_table': 'sector_master',
+                'ordering': ['market', 'code'],
+                'unique_together': {('code', 'market')},
+            },
+        ),
+        migrations.AddField(
+            model_name='sector',
+            name='master',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='flows', to='stocks.sectormaster'),
+        ),
+        migrations.AddField(
+            model_name='info',
+            name='sector_masters',
+            field=models.ManyToManyField(blank=True, related_name='stocks', to='stocks.sectormaster'),
+        ),
+        migrations.RunPython(fill_sector_master, migrations.RunPython.noop),
+        migrations.RemoveField(
+            model_name='info',
+            name='sectors',
+        ),
+        migrations.RenameField(
+            model_name='info',
+            old_name='sector_masters',
+            new_name='sectors',
+        ),
+        migrations.AlterField(
+            model_name='info',
+            name='sectors',
+            field=models.ManyToManyField(blank=True, help_text='이 종목이 속한 업종들 (예: 종합, 대형주, 반도체업종 등)', related_name='stocks', to='stocks.sectormaster', verbose_name='소속 업종'),
+        ),
+        migrations.AlterField(
+            model_name='sector',
+            name='master',
+            field=models.ForeignKey(help_text='업종 마스터 (code/market과 같은 업종)', on_delete=django.db.models.deletion.CASCADE, related_name='flows', to='stocks.sectormaster', verbose_name='업종'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.8 on 2026-10-19 16:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0064_sector_master'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='gongsi',
+            index=models.Index(fields=['link'], name='gongsi_link_a96e2a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='nodaji',
+            index=models.Index(fields=['link'], name='nodaji_link_9d63fa_idx'),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.8 on 2026-10-19 17:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def fill_latest_quote(apps, schema_editor):
+    """
+    활성 종목의 스냅샷을 Info 값으로 생성 (마이그레이션 직후 종목 목록용)
+
+    일봉 기준 종가/52주 고저는 다음 수집(save_daily_chart) 또는 build_latest_quote에서 채워짐
+    """
+    Info = apps.get_model('stocks', 'Info')
+    LatestQuote = apps.get_model('stocks', 'LatestQuote')
+
+    fields = ('name', 'market', 'price_change', 'change_rate', 'volume', 'market_cap', 'per', 'pbr', 'roe')
+    LatestQuote.objects.bulk_create([
+        LatestQuote(stock_id=row['code'], close_price=row['current_price'], **{f: row[f] for f in fields})
+        for row in Info.objects.filter(is_active=True).values('code', 'current_price', *fields).iterator()
+    ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0065_link_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LatestQuote',
+            fields=[
+                ('stock', models.OneToOneField(help_text='종목 정보 (Info 모델 참조)', on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='latest_quote', serialize=False, to='stocks.info', verbose_name='종목')),
+                ('name', models.CharField(max_length=100, verbose_name='종목명')),
+                ('market', models.CharField(max_length=10, verbose_name='시장구분')),
+                ('date', models.DateField(blank=True, help_text='마지막 일봉 일자 (일봉이 없으면 비어 있음)', null=True, verbose_name='일자')),
+                ('close_price', models.BigIntegerField(blank=True, null=True, verbose_name='종가')),
+                ('price_change', models.BigIntegerField(blank=True, null=True, verbose_name='전일대비')),
+                ('change_rate', models.DecimalField(blank=True, decimal_places=2, max_digits=6, null=True, verbose_name='등락율')),
+                ('volume', models.BigIntegerField(blank=True, null=True, verbose_name='거래량')),
+                ('trading_value', models.BigIntegerField(blank=True, help_text='거래대금 (백만원)', null=True, verbose_name='거래대금')),
+                ('high_52w', models.BigIntegerField(blank=True, null=True, verbose_name='52주 최고')),
+                ('low_52w', models.BigIntegerField(blank=True, null=True, verbose_name='52주 최저')),
+                ('market_cap', models.BigIntegerField(blank=True, null=True, verbose_name='시가총액')),
+                ('per', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='PER')),
+                ('pbr', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='PBR')),
+                ('roe', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True, verbose_name='ROE')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='수정일시')),
+            ],
+            options={
+                'verbose_name': '최신 시세',
+                'verbose_name_plural': '최신 시세',
+                'db_table': 'latest_quote',
+                'indexes': [models.Index(fields=['-market_cap'], name='latest_quot_market__5a3990_idx'), models.Index(fields=['market', '-market_cap'], name='latest_quot_market_d6f242_idx'), models.Index(fields=['-change_rate'], name='latest_quot_change__c33263_idx'), models.Index(fields=['market', '-change_rate'], name='latest_quot_market_f53f91_idx'), models.Index(fields=['-trading_value'], name='latest_quot_trading_48b410_idx'), models.Index(fields=['market', '-trading_value'], name='latest_quot_market_f6c932_idx'), models.Index(fields=['name'], name='latest_quot_name_e307a1_idx'), models.Index(fields=['market', 'name'], name='latest_quot_market_7f9fc5_idx')],
+            },
+        ),
+        migrations.RunPython(fill_latest_quote, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-19 01:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('stocks', '0066_latest_quote'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='info',
+            name='delisted_at',
+            field=models.DateField(blank=True, null=True, verbose_name='상폐일'),
+        ),
+    ]
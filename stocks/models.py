@@ -1,5 +1,7 @@
 from django.db import models
 
+from .fields import CompressedTextField, CompressedTextManager
+
 
 class ThemeCategory(models.Model):
     """
@@ -62,6 +64,32 @@ class Theme(models.Model):
         return f"{self.category.name} > {self.name}"
 
 
+# 목록/대시보드 조회에서 제외하는 대용량 텍스트 컬럼 (상세/편집 페이지에서만 로드)
+INFO_HEAVY_FIELDS = ('analysis_text', 'insight_summary_html', 'insight_report_html', 'memo')
+
+
+class InfoQuerySet(models.QuerySet):
+    """종목정보 QuerySet"""
+
+    def lean(self):
+        """
+        목록/대시보드용 경량 조회
+
+        기업분석/인사이트/메모 본문은 제외하고 존재 여부만 DB에서 계산합니다.
+        (has_insight_and_analysis는 본문 로드 없이 동작)
+        """
+        return self.defer(*INFO_HEAVY_FIELDS).annotate(
+            insight_exists=models.ExpressionWrapper(
+                ~models.Q(insight_summary_html='') | ~models.Q(insight_report_html=''),
+                output_field=models.BooleanField()
+            ),
+            analysis_exists=models.ExpressionWrapper(
+                ~models.Q(analysis_text=''),
+                output_field=models.BooleanField()
+            ),
+        )
+
+
 class Info(models.Model):
     """
     종목 기본 정보
@@ -80,6 +108,7 @@ class Info(models.Model):
         verbose_name='시장구분'
     )
     is_active = models.BooleanField(default=True, verbose_name='활성화')
+    delisted_at = models.DateField(null=True, blank=True, verbose_name='상폐일')  # save_stock_list 종목 목록에서 빠진 날 (재상장 시 None)
 
     # === 주식/시가총액 정보 ===
     listed_shares = models.BigIntegerField(null=True, blank=True, verbose_name='상장주식')
@@ -125,7 +154,7 @@ class Info(models.Model):
 
     # === 업종 관계 ===
     sectors = models.ManyToManyField(
-        'Sector',
+        'SectorMaster',
         related_name='stocks',
         blank=True,
         verbose_name='소속 업종',
@@ -195,13 +224,13 @@ class Info(models.Model):
     )
 
     # === 인사이트 (투자포인트/리스크/일정 통합) ===
-    insight_summary_html = models.TextField(
+    insight_summary_html = CompressedTextField(
         blank=True,
         default='',
         verbose_name='인사이트(요약)',
         help_text='투자포인트/리스크/일정 요약 (HTML 형식)'
     )
-    insight_report_html = models.TextField(
+    insight_report_html = CompressedTextField(
         blank=True,
         default='',
         verbose_name='인사이트(리포트)',
@@ -226,9 +255,13 @@ class Info(models.Model):
         help_text='메모 마지막 수정일'
     )
 
+    objects = InfoQuerySet.as_manager()
+
     @property
     def has_insight_and_analysis(self):
         """인사이트와 기업분석 둘 다 있는지 확인"""
+        if 'insight_exists' in self.__dict__:  # lean() 조회: 본문 대신 존재 여부 사용
+            return bool(self.insight_exists and self.analysis_exists)
         has_insight = bool(self.insight_summary_html or self.insight_report_html)
         has_analysis = bool(self.analysis_text)
         return has_insight and has_analysis
@@ -958,6 +991,165 @@ class MonthlyChart(models.Model):
         return f"{self.stock.name} - {self.date} (종가: {self.closing_price:,}원)"
 
 
+class IndicatorState(models.Model):
+    """
+    종목별 롤링 지표 상태
+
+    일봉(DailyChart) 저장 시 새 봉 1개당 O(1)로 갱신되는 지표 스냅샷
+    대시보드/신호 계산이 매 요청마다 65~125봉을 다시 합산하지 않도록
+    이동평균 누적합, 거래량 최대값(단조 덱), EMA 값을 미리 보관합니다.
+
+    - 갱신: stocks.indicators.update_indicator_state (save_daily_chart에서 호출)
+    - 재구축: python manage.py build_indicator_state --code all
+    """
+
+    # === 기본 정보 ===
+    stock = models.OneToOneField(
+        Info,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='indicator_state',
+        verbose_name='종목',
+        help_text='종목 정보 (Info 모델 참조)'
+    )
+    last_date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='최종 반영일',
+        help_text='상태에 마지막으로 반영된 일봉 일자'
+    )
+    bar_count = models.IntegerField(
+        default=0,
+        verbose_name='반영 봉 수',
+        help_text='상태에 반영된 전체 일봉 개수'
+    )
+
+    # === 이동평균 (최신 봉 기준) ===
+    ma5 = models.FloatField(null=True, blank=True, verbose_name='MA5')
+    ma10 = models.FloatField(null=True, blank=True, verbose_name='MA10')
+    ma20 = models.FloatField(null=True, blank=True, verbose_name='MA20')
+    ma60 = models.FloatField(null=True, blank=True, verbose_name='MA60')
+    ma120 = models.FloatField(null=True, blank=True, verbose_name='MA120')
+
+    # === 거래량 (최신 봉 기준) ===
+    max_volume_20 = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='20일 최대 거래량'
+    )
+    max_volume_60 = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='60일 최대 거래량'
+    )
+
+    # === EMA ===
+    ema12 = models.FloatField(null=True, blank=True, verbose_name='EMA12')
+    ema26 = models.FloatField(null=True, blank=True, verbose_name='EMA26')
+
+    # === 롤링 버퍼 (JSON) ===
+    state = models.JSONField(
+        default=dict,
+        blank=True,
+        verbose_name='롤링 상태',
+        help_text='종가 링버퍼, 구간 누적합, 거래량 단조 덱, 최근 봉 스냅샷'
+    )
+
+    # === 메타 정보 ===
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    class Meta:
+        db_table = 'indicator_state'
+        verbose_name = '지표 상태'
+        verbose_name_plural = '지표 상태'
+        indexes = [
+            models.Index(fields=['-last_date']),  # 갱신 누락 종목 조회용
+        ]
+
+    def __str__(self):
+        return f"{self.stock.name} - {self.last_date} ({self.bar_count}봉)"
+
+
+class LatestQuote(models.Model):
+    """
+    종목별 최신 시세 스냅샷 (활성 종목당 1건)
+
+    종목 목록의 정렬/필터를 Info 전체 정렬 대신 정렬 컬럼 인덱스로 처리하기 위한 비정규화 테이블
+    종목명/시장/밸류에이션은 Info, 시세/52주 고저는 일봉(DailyChart)에서 가져옵니다.
+
+    - 갱신: stocks.quotes.refresh_latest_quotes (save_daily_chart, save_stock_info, save_stock_list, 종목 새로고침)
+    - 재구축: python manage.py build_latest_quote
+    """
+
+    stock = models.OneToOneField(
+        Info,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name='latest_quote',
+        verbose_name='종목',
+        help_text='종목 정보 (Info 모델 참조)'
+    )
+    name = models.CharField(max_length=100, verbose_name='종목명')
+    market = models.CharField(max_length=10, verbose_name='시장구분')
+
+    # === 최신 봉 (일봉이 없으면 Info 시세) ===
+    date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='일자',
+        help_text='마지막 일봉 일자 (일봉이 없으면 비어 있음)'
+    )
+    close_price = models.BigIntegerField(null=True, blank=True, verbose_name='종가')
+    price_change = models.BigIntegerField(null=True, blank=True, verbose_name='전일대비')
+    change_rate = models.DecimalField(max_digits=6, decimal_places=2, null=True, blank=True, verbose_name='등락율')
+    volume = models.BigIntegerField(null=True, blank=True, verbose_name='거래량')
+    trading_value = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='거래대금',
+        help_text='거래대금 (백만원)'
+    )
+    high_52w = models.BigIntegerField(null=True, blank=True, verbose_name='52주 최고')
+    low_52w = models.BigIntegerField(null=True, blank=True, verbose_name='52주 최저')
+
+    # === 밸류에이션 (Info) ===
+    market_cap = models.BigIntegerField(null=True, blank=True, verbose_name='시가총액')
+    per = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name='PER')
+    pbr = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name='PBR')
+    roe = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True, verbose_name='ROE')
+
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='수정일시')
+
+    class Meta:
+        db_table = 'latest_quote'
+        verbose_name = '최신 시세'
+        verbose_name_plural = '최신 시세'
+        # 종목 목록 정렬 컬럼별 (전체 / 시장별), 오름차순 정렬은 같은 인덱스를 역순으로 읽음
+        indexes = [
+            models.Index(fields=['-market_cap']),
+            models.Index(fields=['market', '-market_cap']),
+            models.Index(fields=['-change_rate']),
+            models.Index(fields=['market', '-change_rate']),
+            models.Index(fields=['-trading_value']),
+            models.Index(fields=['market', '-trading_value']),
+            models.Index(fields=['name']),
+            models.Index(fields=['market', 'name']),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.stock_id}) {self.date}"
+
+    @property
+    def high_52w_position(self):
+        """52주 최고가 대비 위치 (%, 최고가면 0)"""
+        if not self.close_price or not self.high_52w:
+            return None
+        return round((self.close_price / self.high_52w - 1) * 100, 1)
+
+
 class ShortSelling(models.Model):
     """
     공매도 추이 데이터
@@ -1035,6 +1227,68 @@ class ShortSelling(models.Model):
         return f"{self.stock.name} - {self.date} (공매도량: {self.short_volume:,}, 비중: {self.trading_weight}%)"
 
 
+class SectorMasterQuerySet(models.QuerySet):
+    """업종 마스터 QuerySet"""
+
+    def sync(self, market, names):
+        """
+        업종 코드/이름 반영 (없으면 생성, 있으면 이름 갱신)
+
+        Args:
+            market: 'KOSPI' 또는 'KOSDAQ'
+            names: {업종코드: 업종명}
+
+        Returns:
+            dict: {업종코드: SectorMaster}
+        """
+        self.bulk_create(
+            [self.model(code=code, market=market, name=name) for code, name in names.items()],
+            update_conflicts=True,
+            unique_fields=['code', 'market'],
+            update_fields=['name'],
+        )
+        return {master.code: master for master in self.filter(market=market, code__in=list(names))}
+
+
+class SectorMaster(models.Model):
+    """
+    업종 마스터 (업종코드+시장별 1건)
+
+    종목-업종 매핑(Info.sectors)과 업종별 순매수 시계열(Sector.master)이 함께 참조합니다.
+    시계열 보관 기간과 관계없이 업종 수(시장별 수십 개)만큼만 유지됩니다.
+    """
+    code = models.CharField(
+        max_length=20,
+        verbose_name='업종코드',
+        help_text='업종 고유 코드 (API: inds_cd)'
+    )
+    market = models.CharField(
+        max_length=10,
+        choices=[
+            ('KOSPI', 'KOSPI'),
+            ('KOSDAQ', 'KOSDAQ'),
+        ],
+        verbose_name='시장구분'
+    )
+    name = models.CharField(
+        max_length=100,
+        verbose_name='업종명',
+        help_text='최근 수집한 업종 이름 (API: inds_nm)'
+    )
+
+    objects = SectorMasterQuerySet.as_manager()
+
+    class Meta:
+        db_table = 'sector_master'
+        verbose_name = '업종마스터'
+        verbose_name_plural = '업종마스터'
+        ordering = ['market', 'code']
+        unique_together = [('code', 'market')]
+
+    def __str__(self):
+        return f"{self.name}({self.code}) [{self.market}]"
+
+
 class Sector(models.Model):
     """
     업종별 투자자 순매수 데이터 (시계열)
@@ -1052,6 +1306,7 @@ class Sector(models.Model):
     - Sector(code='001', name='음식료업', market='KOSPI', date='2025-11-28')
     - Sector(code='001', name='음식료업', market='KOSDAQ', date='2025-11-29')
     → 같은 업종도 시장별, 날짜별로 별도 레코드
+    → 업종 자체(코드/시장/이름)는 SectorMaster 1건이며 master로 참조
 
     ※ 활용:
     - 업종별 투자 주체 분석 (외국인/기관/개인)
@@ -1064,6 +1319,13 @@ class Sector(models.Model):
     """
 
     # === 기본 정보 ===
+    master = models.ForeignKey(
+        SectorMaster,
+        on_delete=models.CASCADE,
+        related_name='flows',
+        verbose_name='업종',
+        help_text='업종 마스터 (code/market과 같은 업종)'
+    )
     code = models.CharField(
         max_length=20,
         verbose_name='업종코드',
@@ -1208,7 +1470,7 @@ class CustomSector(models.Model):
         verbose_name='메모',
         help_text='사용자 메모'
     )
-    basic_report = models.TextField(
+    basic_report = CompressedTextField(
         blank=True,
         default='',
         verbose_name='기초리포트',
@@ -1223,6 +1485,8 @@ class CustomSector(models.Model):
         verbose_name='수정일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'custom_sector'
         verbose_name = '사용자정의섹터'
@@ -1251,7 +1515,7 @@ class SectorQuestionReport(models.Model):
         verbose_name='질문',
         help_text='질문 내용'
     )
-    report = models.TextField(
+    report = CompressedTextField(
         blank=True,
         default='',
         verbose_name='리포트',
@@ -1266,6 +1530,8 @@ class SectorQuestionReport(models.Model):
         verbose_name='수정일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'sector_question_report'
         verbose_name = '섹터질문리포트'
@@ -1346,7 +1612,7 @@ class Report(models.Model):
     )
 
     # === 요약 ===
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='리포트 요약 내용'
@@ -1358,6 +1624,8 @@ class Report(models.Model):
         verbose_name='생성일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'report'
         verbose_name = '애널리스트리포트'
@@ -1412,7 +1680,7 @@ class Nodaji(models.Model):
         verbose_name='링크',
         help_text='기사 URL'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='기사 요약 내용'
@@ -1424,6 +1692,8 @@ class Nodaji(models.Model):
         verbose_name='생성일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'nodaji'
         verbose_name = '노다지기사'
@@ -1432,12 +1702,100 @@ class Nodaji(models.Model):
         indexes = [
             models.Index(fields=['stock', '-date']),  # 종목별 최신순 조회용
             models.Index(fields=['-date']),           # 날짜별 조회용
+            models.Index(fields=['link']),            # 수집 시 중복 체크용
         ]
 
     def __str__(self):
         return f"{self.stock.name} - {self.date} {self.title[:30]}"
 
 
+class DashboardCard(models.Model):
+    """
+    대시보드 카드 집계 (리포트/노다지)
+
+    종목 대시보드의 리포트/노다지 카드용 일별 집계 테이블
+    save_fnguide_report / save_nodaji_stock 완료 시 재구축되며,
+    대시보드는 거래일 조회와 종목별 그룹핑 없이 이 테이블만 읽습니다.
+
+    - 리포트: 최근 3거래일 내 종목별 최신일 목표가 최고 리포트 + 전체 개수
+    - 노다지: 최근 5거래일 내 종목별 최신 기사
+    """
+
+    CARD_TYPE_CHOICES = [
+        ('report', '리포트'),
+        ('nodaji', '노다지'),
+    ]
+
+    # === 기본 정보 ===
+    card_type = models.CharField(
+        max_length=10,
+        choices=CARD_TYPE_CHOICES,
+        verbose_name='카드 종류'
+    )
+    stock = models.ForeignKey(
+        Info,
+        on_delete=models.CASCADE,
+        related_name='dashboard_cards',
+        verbose_name='종목',
+        help_text='종목 정보 (Info 모델 참조)'
+    )
+    window_start = models.DateField(
+        verbose_name='집계 시작일',
+        help_text='거래일 기준 집계 구간 시작일'
+    )
+
+    # === 대표 항목 ===
+    source_id = models.IntegerField(
+        verbose_name='원본 ID',
+        help_text='Report.id 또는 Nodaji.id'
+    )
+    date = models.DateField(
+        verbose_name='작성일'
+    )
+    title = models.CharField(
+        max_length=500,
+        verbose_name='제목'
+    )
+    provider = models.CharField(
+        max_length=100,
+        blank=True,
+        verbose_name='제공처'
+    )
+    target_price = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='목표가'
+    )
+    link = models.URLField(
+        max_length=500,
+        blank=True,
+        verbose_name='링크'
+    )
+    total_count = models.IntegerField(
+        default=1,
+        verbose_name='건수',
+        help_text='집계 구간 내 해당 종목 전체 건수'
+    )
+
+    # === 메타 정보 ===
+    built_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='집계일시'
+    )
+
+    class Meta:
+        db_table = 'dashboard_card'
+        verbose_name = '대시보드 카드 집계'
+        verbose_name_plural = '대시보드 카드 집계'
+        unique_together = [('card_type', 'stock')]  # 카드별 종목당 1건
+        indexes = [
+            models.Index(fields=['card_type', 'stock']),  # 카드별 조회용
+        ]
+
+    def __str__(self):
+        return f"[{self.get_card_type_display()}] {self.stock.name} - {self.date} {self.title[:30]}"
+
+
 class Gongsi(models.Model):
     """
     DART 공시 데이터
@@ -1498,6 +1856,7 @@ class Gongsi(models.Model):
         indexes = [
             models.Index(fields=['stock', '-date']),  # 종목별 최신순 조회용
             models.Index(fields=['-date']),           # 날짜별 조회용
+            models.Index(fields=['link']),            # 수집 시 중복 체크용
         ]
 
     def __str__(self):
@@ -1840,7 +2199,7 @@ class YoutubeVideo(models.Model):
         blank=True,
         verbose_name='업로드일'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='영상 요약 내용'
@@ -1850,6 +2209,8 @@ class YoutubeVideo(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'youtube_video'
         verbose_name = '유튜브 영상'
@@ -1896,7 +2257,7 @@ class News(models.Model):
         blank=True,
         verbose_name='게시일'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='뉴스 요약 내용'
@@ -1906,6 +2267,8 @@ class News(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'news'
         verbose_name = '뉴스'
@@ -1950,7 +2313,7 @@ class TelegramMessage(models.Model):
     text = models.TextField(
         verbose_name='내용'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='메시지 요약 내용'
@@ -1960,6 +2323,8 @@ class TelegramMessage(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'telegram_message'
         verbose_name = '텔레그램 메시지'
@@ -2003,7 +2368,7 @@ class SectorTelegramMessage(models.Model):
     text = models.TextField(
         verbose_name='내용'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='메시지 요약 내용'
@@ -2013,6 +2378,8 @@ class SectorTelegramMessage(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'sector_telegram_message'
         verbose_name = '섹터 텔레그램 메시지'
@@ -2054,7 +2421,7 @@ class SectorNews(models.Model):
         blank=True,
         verbose_name='게시일'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='뉴스 요약 내용'
@@ -2064,6 +2431,8 @@ class SectorNews(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'sector_news'
         verbose_name = '섹터 뉴스'
@@ -2121,7 +2490,7 @@ class SectorYoutubeVideo(models.Model):
         blank=True,
         verbose_name='업로드일'
     )
-    summary = models.TextField(
+    summary = CompressedTextField(
         blank=True,
         verbose_name='요약',
         help_text='영상 요약 내용'
@@ -2131,6 +2500,8 @@ class SectorYoutubeVideo(models.Model):
         verbose_name='저장일시'
     )
 
+    objects = CompressedTextManager()
+
     class Meta:
         db_table = 'sector_youtube_video'
         verbose_name = '섹터 유튜브 영상'
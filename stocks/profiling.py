@@ -0,0 +1,236 @@
+"""
+요청 프로파일링 (PROFILING_ENABLED=True일 때만 동작)
+
+요청마다 뷰 이름, 전체 시간, SQL 쿼리 수/시간, 중복 쿼리(N+1), 템플릿 렌더링 시간,
+응답 크기를 기록하고 최근 PROFILING_HISTORY개 요청을 뷰별로 집계합니다 (/profiling/, 관리자 전용).
+
+- SQL: 모든 DB 연결에 실행 래퍼 설치, 현재 요청 프로파일(contextvar)이 있을 때만 기록
+- 중복 쿼리: 같은 SQL(파라미터 제외)이 한 요청에서 2번 이상 실행된 경우
+- 템플릿: 최상위 렌더링(backends.django.Template.render)만 측정 (include는 포함 시간에 합산)
+- cProfile: 지정한 경로로 시작하는 다음 요청 N개를 cProfile로 실행, 누적 시간 상위 함수 보관
+- 저장소: 프로세스 메모리 (워커 1개 기준, 재시작 시 초기화)
+"""
+import cProfile
+import io
+import pstats
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from datetime import datetime
+
+
+PROFILE_TOP_DUPLICATES = 3  # 요청별 보관할 중복 쿼리 수
+CPROFILE_TOP_FUNCTIONS = 40  # cProfile 결과 상위 함수 수
+CPROFILE_KEEP = 5  # 보관할 cProfile 결과 수
+
+_active = ContextVar('stocks_request_profile', default=None)
+_lock = threading.Lock()
+_history = deque()
+_cprofile_target = {'path': None, 'remaining': 0}
+_cprofile_dumps = deque(maxlen=CPROFILE_KEEP)
+_installed = False
+
+
+class RequestProfile:
+    """요청 1건의 측정값"""
+
+    def __init__(self, request):
+        self.method = request.method
+        self.path = request.path
+        self.started = time.perf_counter()
+        self.queries = []  # [(sql, 초)]
+        self.template_time = 0.0
+
+    def record_query(self, sql, duration):
+        self.queries.append((sql, duration))
+
+    def finish(self, request, response):
+        match = getattr(request, 'resolver_match', None)
+        counts = Counter(sql for sql, _ in self.queries)
+        duplicates = [(sql, n) for sql, n in counts.most_common(PROFILE_TOP_DUPLICATES) if n > 1]
+        return {
+            'at': datetime.now(),
+            'view': match.view_name if match else '(미해석)',
+            'method': self.method,
+            'path': self.path,
+            'status': response.status_code,
+            'total_ms': (time.perf_counter() - self.started) * 1000,
+            'sql_count': len(self.queries),
+            'sql_ms': sum(d for _, d in self.queries) * 1000,
+            'template_ms': self.template_time * 1000,
+            'size': len(response.content) if not response.streaming else None,
+            'duplicates': duplicates,
+        }
+
+
+# ============ 측정 훅 ============
+
+def _query_wrapper(execute, sql, params, many, context):
+    profile = _active.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, time.perf_counter() - start)
+
+
+def _add_query_wrapper(connection, **kwargs):
+    if _query_wrapper not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_query_wrapper)
+
+
+def install():
+    """SQL/템플릿 측정 훅 설치 (프로세스당 1회, 미들웨어 초기화 시)"""
+    global _installed
+    if _installed:
+        return
+    from django.db import connections
+    from django.db.backends.signals import connection_created
+    from django.template.backends.django import Template
+
+    connection_created.connect(_add_query_wrapper)
+    for connection in connections.all(initialized_only=True):
+        _add_query_wrapper(connection)
+
+    original_render = Template.render
+
+    def render(self, *args, **kwargs):
+        profile = _active.get()
+        if profile is None:
+            return original_render(self, *args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return original_render(self, *args, **kwargs)
+        finally:
+            profile.template_time += time.perf_counter() - start
+
+    Template.render = render
+    _installed = True
+
+
+def start(request):
+    """요청 측정 시작 (contextvar 토큰과 프로파일 반환)"""
+    profile = RequestProfile(request)
+    return _active.set(profile), profile
+
+
+def finish(token, profile, request, response, history_size):
+    """요청 측정 종료 후 기록 추가"""
+    _active.reset(token)
+    record = profile.finish(request, response)
+    with _lock:
+        _history.append(record)
+        while len(_history) > history_size:
+            _history.popleft()
+    return record
+
+
+def discard(token):
+    """응답 없이 끝난 요청 (예외) 측정 취소"""
+    _active.reset(token)
+
+
+# ============ cProfile ============
+
+def set_cprofile_target(path, count=1):
+    """path로 시작하는 다음 요청 count개를 cProfile로 실행 (path 없으면 해제)"""
+    with _lock:
+        _cprofile_target['path'] = path or None
+        _cprofile_target['remaining'] = count if path else 0
+
+
+def claim_cprofile(request):
+    """이 요청을 cProfile로 실행할지 결정 (대상이면 남은 횟수 차감)"""
+    with _lock:
+        path = _cprofile_target['path']
+        if not path or _cprofile_target['remaining'] <= 0 or not request.path.startswith(path):
+            return False
+        _cprofile_target['remaining'] -= 1
+        if _cprofile_target['remaining'] == 0:
+            _cprofile_target['path'] = None
+        return True
+
+
+def save_cprofile(profiler, request):
+    """cProfile 결과를 누적 시간 순 텍스트로 보관"""
+    out = io.StringIO()
+    stats = pstats.Stats(profiler, stream=out)
+    stats.sort_stats('cumulative').print_stats(CPROFILE_TOP_FUNCTIONS)
+    with _lock:
+        _cprofile_dumps.appendleft({
+            'at': datetime.now(),
+            'path': request.get_full_path(),
+            'text': out.getvalue(),
+        })
+
+
+def new_profiler():
+    return cProfile.Profile()
+
+
+# ============ 집계 ============
+
+def _percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize():
+    """
+    뷰별 집계 (요청 수, 평균/p95/최대 시간, 평균 쿼리 수/시간, 템플릿 시간, 응답 크기, 최다 중복 쿼리)
+
+    Returns:
+        dict: {'views': [뷰별 집계, 전체 시간 합 내림차순], 'recent': [최근 요청],
+               'requests': 기록된 요청 수, 'cprofile_target', 'cprofile_dumps'}
+    """
+    with _lock:
+        records = list(_history)
+        target = dict(_cprofile_target)
+        dumps = list(_cprofile_dumps)
+
+    grouped = {}
+    for record in records:
+        grouped.setdefault(record['view'], []).append(record)
+
+    views = []
+    for name, items in grouped.items():
+        totals = [r['total_ms'] for r in items]
+        sizes = [r['size'] for r in items if r['size'] is not None]
+        worst_dup = max(
+            (dup for r in items for dup in r['duplicates']),
+            key=lambda dup: dup[1],
+            default=None,
+        )
+        views.append({
+            'view': name,
+            'count': len(items),
+            'total_ms': sum(totals),
+            'avg_ms': sum(totals) / len(items),
+            'p95_ms': _percentile(totals, 95),
+            'max_ms': max(totals),
+            'avg_sql_count': sum(r['sql_count'] for r in items) / len(items),
+            'max_sql_count': max(r['sql_count'] for r in items),
+            'avg_sql_ms': sum(r['sql_ms'] for r in items) / len(items),
+            'avg_template_ms': sum(r['template_ms'] for r in items) / len(items),
+            'avg_size': sum(sizes) / len(sizes) if sizes else None,
+            'worst_duplicate': worst_dup,
+        })
+    views.sort(key=lambda v: v['total_ms'], reverse=True)
+
+    return {
+        'views': views,
+        'recent': list(reversed(records[-50:])),
+        'requests': len(records),
+        'cprofile_target': target,
+        'cprofile_dumps': dumps,
+    }
+
+
+def reset():
+    with _lock:
+        _history.clear()
+        _cprofile_dumps.clear()
@@ -0,0 +1,291 @@
+"""
+쿼리 실행 계획 점검 (query_audit 명령어)
+
+화면/수집 명령어가 실제로 실행하는 ORM 쿼리를 audit_queries()에 모아
+EXPLAIN QUERY PLAN 결과에서 아래 항목을 찾습니다.
+
+- 전체 스캔: 'SCAN <테이블>' (인덱스 없이 모든 행을 읽음)
+- 임시 B-tree: 'USE TEMP B-TREE FOR ORDER BY / DISTINCT / GROUP BY' (정렬/중복 제거를 위해 결과를 다시 정렬)
+
+문제가 있는 쿼리는 WHERE 조건(같음 → 범위)과 ORDER BY 컬럼으로 인덱스를 제안하고,
+같은 컬럼으로 시작하는 인덱스가 이미 있으면 통계 갱신(sqlite_maintenance)을 안내합니다.
+
+- 조회 값은 고정 예시 값(SAMPLE_*)을 사용합니다. 실행 계획은 값이 아니라 조건 형태와 통계(sqlite_stat1)로 정해지므로
+  운영 DB 복사본처럼 데이터/통계가 있는 DB에서 점검해야 실제와 같은 계획이 나옵니다.
+- 작은 테이블의 전체 스캔, 수십 행 정렬처럼 의도된 항목은 allow에 적어 문제에서 제외합니다.
+- 쿼리를 바꾸거나 새 화면을 추가하면 여기에도 같은 쿼리를 추가합니다.
+"""
+import re
+from collections import namedtuple
+from datetime import date, timedelta
+
+
+SAMPLE_STOCK = '005930'
+SAMPLE_ETF = '069500'
+SAMPLE_MARKET = 'KOSPI'
+SAMPLE_SECTOR = '001'
+SAMPLE_DATE = date(2024, 12, 30)
+SAMPLE_LINK = 'https://example.com/article'
+
+# (이름, 출처, QuerySet, 허용 항목: 실행 계획 문구에 포함되면 문제에서 제외)
+AuditQuery = namedtuple('AuditQuery', ['name', 'source', 'queryset', 'allow'])
+
+# 문제 판단 (SQLite 3.36 이전 'SCAN TABLE x' 형식 포함)
+_FULL_SCAN = re.compile(r'^SCAN (?:TABLE )?(\w+)(?: AS \w+)?$')
+_TEMP_BTREE = re.compile(r'USE TEMP B-TREE FOR (.+)$')
+
+EQUALITY_LOOKUPS = ('exact', 'in', 'isnull')
+RANGE_LOOKUPS = ('gt', 'gte', 'lt', 'lte', 'range')
+
+
+def audit_queries():
+    """점검 대상 쿼리 목록 (AuditQuery)"""
+    from django.db.models import Count, Window
+    from .models import (
+        DailyChart, DailyChartETF, DashboardCard, Financial, Gongsi, IndexChart, IndicatorState, Info,
+        InvestorTrend, LatestQuote, MarketTrend, News, Nodaji, Report, Sector, ShortSelling, TelegramMessage, YoutubeVideo,
+    )
+
+    stock = SAMPLE_STOCK
+    market = SAMPLE_MARKET
+    day = SAMPLE_DATE
+    dates = [day - timedelta(days=i) for i in range(60)]
+    levels = ['super', 'normal', 'incubator']
+
+    return [
+        # === 대시보드 / 종목 목록 ===
+        AuditQuery('index.interest_stocks', 'views.build_index_context',
+                   Info.objects.lean().filter(is_active=True, interest_level__in=levels), ('SCAN info',)),  # 종목 수천 행
+        AuditQuery('index.dashboard_cards', 'views.build_index_context',
+                   DashboardCard.objects.filter(stock__is_active=True, stock__interest_level__in=levels),
+                   ('SCAN dashboard_card', 'SCAN info')),  # 관심종목 수십 개, 종목 수천 행
+
+        AuditQuery('stock_list', 'views.stock_list',
+                   LatestQuote.objects.order_by('-market_cap')[:100], ()),
+        AuditQuery('stock_list.market', 'views.stock_list',
+                   LatestQuote.objects.filter(market=market).order_by('change_rate')[:100], ()),
+        AuditQuery('stock_list.search', 'views.stock_list',
+                   LatestQuote.objects.filter(stock__in=[stock, '000660']).order_by('-trading_value')[:100],
+                   ('TEMP B-TREE FOR ORDER BY',)),  # 검색 결과 종목만 정렬
+
+        # === 종목 상세 / 편집 탭 ===
+        AuditQuery('stock_detail.annual_financials', 'views.stock_detail',
+                   Financial.objects.filter(stock_id=stock, quarter__isnull=True).order_by('-year')[:6], ()),
+        AuditQuery('stock_detail.quarterly_financials', 'views.stock_detail',
+                   Financial.objects.filter(stock_id=stock, quarter__isnull=False).order_by('-year', '-quarter')[:25], ()),
+        AuditQuery('edit.supply', 'views.build_edit_supply_context',
+                   InvestorTrend.objects.filter(stock_id=stock).order_by('-date')[:60], ()),
+        AuditQuery('edit.shortsell', 'views.build_edit_shortsell_context',
+                   ShortSelling.objects.filter(stock_id=stock).order_by('-date')[:60], ()),
+        AuditQuery('edit.disclosure', 'views.build_edit_disclosure_context',
+                   Gongsi.objects.filter(stock_id=stock).order_by('-date')[:20], ()),
+        AuditQuery('edit.report', 'views.build_edit_report_context',
+                   Report.objects.full().filter(stock_id=stock)
+                   .annotate(total_count=Window(Count('id'))).order_by('-date')[:20],
+                   ('TEMP B-TREE FOR ORDER BY',)),  # 총 개수 윈도 함수: 종목별 리포트 전체를 한 번 정렬
+        AuditQuery('edit.report_prices', 'views.build_edit_report_context',
+                   DailyChart.objects.filter(stock_id=stock, date__gte=dates[-1])
+                   .order_by('date').values_list('date', 'closing_price'), ()),
+        AuditQuery('edit.telegram', 'views.build_edit_telegram_context',
+                   TelegramMessage.objects.filter(stock_id=stock), ('TEMP B-TREE FOR ORDER BY',)),  # 종목별 수십 건
+        AuditQuery('edit.news', 'views.build_edit_news_context',
+                   News.objects.filter(stock_id=stock).with_exists(), ('TEMP B-TREE FOR ORDER BY',)),  # 종목별 수십 건
+        AuditQuery('edit.nodaji', 'views.build_edit_nodaji_context',
+                   Nodaji.objects.full().filter(stock_id=stock, title__contains='삼성전자')
+                   .annotate(total_count=Window(Count('id'))).order_by('-date')[:20],
+                   ('TEMP B-TREE FOR ORDER BY',)),  # 총 개수 윈도 함수: 종목별 기사 전체를 한 번 정렬
+        AuditQuery('edit.youtube', 'views.build_edit_youtube_context',
+                   YoutubeVideo.objects.filter(stock_id=stock).with_exists(), ('TEMP B-TREE FOR ORDER BY',)),  # 종목별 수십 건
+        AuditQuery('fetch_more_reports', 'views.fetch_more_reports',
+                   Report.objects.full().filter(stock_id=stock).order_by('-date')[20:41], ()),
+        AuditQuery('fetch_more_reports.prices', 'views.fetch_more_reports',
+                   DailyChart.objects.filter(stock_id=stock, date__in=dates[:20]).values('date', 'closing_price'), ()),
+        AuditQuery('fetch_more_nodaji', 'views.fetch_more_nodaji',
+                   Nodaji.objects.full().filter(stock_id=stock, title__contains='삼성전자').order_by('-date')[20:41], ()),
+        AuditQuery('prompt_data.youtube', 'views.fetch_stock_prompt_data',
+                   YoutubeVideo.objects.full().filter(stock_id=stock).order_by('-id')[:5], ()),
+
+        # === 차트 ===
+        AuditQuery('signal_chart', 'views.signal_chart_data',
+                   DailyChart.objects.filter(stock_id=stock).order_by('-date')[:120], ()),
+        AuditQuery('etf_signal_chart', 'views.etf_signal_chart_data',
+                   DailyChartETF.objects.filter(etf_id=SAMPLE_ETF).order_by('-date')[:120], ()),
+
+        # === 시황 ===
+        AuditQuery('market.index_chart', 'views.build_market_context',
+                   IndexChart.objects.filter(code=market).order_by('-date')[:240], ()),
+        AuditQuery('market.trend', 'views.build_market_context',
+                   MarketTrend.objects.filter(market=market).order_by('-date')[:120], ()),
+
+        # === 섹터 ===
+        AuditQuery('sector.latest_date', 'views.build_sector_context',
+                   Sector.objects.filter(market=market).order_by('-date').values_list('date', flat=True)[:1], ()),
+        AuditQuery('sector.latest_rows', 'views.build_sector_context',
+                   Sector.objects.filter(market=market, date=day).order_by('-foreign_net_buying'),
+                   ('TEMP B-TREE FOR ORDER BY',)),  # 하루치 업종 수십 행 정렬
+        AuditQuery('sector.chart_dates', 'views.build_sector_context',
+                   Sector.objects.filter(market=market).values_list('date', flat=True).distinct().order_by('-date')[:60],
+                   ()),
+        AuditQuery('sector.chart_names', 'views.build_sector_context',
+                   Sector.objects.filter(market=market, date=day).values_list('code', 'name'),
+                   ('TEMP B-TREE FOR RIGHT PART OF ORDER BY',)),  # 하루치 업종 수십 행 정렬
+        AuditQuery('sector.chart_series', 'views.build_sector_context',
+                   Sector.objects.filter(market=market, code=SAMPLE_SECTOR, date__in=dates).order_by('date')
+                   .values('date', 'individual_net_buying', 'foreign_net_buying', 'institution_net_buying'), ()),
+        AuditQuery('sector_date_data', 'views.sector_date_data',
+                   Sector.objects.filter(market=market, code=SAMPLE_SECTOR).order_by('-date')[:10], ()),
+
+        # === 수집 명령어 (get/exists는 정렬을 제거하므로 order_by()로 같은 쿼리 재현) ===
+        AuditQuery('save_daily_chart.upsert', 'save_daily_chart (update_or_create)',
+                   DailyChart.objects.filter(stock_id=stock, date=day).order_by(), ()),
+        AuditQuery('save_sector.trading_dates', 'save_sector, views.refresh_sector',
+                   DailyChart.objects.values_list('date', flat=True).distinct().order_by('-date')[:60], ()),
+        AuditQuery('save_fnguide_report.exists', 'save_fnguide_report',
+                   Report.objects.filter(stock_id=stock, date=day, title='제목').order_by().values('pk')[:1], ()),
+        AuditQuery('save_nodaji_stock.exists', 'save_nodaji_stock',
+                   Nodaji.objects.filter(link=SAMPLE_LINK).order_by().values('pk')[:1], ()),
+        AuditQuery('save_gongsi_stock.exists', 'save_gongsi_stock',
+                   Gongsi.objects.filter(link=SAMPLE_LINK).order_by().values('pk')[:1], ()),
+        AuditQuery('news_save.exists', 'views.news_save',
+                   News.objects.filter(stock_id=stock, link=SAMPLE_LINK).order_by().values('pk')[:1], ()),
+        AuditQuery('indicators.bars', 'indicators.build_state',
+                   DailyChart.objects.filter(stock_id=stock).order_by('date')
+                   .values('date', 'opening_price', 'high_price', 'low_price', 'closing_price', 'trading_volume'), ()),
+        AuditQuery('indicators.states', 'indicators (관심종목 상태 조회)',
+                   IndicatorState.objects.filter(stock__in=[stock]).values_list('stock_id', 'state'), ()),
+        AuditQuery('cube.new_dates', 'cube.append_cube',
+                   DailyChart.objects.filter(date__gte=day).values_list('date', flat=True).distinct().order_by('date'),
+                   ()),
+
+        # === 보관 기간 정리 ===
+        AuditQuery('apply_retention.chunk', 'retention.delete_chunked',
+                   DailyChart.objects.order_by().filter(date__lte=day).values_list('pk', flat=True)[:5000], ()),
+        AuditQuery('apply_retention.delisted', 'retention.delete_chunked (--delisted)',
+                   DailyChart.objects.order_by().filter(stock__in=[stock]).values_list('pk', flat=True)[:5000], ()),
+    ]
+
+
+def explain(queryset):
+    """EXPLAIN QUERY PLAN 결과 (실행 계획 문구 목록, 들여쓰기로 단계 표시)"""
+    from django.db import connections
+
+    connection = connections[queryset.db]
+    sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    with connection.cursor() as cursor:
+        cursor.execute(f'EXPLAIN QUERY PLAN {sql}', params)
+        rows = cursor.fetchall()
+
+    depth = {0: -1}
+    plan = []
+    for node_id, parent, _, detail in rows:
+        depth[node_id] = depth.get(parent, -1) + 1
+        plan.append('  ' * depth[node_id] + detail)
+    return plan
+
+
+def scanned_tables(plan):
+    """실행 계획에서 전체 스캔한 테이블 이름"""
+    return [m.group(1) for m in (_FULL_SCAN.match(line.strip()) for line in plan) if m]
+
+
+def find_issues(plan, allow=()):
+    """실행 계획에서 전체 스캔 / 임시 B-tree 항목 (allow에 포함된 문구는 제외)"""
+    issues = []
+    for line in plan:
+        detail = line.strip()
+        if any(text in detail for text in allow):
+            continue
+        scan = _FULL_SCAN.match(detail)
+        if scan:
+            issues.append(f'전체 스캔: {scan.group(1)}')
+            continue
+        temp = _TEMP_BTREE.search(detail)
+        if temp:
+            issues.append(f'임시 B-tree: {temp.group(1)}')
+    return issues
+
+
+def _where_columns(node, alias):
+    """WHERE 조건의 기준 테이블 컬럼 (같음 조건, 범위 조건, LIKE 등 기타 조건)"""
+    equality, ranges, other = [], [], []
+    for child in node.children:
+        if hasattr(child, 'children'):
+            child_eq, child_range, child_other = _where_columns(child, alias)
+            if node.connector == 'AND' and not node.negated:
+                equality += child_eq
+                ranges += child_range
+            other += child_other
+            continue
+        target = getattr(child.lhs, 'target', None)
+        if target is None or getattr(child.lhs, 'alias', None) != alias:
+            continue
+        if node.negated or node.connector != 'AND':
+            other.append(target.name)
+        elif child.lookup_name in EQUALITY_LOOKUPS:
+            equality.append(target.name)
+        elif child.lookup_name in RANGE_LOOKUPS:
+            ranges.append(target.name)
+        else:
+            other.append(target.name)
+    return equality, ranges, other
+
+
+def _order_columns(query):
+    """ORDER BY 필드 ('-date' 형식, 관계 필드 경유 정렬은 제외)"""
+    meta = query.get_meta()
+    order_by = query.order_by or (meta.ordering if query.default_ordering else ())
+    fields = []
+    for item in order_by:
+        if not isinstance(item, str) or '__' in item or item.lstrip('-') == '?':
+            break
+        name = item.lstrip('-')
+        if name == 'pk':
+            name = meta.pk.name
+        fields.append(('-' if item.startswith('-') else '') + name)
+    return fields
+
+
+def propose_index(queryset):
+    """
+    인덱스 제안 (같음 조건 → 범위 조건 1개 → 정렬 순서)
+
+    Returns:
+        list[str] | None: models.Index(fields=...)에 넣을 필드 목록
+        (LIKE '%...%'처럼 인덱스를 쓸 수 없는 조건만 있으면 None)
+    """
+    query = queryset.query
+    equality, ranges, _ = _where_columns(query.where, query.get_initial_alias())
+    fields = list(dict.fromkeys(equality))
+    if ranges:
+        fields.append(ranges[0])
+    elif not (query.distinct and query.values_select):
+        fields += [f for f in _order_columns(query) if f.lstrip('-') not in fields]
+    if query.distinct and query.values_select:
+        fields += [f for f in query.values_select if f not in fields]
+    return fields or None
+
+
+def index_columns(model, fields):
+    """필드 목록 → DB 컬럼 목록 (정렬 방향 제외)"""
+    return [model._meta.get_field(f.lstrip('-')).column for f in fields]
+
+
+def existing_indexes(model):
+    """테이블의 인덱스 {이름: 컬럼 목록} (기본 키, unique 포함)"""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+    return {
+        name: info['columns'] for name, info in constraints.items()
+        if info['columns'] and (info['index'] or info['primary_key'] or info['unique'])
+    }
+
+
+def covering_index(model, fields):
+    """제안 컬럼으로 시작하는 기존 인덱스 이름 (없으면 None)"""
+    columns = index_columns(model, fields)
+    for name, index_cols in existing_indexes(model).items():
+        if index_cols[:len(columns)] == columns:
+            return name
+    return None
@@ -0,0 +1,122 @@
+"""
+종목별 최신 시세 스냅샷 (LatestQuote) 갱신
+
+종목 목록(stock_list)의 정렬/필터를 Info 전체 정렬 대신 LatestQuote의 정렬 컬럼 인덱스로 처리합니다.
+
+- 최신 봉: 종목별 마지막 일봉 ((stock, -date) 인덱스로 종목당 1행), 등락률은 전일대비로 계산
+- 52주 고가/저가: 마지막 일봉 일자 기준 365일 이내 일봉 (최신 일자가 같은 종목끼리 묶어 GROUP BY 1번)
+- 일봉이 없는 종목: Info의 현재가/전일대비/등락율/거래량 (save_stock_info 수집값)
+- 시가총액/PER/PBR/ROE: Info
+- 활성 종목만 보관 (비활성 종목 행은 삭제)
+
+갱신 시점: save_daily_chart, save_stock_info, save_stock_list 완료 후, 종목 새로고침(refresh.save_all) 후
+재구축: python manage.py build_latest_quote
+"""
+from collections import defaultdict
+from datetime import timedelta
+from decimal import Decimal
+
+
+HIGH_LOW_DAYS = 365  # 52주 고가/저가 기간 (달력 기준)
+
+INFO_FIELDS = ('name', 'market', 'market_cap', 'per', 'pbr', 'roe')
+QUOTE_FIELDS = (
+    'date', 'close_price', 'price_change', 'change_rate', 'volume', 'trading_value', 'high_52w', 'low_52w',
+)
+
+
+def change_rate_of(close, change):
+    """전일대비 → 등락률 (%, 소수 2자리)"""
+    if close is None or change is None or close == change:
+        return None
+    return (Decimal(change) * 100 / Decimal(close - change)).quantize(Decimal('0.01'))
+
+
+def last_bars(codes_by_date):
+    """
+    최신 일자별 종목 → 마지막 일봉 + 52주 고가/저가
+
+    Args:
+        codes_by_date: {최신 일봉 일자: [종목코드, ...]}
+
+    Returns:
+        dict: {종목코드: dict(close_price, price_change, volume, trading_value, high_52w, low_52w)}
+    """
+    from django.db.models import Max, Min
+    from .models import DailyChart
+
+    bars = {}
+    for day, codes in codes_by_date.items():
+        for code, close, change, volume, value in (
+            DailyChart.objects.filter(stock__in=codes, date=day).order_by()
+            .values_list('stock_id', 'closing_price', 'price_change', 'trading_volume', 'trading_value')
+        ):
+            bars[code] = {
+                'close_price': close,
+                'price_change': change,
+                'volume': volume,
+                'trading_value': value,
+            }
+        for code, high, low in (
+            DailyChart.objects.filter(stock__in=codes, date__gt=day - timedelta(days=HIGH_LOW_DAYS), date__lte=day)
+            .order_by().values('stock_id').annotate(high=Max('high_price'), low=Min('low_price'))
+            .values_list('stock_id', 'high', 'low')
+        ):
+            if code in bars:
+                bars[code].update(high_52w=high, low_52w=low)
+    return bars
+
+
+def refresh_latest_quotes(codes=None):
+    """
+    최신 시세 스냅샷 일괄 갱신 (bulk upsert 1번)
+
+    Args:
+        codes: 갱신할 종목코드 목록 (None이면 전체)
+
+    Returns:
+        int: 갱신한 종목 수
+    """
+    from django.db import transaction
+    from django.db.models import OuterRef, Subquery
+    from .models import DailyChart, Info, LatestQuote
+
+    stocks = Info.objects.filter(is_active=True)
+    stale = LatestQuote.objects.exclude(stock__is_active=True)
+    if codes is not None:
+        stocks = stocks.filter(code__in=codes)
+        stale = stale.filter(stock__in=codes)
+
+    last_date = DailyChart.objects.filter(stock=OuterRef('pk')).order_by('-date').values('date')[:1]
+    infos = list(stocks.order_by().annotate(last_date=Subquery(last_date)).values(
+        'code', 'last_date', 'current_price', 'price_change', 'change_rate', 'volume', *INFO_FIELDS,
+    ))
+
+    codes_by_date = defaultdict(list)
+    for info in infos:
+        if info['last_date']:
+            codes_by_date[info['last_date']].append(info['code'])
+    bars = last_bars(codes_by_date)
+
+    quotes = []
+    for info in infos:
+        bar = bars.get(info['code'])
+        if bar:
+            quote = dict(bar, date=info['last_date'], change_rate=change_rate_of(bar['close_price'], bar['price_change']))
+        else:
+            quote = {
+                'close_price': info['current_price'],
+                'price_change': info['price_change'],
+                'change_rate': info['change_rate'],
+                'volume': info['volume'],
+            }
+        quotes.append(LatestQuote(stock_id=info['code'], **{f: info[f] for f in INFO_FIELDS}, **quote))
+
+    with transaction.atomic():
+        if quotes:
+            LatestQuote.objects.bulk_create(
+                quotes, update_conflicts=True, unique_fields=['stock'],
+                update_fields=INFO_FIELDS + QUOTE_FIELDS + ('updated_at',),
+            )
+        stale.delete()
+    return len(quotes)
@@ -0,0 +1,290 @@
+"""
+종목 새로고침 (키움 API 기본정보 + 수급 + 공매도)
+
+종목 하나당 키움 API 3개(ka10001, ka10059, ka10014)를 순서대로 호출하던 것을
+스레드 풀에서 동시에 호출하고, 저장은 트랜잭션 1번으로 묶습니다.
+
+- 호출: 토큰 1개와 requests.Session(연결 재사용)을 모든 호출이 공유
+- 동시성: 여러 종목 새로고침(관심 단계 전체)도 동시 호출 수는 MAX_CONCURRENT_CALLS 이하
+- 저장: 시세는 bulk_update, 수급/공매도는 종목+날짜 upsert(bulk_create) 각 1번
+- 응답: 다시 조회하지 않고 메모리 값으로 생성
+"""
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+
+
+KIWOOM_URL = 'https://api.kiwoom.com/api/dostk'
+REQUEST_TIMEOUT = 10  # 호출당 (초)
+MAX_CONCURRENT_CALLS = 6  # 동시 키움 API 호출 수 (종목 수와 무관)
+MAX_BATCH_CODES = 60  # 여러 종목 새로고침 최대 종목 수
+
+INFO_FIELDS = ('current_price', 'price_change', 'change_rate', 'volume', 'market_cap', 'per', 'pbr')
+INVESTOR_FIELDS = (
+    'individual', 'foreign', 'institution', 'domestic_foreign', 'financial', 'insurance',
+    'investment_trust', 'other_finance', 'bank', 'pension_fund', 'private_fund', 'other_corporation',
+)
+SHORT_FIELDS = (
+    'trading_volume', 'short_volume', 'cumulative_short_volume', 'trading_weight',
+    'short_trading_value', 'short_average_price',
+)
+
+
+def parse_int(value, absolute=False):
+    if not value:
+        return None
+    try:
+        result = int(str(value).replace(',', '').replace('+', ''))
+        return abs(result) if absolute else result
+    except (ValueError, AttributeError):
+        return None
+
+
+def parse_decimal(value):
+    if not value:
+        return None
+    try:
+        return Decimal(str(value).replace(',', '').replace('+', ''))
+    except (InvalidOperation, AttributeError):
+        return None
+
+
+def _find_list(response_data, keys):
+    """응답에서 데이터 배열 찾기 (API마다 키 이름이 다름)"""
+    for key in keys:
+        if key in response_data and isinstance(response_data[key], list):
+            return response_data[key]
+    return None
+
+
+def _latest_items(items):
+    """가장 최근 날짜(dt)의 항목만"""
+    dates = [item.get('dt', '') for item in items if item.get('dt')]
+    if not dates:
+        return []
+    latest_date = max(dates)
+    return [item for item in items if item.get('dt') == latest_date]
+
+
+# ============ API 호출 + 파싱 ============
+
+def _post(session, token, path, api_id, params):
+    """
+    키움 API 호출
+
+    Returns:
+        dict: 응답 JSON
+
+    Raises:
+        RuntimeError: HTTP 오류
+    """
+    headers = {
+        'Content-Type': 'application/json;charset=UTF-8',
+        'authorization': f'Bearer {token}',
+        'cont-yn': 'N',
+        'next-key': '',
+        'api-id': api_id,
+    }
+    response = session.post(f'{KIWOOM_URL}/{path}', headers=headers, json=params, timeout=REQUEST_TIMEOUT)
+    if response.status_code != 200:
+        raise RuntimeError(f'error: {response.status_code}')
+    return response.json()
+
+
+def fetch_info(session, token, code):
+    """기본정보 (ka10001) → Info 필드 dict"""
+    data = _post(session, token, 'stkinfo', 'ka10001', {'stk_cd': code})
+    return {
+        'current_price': parse_int(data.get('cur_prc'), absolute=True),
+        'price_change': parse_int(data.get('pred_pre')),
+        'change_rate': parse_decimal(data.get('flu_rt')),
+        'volume': parse_int(data.get('trde_qty')),
+        'market_cap': parse_int(data.get('mac')),
+        'per': parse_decimal(data.get('per')),
+        'pbr': parse_decimal(data.get('pbr')),
+    }
+
+
+def fetch_investor(session, token, code):
+    """투자자 매매동향 (ka10059) → 최근 날짜 [(date, 필드 dict)]"""
+    params = {
+        'dt': datetime.now().strftime('%Y%m%d'),
+        'stk_cd': code,
+        'amt_qty_tp': '1',
+        'trde_tp': '0',
+        'unit_tp': '1000',
+    }
+    data = _post(session, token, 'stkinfo', 'ka10059', params)
+    items = _find_list(data, ['stk_invsr_orgn', 'invsr_stk_daly', 'stk_invsr_daly', 'data', 'result', 'output'])
+    return [
+        (datetime.strptime(item['dt'], '%Y%m%d').date(), {
+            'individual': parse_int(item.get('ind_invsr')) or 0,
+            'foreign': parse_int(item.get('frgnr_invsr')) or 0,
+            'institution': parse_int(item.get('orgn')) or 0,
+            'domestic_foreign': parse_int(item.get('natfor')) or 0,
+            'financial': parse_int(item.get('fnnc_invt')) or 0,
+            'insurance': parse_int(item.get('insrnc')) or 0,
+            'investment_trust': parse_int(item.get('invtrt')) or 0,
+            'other_finance': parse_int(item.get('etc_fnnc')) or 0,
+            'bank': parse_int(item.get('bank')) or 0,
+            'pension_fund': parse_int(item.get('penfnd_etc')) or 0,
+            'private_fund': parse_int(item.get('samo_fund')) or 0,
+            'other_corporation': parse_int(item.get('etc_corp')) or 0,
+        })
+        for item in _latest_items(items or [])
+    ]
+
+
+def fetch_short(session, token, code):
+    """공매도 (ka10014, 최근 7일 중 최근 날짜) → [(date, 필드 dict)]"""
+    today = datetime.now()
+    params = {
+        'stk_cd': code,
+        'tm_tp': '1',
+        'strt_dt': (today - timedelta(days=7)).strftime('%Y%m%d'),
+        'end_dt': today.strftime('%Y%m%d'),
+    }
+    data = _post(session, token, 'shsa', 'ka10014', params)
+    items = _find_list(data, ['shrts_trnsn', 'data', 'result', 'output'])
+    return [
+        (datetime.strptime(item['dt'], '%Y%m%d').date(), {
+            'trading_volume': parse_int(item.get('trde_qty')) or 0,
+            'short_volume': parse_int(item.get('shrts_qty')) or 0,
+            'cumulative_short_volume': parse_int(item.get('ovr_shrts_qty')) or 0,
+            'trading_weight': parse_decimal(item.get('trde_wght')) or Decimal('0'),
+            'short_trading_value': parse_int(item.get('shrts_trde_prica')) or 0,
+            'short_average_price': parse_int(item.get('shrts_avg_pric')) or 0,
+        })
+        for item in _latest_items(items or [])
+    ]
+
+
+FETCHERS = {
+    'info': fetch_info,
+    'investor': fetch_investor,
+    'short': fetch_short,
+}
+
+
+def fetch_all(codes, token, max_workers=MAX_CONCURRENT_CALLS):
+    """
+    종목별 API 3개를 동시에 호출
+
+    Returns:
+        dict: {종목코드: {'info': 값 또는 예외, 'investor': ..., 'short': ...}}
+    """
+    import requests
+
+    fetched = {code: {} for code in codes}
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            (code, kind): executor.submit(fetcher, session, token, code)
+            for code in codes
+            for kind, fetcher in FETCHERS.items()
+        }
+        for (code, kind), future in futures.items():
+            try:
+                fetched[code][kind] = future.result()
+            except Exception as e:
+                fetched[code][kind] = e
+    return fetched
+
+
+# ============ 저장 ============
+
+def _status(value):
+    """API별 결과 상태 (success / no data / error: ...)"""
+    if isinstance(value, Exception):
+        message = str(value)
+        return message if message.startswith('error') else f'error: {message}'
+    if isinstance(value, list) and not value:
+        return 'no data'
+    return 'success'
+
+
+def save_all(stocks, fetched):
+    """
+    조회 결과를 트랜잭션 1번으로 저장
+
+    Args:
+        stocks: Info 목록 (시세 필드는 메모리에서 갱신됨)
+        fetched: fetch_all 결과
+
+    Returns:
+        dict: {종목코드: {'info': 상태, 'investor': 상태, 'short': 상태}}
+    """
+    from django.db import transaction
+    from django.utils import timezone
+    from .models import Info, InvestorTrend, ShortSelling
+
+    now = timezone.now()
+    results = {}
+    updated = []
+    investor_rows = []
+    short_rows = []
+
+    for stock in stocks:
+        values = fetched[stock.code]
+        info = values['info']
+        if not isinstance(info, Exception):
+            for field, value in info.items():
+                setattr(stock, field, value)
+            stock.updated_at = now  # bulk_update는 auto_now를 적용하지 않음
+            updated.append(stock)
+
+        investor = values['investor']
+        if not isinstance(investor, Exception):
+            investor_rows += [InvestorTrend(stock=stock, date=date, **fields) for date, fields in investor]
+
+        short = values['short']
+        if not isinstance(short, Exception):
+            short_rows += [ShortSelling(stock=stock, date=date, **fields) for date, fields in short]
+
+        results[stock.code] = {kind: _status(value) for kind, value in values.items()}
+
+    with transaction.atomic():
+        if updated:
+            Info.objects.bulk_update(updated, INFO_FIELDS + ('updated_at',))
+        if investor_rows:
+            InvestorTrend.objects.bulk_create(
+                investor_rows, update_conflicts=True,
+                unique_fields=['stock', 'date'], update_fields=INVESTOR_FIELDS,
+            )
+        if short_rows:
+            ShortSelling.objects.bulk_create(
+                short_rows, update_conflicts=True,
+                unique_fields=['stock', 'date'], update_fields=SHORT_FIELDS,
+            )
+    if updated:
+        # 종목 목록용 최신 시세 스냅샷 (시가총액/PER/PBR, 일봉이 없는 종목은 시세)
+        from .quotes import refresh_latest_quotes
+        refresh_latest_quotes([stock.code for stock in updated])
+    return results
+
+
+def price_data(stock):
+    """응답용 시세 (메모리 값)"""
+    return {
+        'current_price': stock.current_price,
+        'price_change': stock.price_change,
+        'change_rate': float(stock.change_rate) if stock.change_rate else None,
+        'volume': stock.volume,
+        'market_cap': stock.market_cap,
+        'per': float(stock.per) if stock.per else None,
+        'pbr': float(stock.pbr) if stock.pbr else None,
+    }
+
+
+def refresh_stocks(stocks, token):
+    """
+    종목들 새로고침 (동시 호출 → 일괄 저장)
+
+    Returns:
+        dict: {종목코드: {'results': API별 상태, 'data': 시세}}
+    """
+    fetched = fetch_all([stock.code for stock in stocks], token)
+    results = save_all(stocks, fetched)
+    return {
+        stock.code: {'results': results[stock.code], 'data': price_data(stock)}
+        for stock in stocks
+    }
@@ -0,0 +1,151 @@
+"""
+시계열 테이블 보관 기간 정리 (apply_retention 명령어)
+
+- 대상: 테이블별 보관 기간(settings.RETENTION_DAYS) 이전 행, 상장폐지 종목/ETF의 전체 행
+- 상장폐지 판단 (유예 기간 settings.RETENTION_DELISTED_GRACE_DAYS가 지난 코드만):
+  종목은 save_stock_list가 목록에서 빠진 날을 기록한 Info.delisted_at 기준
+  (is_active=False는 save_stock_info의 시가총액 미달 비활성화도 포함하므로 단독으로 쓰지 않음),
+  ETF는 비활성(is_active=False)이면서 유예 기간 동안 일봉이 없는 코드
+- 보관: 삭제 전 export.TableExport로 <보관 디렉토리>/<테이블>/ 아래 Parquet(또는 CSV) 파일에 저장
+- 삭제: chunk_size행씩 별도 트랜잭션으로 삭제하고 pause초 쉬어서
+  쓰기 잠금을 오래 잡지 않음 (그 사이 웹 요청/수집 명령어의 쓰기가 진행)
+- 삭제 후 비워진 페이지는 SQLite가 재사용하며, 빈 페이지 비율이 높을 때만 VACUUM
+"""
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+from .export import TableExport
+
+
+DELETE_CHUNK_SIZE = 5000  # 트랜잭션당 삭제 행 수
+DELETE_PAUSE = 0.05       # 청크 사이 대기 (초)
+DELISTED_GRACE_DAYS = 90  # 상장폐지 후 유예 기간 기본값 (settings.RETENTION_DELISTED_GRACE_DAYS)
+
+# 테이블: (데이터 버전, 상장폐지 판단 모델)
+RETENTION_TABLES = {
+    'daily_chart': ('charts', 'Info'),
+    'investor_trend': ('charts', 'Info'),
+    'short_selling': ('charts', 'Info'),
+    'sector': ('sector', None),
+    'market_trend': ('market', None),
+    'daily_chart_etf': ('etf', 'InfoETF'),
+    'weekly_chart_etf': ('etf', 'InfoETF'),
+    'monthly_chart_etf': ('etf', 'InfoETF'),
+}
+
+# OHLCV 큐브로 만드는 테이블 → (자산, 주기) (삭제 후 다음 큐브 갱신 때 재구축)
+CUBE_TABLES = {
+    'daily_chart': ('stock', 'daily'),
+    'daily_chart_etf': ('etf', 'daily'),
+    'weekly_chart_etf': ('etf', 'weekly'),
+    'monthly_chart_etf': ('etf', 'monthly'),
+}
+
+
+def get_cutoff(days, today=None):
+    """보관 기간 이전 마지막 날짜 (이 날짜까지 삭제 대상, days가 0/None이면 None)"""
+    if not days:
+        return None
+    return (today or date.today()) - timedelta(days=days + 1)
+
+
+def delisted_codes(table, grace_days=DELISTED_GRACE_DAYS, today=None):
+    """
+    유예 기간이 지난 상장폐지 종목/ETF 코드 (판단 모델이 없는 테이블은 빈 목록)
+
+    - 종목: is_active=False이고 delisted_at(save_stock_list 기록)이 유예 기간 이전
+    - ETF: is_active=False이고 마지막 일봉이 유예 기간 이전 (일봉이 없으면 제외)
+    """
+    from django.db.models import Max
+    from .models import DailyChartETF, Info
+
+    owner = RETENTION_TABLES[table][1]
+    if owner is None:
+        return []
+    since = (today or date.today()) - timedelta(days=grace_days)
+    if owner == 'Info':
+        return list(
+            Info.objects.filter(is_active=False, delisted_at__isnull=False, delisted_at__lte=since)
+            .values_list('code', flat=True)
+        )
+    return list(
+        DailyChartETF.objects.filter(etf__is_active=False).order_by()
+        .values('etf_id').annotate(last_date=Max('date')).filter(last_date__lte=since)
+        .values_list('etf_id', flat=True)
+    )
+
+
+def expired_exports(table, days=None, delisted=False, grace_days=DELISTED_GRACE_DAYS, today=None):
+    """
+    삭제 대상 조건 목록
+
+    Returns:
+        list[(설명, TableExport)]: 보관 기간 이전 행, 상장폐지 코드 행 순서
+        (두 조건이 겹치는 행은 앞 조건에서 이미 삭제되므로 한 번만 보관/삭제)
+    """
+    exports = []
+    cutoff = get_cutoff(days, today)
+    if cutoff:
+        exports.append((f'{cutoff}까지', TableExport(table, end=cutoff)))
+    if delisted:
+        codes = delisted_codes(table, grace_days, today)
+        if codes:
+            exports.append((f'상장폐지 {len(codes)}개', TableExport(table, codes=codes)))
+    return exports
+
+
+def archive_path(export, fmt, directory):
+    """
+    보관 파일 경로 (실행 시각을 붙여 덮어쓰지 않음)
+
+    예: archive/daily_chart/daily_chart-to20231018-20261019153000.parquet (보관 기간 이전)
+        archive/daily_chart/daily_chart-delisted-20261019153000.parquet (상장폐지)
+    """
+    folder = Path(directory) / export.table
+    folder.mkdir(parents=True, exist_ok=True)
+    scope = f'to{export.end:%Y%m%d}' if export.end else 'delisted'
+    return folder / f'{export.table}-{scope}-{time.strftime("%Y%m%d%H%M%S")}.{fmt}'
+
+
+def write_archive(export, fmt, directory):
+    """조건에 맞는 행을 보관 파일로 저장 (임시 파일에 쓴 뒤 이름 변경) → 경로"""
+    path = archive_path(export, fmt, directory)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            for chunk in export.chunks(fmt):
+                f.write(chunk)
+        tmp_path.replace(path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return path
+
+
+def delete_chunked(queryset, chunk_size=DELETE_CHUNK_SIZE, pause=DELETE_PAUSE):
+    """
+    조건에 맞는 행을 chunk_size행씩 삭제 (청크마다 커밋)
+
+    Returns:
+        int: 삭제 행 수
+    """
+    from django.db import transaction
+
+    model = queryset.model
+    deleted = 0
+    while True:
+        pks = list(queryset.values_list('pk', flat=True)[:chunk_size])
+        if not pks:
+            return deleted
+        with transaction.atomic():
+            deleted += model.objects.filter(pk__in=pks).delete()[0]
+        if pause:
+            time.sleep(pause)
+
+
+def free_page_ratio(cursor):
+    """DB 전체 페이지 중 빈 페이지 비율"""
+    page_count = cursor.execute('PRAGMA page_count').fetchone()[0]
+    freelist_count = cursor.execute('PRAGMA freelist_count').fetchone()[0]
+    return freelist_count / page_count if page_count else 0.0
@@ -0,0 +1,330 @@
+"""
+저장된 텍스트 통합 검색 (SQLite FTS5)
+
+종목 기업분석/메모, 텔레그램 메시지, 뉴스, 리포트, 노다지, 유튜브 요약을
+FTS5 가상 테이블 search_index 하나에 모아 색인합니다 (migrations/0062_search_index.py).
+
+- 토크나이저: trigram (형태소 분석 없이 3글자 단위 부분 문자열 색인)
+  → '삼성전자' 검색 시 '삼성전자는', '삼성전자의' 등 조사가 붙은 어절도 일치
+- 3글자 이상 검색어: MATCH (색인 조회, bm25 순위, FTS 스니펫)
+- 1~2글자 검색어 (예: '원전'): 색인 테이블 LIKE (원본 테이블 대신 색인 테이블만 스캔)
+- 동기화: 모델 post_save / post_delete 시그널 (apps.StocksConfig.ready에서 연결)
+  bulk_create/update()는 시그널이 없으므로 rebuild_search_index 명령어로 전체 재색인
+- rowid = 원본 키 * 16 + 종류 번호 → 저장/삭제 시 rowid로 바로 교체
+"""
+import re
+from html import escape, unescape
+
+
+TABLE = 'search_index'
+MIN_MATCH_LENGTH = 3  # trigram 색인으로 찾을 수 있는 최소 글자 수
+MARK_START, MARK_END = '\x02', '\x03'  # 스니펫 강조 표시 (HTML 이스케이프 후 <mark>로 변환)
+SNIPPET_CHARS = 80
+
+_TAG_RE = re.compile(r'<[^>]+>')
+_SPACE_RE = re.compile(r'\s+')
+
+
+def html_to_text(value):
+    """HTML 본문(메모 등)을 색인용 텍스트로"""
+    if not value:
+        return ''
+    return _SPACE_RE.sub(' ', unescape(_TAG_RE.sub(' ', value))).strip()
+
+
+def _join(*parts):
+    return '\n'.join(part for part in parts if part)
+
+
+def _created_date(obj):
+    return obj.created_at.date().isoformat() if obj.created_at else ''
+
+
+# ============ 색인 대상 ============
+# 종류: (번호, 모델, 표시 이름, 문서 함수)
+# 문서 함수: 인스턴스 → dict(title, body, stock_code, sector_id, date) 또는 None (색인 안 함)
+# 과거 모델(마이그레이션)에서도 쓰이므로 필드 값만 사용
+
+def _stock_doc(obj):
+    body = _join(obj.analysis_text, html_to_text(obj.memo))
+    if not body:
+        return None
+    return {'title': obj.name, 'body': body, 'stock_code': obj.code, 'date': obj.memo_updated_at or obj.analysis_updated_at}
+
+
+def _telegram_doc(obj):
+    return {'title': obj.channel_name or obj.channel, 'body': _join(obj.text, obj.summary), 'stock_code': obj.stock_id, 'date': obj.date}
+
+
+def _sector_telegram_doc(obj):
+    return {'title': obj.channel_name or obj.channel, 'body': _join(obj.text, obj.summary), 'sector_id': obj.sector_id, 'date': obj.date}
+
+
+def _news_doc(obj):
+    return {'title': obj.title, 'body': _join(obj.source, obj.summary), 'stock_code': obj.stock_id, 'date': _created_date(obj)}
+
+
+def _sector_news_doc(obj):
+    return {'title': obj.title, 'body': _join(obj.source, obj.summary), 'sector_id': obj.sector_id, 'date': _created_date(obj)}
+
+
+def _report_doc(obj):
+    return {'title': obj.title, 'body': _join(obj.provider, obj.author, obj.summary), 'stock_code': obj.stock_id, 'date': obj.date}
+
+
+def _nodaji_doc(obj):
+    return {'title': obj.title, 'body': obj.summary, 'stock_code': obj.stock_id, 'date': obj.date}
+
+
+def _youtube_doc(obj):
+    return {'title': obj.title, 'body': _join(obj.channel, obj.summary), 'stock_code': obj.stock_id, 'date': _created_date(obj)}
+
+
+def _sector_youtube_doc(obj):
+    return {'title': obj.title, 'body': _join(obj.channel, obj.summary), 'sector_id': obj.sector_id, 'date': _created_date(obj)}
+
+
+SOURCES = {
+    'stock': (1, 'Info', '기업분석/메모', _stock_doc),
+    'telegram': (2, 'TelegramMessage', '텔레그램', _telegram_doc),
+    'sector_telegram': (3, 'SectorTelegramMessage', '섹터 텔레그램', _sector_telegram_doc),
+    'news': (4, 'News', '뉴스', _news_doc),
+    'sector_news': (5, 'SectorNews', '섹터 뉴스', _sector_news_doc),
+    'report': (6, 'Report', '리포트', _report_doc),
+    'nodaji': (7, 'Nodaji', '노다지', _nodaji_doc),
+    'youtube': (8, 'YoutubeVideo', '유튜브', _youtube_doc),
+    'sector_youtube': (9, 'SectorYoutubeVideo', '섹터 유튜브', _sector_youtube_doc),
+}
+
+
+def _rowid(kind, pk):
+    """원본 키 → rowid (종목코드는 영숫자라 36진수로 변환)"""
+    key = pk if isinstance(pk, int) else int(str(pk), 36)
+    return key * 16 + SOURCES[kind][0]
+
+
+def _row(kind, obj):
+    doc = SOURCES[kind][3](obj)
+    if doc is None:
+        return None
+    return (
+        _rowid(kind, obj.pk), doc.get('title') or '', doc.get('body') or '', kind, str(obj.pk),
+        doc.get('stock_code'), doc.get('sector_id'), str(doc.get('date') or ''),
+    )
+
+
+INSERT_SQL = (
+    f'INSERT INTO {TABLE} (rowid, title, body, kind, object_id, stock_code, sector_id, date) '
+    'VALUES (%s, %s, %s, %s, %s, %s, %s, %s)'
+)
+
+
+# ============ 동기화 ============
+
+def index_object(kind, obj):
+    """문서 1개 색인 (기존 문서 교체, 색인할 내용이 없으면 삭제만)"""
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE rowid = %s', [_rowid(kind, obj.pk)])
+        row = _row(kind, obj)
+        if row is not None:
+            cursor.execute(INSERT_SQL, row)
+
+
+def remove_object(kind, pk):
+    from django.db import connection
+
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {TABLE} WHERE rowid = %s', [_rowid(kind, pk)])
+
+
+def connect_signals():
+    """원본 모델 저장/삭제 시 색인 갱신 (StocksConfig.ready)"""
+    from django.apps import apps
+    from django.db.models.signals import post_delete, post_save
+
+    for kind, (_, model_name, _, _) in SOURCES.items():
+        model = apps.get_model('stocks', model_name)
+
+        def on_save(sender, instance, raw=False, kind=kind, **kwargs):
+            if not raw:  # loaddata 제외
+                index_object(kind, instance)
+
+        def on_delete(sender, instance, kind=kind, **kwargs):
+            remove_object(kind, instance.pk)
+
+        post_save.connect(on_save, sender=model, weak=False, dispatch_uid=f'search_index_save_{kind}')
+        post_delete.connect(on_delete, sender=model, weak=False, dispatch_uid=f'search_index_delete_{kind}')
+
+
+def rebuild(get_model=None, kinds=None, batch_size=1000):
+    """
+    전체 재색인
+
+    Args:
+        get_model: 모델 조회 함수 (마이그레이션에서는 apps.get_model)
+        kinds: SOURCES 키 목록 (기본값: 전체)
+
+    Returns:
+        dict: {종류: 색인 문서 수}
+    """
+    from django.db import connection, transaction
+
+    if get_model is None:
+        from django.apps import apps
+        get_model = apps.get_model
+
+    counts = {}
+    with transaction.atomic(), connection.cursor() as cursor:
+        for kind in kinds or SOURCES:
+            model_name = SOURCES[kind][1]
+            cursor.execute(f'DELETE FROM {TABLE} WHERE kind = %s', [kind])
+            batch = []
+            counts[kind] = 0
+            # _base_manager: 본문(summary 등) 기본 defer 없이 조회 (행마다 추가 쿼리 방지)
+            for obj in get_model('stocks', model_name)._base_manager.all().iterator(chunk_size=batch_size):
+                row = _row(kind, obj)
+                if row is None:
+                    continue
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    cursor.executemany(INSERT_SQL, batch)
+                    counts[kind] += len(batch)
+                    batch = []
+            if batch:
+                cursor.executemany(INSERT_SQL, batch)
+                counts[kind] += len(batch)
+        cursor.execute(f"INSERT INTO {TABLE}({TABLE}) VALUES ('optimize')")
+    return counts
+
+
+# ============ 검색 ============
+
+def parse_query(query):
+    """검색어 → (MATCH 식 또는 None, LIKE로 찾을 짧은 검색어 목록), 공백 구분 검색어는 모두 포함(AND)"""
+    terms = [term.replace('"', '') for term in (query or '').split()]
+    terms = [term for term in terms if term]
+    long_terms = [term for term in terms if len(term) >= MIN_MATCH_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_MATCH_LENGTH]
+    match = ' AND '.join(f'"{term}"' for term in long_terms) or None
+    return match, short_terms
+
+
+def _where(match, short_terms, kinds, stock_code, sector_id):
+    clauses, params = [], []
+    if match:
+        clauses.append(f'{TABLE} MATCH %s')
+        params.append(match)
+    for term in short_terms:
+        like = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+        clauses.append("(title LIKE %s ESCAPE '\\' OR body LIKE %s ESCAPE '\\')")
+        params += [like, like]
+    if kinds:
+        clauses.append(f'kind IN ({", ".join(["%s"] * len(kinds))})')
+        params += list(kinds)
+    if stock_code:
+        clauses.append('stock_code = %s')
+        params.append(stock_code)
+    if sector_id:
+        clauses.append('sector_id = %s')
+        params.append(sector_id)
+    return ' AND '.join(clauses), params
+
+
+def _mark_terms(text, terms):
+    """텍스트에서 검색어 위치를 강조 표시 (FTS 스니펫에 없는 짧은 검색어용)"""
+    if not terms or not text:
+        return text
+    pattern = re.compile('|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    return pattern.sub(lambda m: f'{MARK_START}{m.group(0)}{MARK_END}', text)
+
+
+def _excerpt(text, terms):
+    """첫 검색어 주변 SNIPPET_CHARS 글자"""
+    lowered = text.lower()
+    positions = [lowered.find(term.lower()) for term in terms]
+    positions = [p for p in positions if p >= 0]
+    start = max(0, min(positions) - SNIPPET_CHARS // 3) if positions else 0
+    excerpt = text[start:start + SNIPPET_CHARS]
+    return ('…' if start else '') + excerpt + ('…' if start + SNIPPET_CHARS < len(text) else '')
+
+
+def to_html(marked):
+    """강조 표시 텍스트 → HTML (<mark>)"""
+    return escape(marked).replace(MARK_START, '<mark>').replace(MARK_END, '</mark>')
+
+
+def search(query, kinds=None, stock_code=None, sector_id=None, limit=30):
+    """
+    통합 검색
+
+    Returns:
+        list[dict]: kind, object_id, stock_code, sector_id, date, title_html, snippet_html
+        (MATCH 검색어가 있으면 bm25 순위, 짧은 검색어만 있으면 최신순)
+    """
+    from django.db import connection
+
+    match, short_terms = parse_query(query)
+    if not match and not short_terms:
+        return []
+
+    where, params = _where(match, short_terms, kinds, stock_code, sector_id)
+    if match:
+        # 제목 일치에 가중치 5배
+        columns = (
+            f"highlight({TABLE}, 0, '{MARK_START}', '{MARK_END}'), "
+            f"snippet({TABLE}, 1, '{MARK_START}', '{MARK_END}', '…', 24)"
+        )
+        order = f'bm25({TABLE}, 5.0, 1.0)'
+    else:
+        columns = 'title, body'
+        order = 'date DESC, rowid DESC'
+
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT kind, object_id, stock_code, sector_id, date, {columns} '
+            f'FROM {TABLE} WHERE {where} ORDER BY {order} LIMIT %s',
+            params + [limit]
+        )
+        rows = cursor.fetchall()
+
+    results = []
+    for kind, object_id, code, sector, date, title, body in rows:
+        if not match:
+            body = _excerpt(body, short_terms)
+        results.append({
+            'kind': kind,
+            'kind_label': SOURCES[kind][2],
+            'object_id': object_id,
+            'stock_code': code,
+            'sector_id': int(sector) if sector else None,
+            'date': date,
+            'title_html': to_html(_mark_terms(title, short_terms)),
+            'snippet_html': to_html(_mark_terms(body, short_terms)),
+        })
+    return results
+
+
+def mentioned_stocks(query, kinds=None, limit=30):
+    """
+    검색어가 들어간 문서가 연결된 종목 (문서 수 많은 순)
+
+    Returns:
+        list[tuple]: [(종목코드, 문서 수)]
+    """
+    from django.db import connection
+
+    match, short_terms = parse_query(query)
+    if not match and not short_terms:
+        return []
+
+    where, params = _where(match, short_terms, kinds, None, None)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT stock_code, COUNT(*) AS mentions FROM {TABLE} '
+            f'WHERE {where} AND stock_code IS NOT NULL '
+            'GROUP BY stock_code ORDER BY mentions DESC, stock_code LIMIT %s',
+            params + [limit]
+        )
+        return cursor.fetchall()
@@ -0,0 +1,220 @@
+"""
+종목/ETF 이름 검색 인덱스 (프로세스 메모리, 자동완성용)
+
+Info(종목)와 InfoETF(ETF)의 코드/이름으로 만든 인덱스에서 검색하므로 입력할 때마다 DB를 조회하지 않습니다.
+
+- 접두어: 정렬된 키 배열 + bisect (노드 객체 없이 펼친 트라이, 메모리 1MB 내외)
+- 부분 일치: 2글자(n-gram) → 항목 목록, 검색어의 가장 드문 2글자 목록만 확인
+- 초성: 'ㅅㅅㅈㅈ' → 삼성전자, 'skㅎㅇ' → SK하이닉스 (초성만 입력하면 초성 키로 검색)
+- 순위: 정확히 일치 > 접두어 > 부분 일치, 같은 그룹은 시가총액 순
+  (항목 번호 = 시가총액 순위라 heapq.nsmallest로 상위 N개만 선택)
+- 갱신: 'stock_info', 'etf' 데이터 버전이 바뀌면 재구축 (save_stock_list, save_stock_info, ETF 추가/삭제 등)
+  버전 확인은 VERSION_CHECK_INTERVAL초에 한 번 (그 사이 검색은 DB 접근 없음)
+"""
+import heapq
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict, namedtuple
+
+
+VERSION_CHECK_INTERVAL = 10  # 데이터 버전 확인 주기 (초)
+DATASETS = ('stock_info', 'etf')
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_CHOSEONG_SET = frozenset(CHOSEONG)
+_HANGUL_START, _HANGUL_END = 0xAC00, 0xD7A3
+
+Entry = namedtuple('Entry', ['code', 'name', 'market', 'kind', 'market_cap', 'is_active'])
+
+
+def normalize(text):
+    """소문자, 공백 제거"""
+    return ''.join((text or '').lower().split())
+
+
+def to_choseong(text):
+    """한글 음절은 초성으로, 나머지 글자는 그대로 ('SK하이닉스' → 'skㅎㅇㄴㅅ')"""
+    chars = []
+    for char in normalize(text):
+        code = ord(char)
+        if _HANGUL_START <= code <= _HANGUL_END:
+            chars.append(CHOSEONG[(code - _HANGUL_START) // 588])
+        else:
+            chars.append(char)
+    return ''.join(chars)
+
+
+def is_choseong_query(query):
+    """초성 검색어 여부 (초성이 하나 이상 있고 완성형 음절이 없음)"""
+    has_choseong = False
+    for char in query:
+        if char in _CHOSEONG_SET:
+            has_choseong = True
+        elif _HANGUL_START <= ord(char) <= _HANGUL_END:
+            return False
+    return has_choseong
+
+
+def _grams(key):
+    """부분 일치용 n-gram (1글자 키는 그대로, 그 외 2글자)"""
+    if len(key) < 2:
+        return {key} if key else set()
+    return {key[i:i + 2] for i in range(len(key) - 1)}
+
+
+class _KeyIndex:
+    """키 종류 1개(이름+코드 / 초성)의 접두어 배열 + n-gram 목록"""
+
+    def __init__(self, keys_by_entry):
+        # keys_by_entry: [(항목 번호, [키, ...])]
+        self.keys = {}
+        pairs = []
+        grams = defaultdict(list)
+        chars = defaultdict(list)
+        for entry_id, keys in keys_by_entry:
+            keys = [key for key in keys if key]
+            self.keys[entry_id] = keys
+            for key in keys:
+                pairs.append((key, entry_id))
+                for gram in _grams(key):
+                    grams[gram].append(entry_id)
+                for char in set(key):
+                    chars[char].append(entry_id)
+        pairs.sort()
+        self.prefix_keys = [key for key, _ in pairs]
+        self.prefix_ids = [entry_id for _, entry_id in pairs]
+        self.grams = {gram: sorted(set(ids)) for gram, ids in grams.items()}
+        self.chars = {char: sorted(set(ids)) for char, ids in chars.items()}
+
+    def prefix(self, query):
+        """query로 시작하는 키를 가진 항목 번호"""
+        start = bisect_left(self.prefix_keys, query)
+        end = bisect_left(self.prefix_keys, query + '\uffff', start)
+        return set(self.prefix_ids[start:end])
+
+    def contains(self, query):
+        """query를 포함하는 키를 가진 항목 번호 (가장 드문 n-gram 목록만 확인)"""
+        if len(query) == 1:
+            return set(self.chars.get(query, ()))
+        candidates = min((self.grams.get(gram, ()) for gram in _grams(query)), key=len)
+        return {
+            entry_id for entry_id in candidates
+            if any(query in key for key in self.keys[entry_id])
+        }
+
+    def exact(self, query):
+        start = bisect_left(self.prefix_keys, query)
+        end = start
+        while end < len(self.prefix_keys) and self.prefix_keys[end] == query:
+            end += 1
+        return set(self.prefix_ids[start:end])
+
+
+class StockSearchIndex:
+    """
+    종목/ETF 검색 인덱스
+
+    Args:
+        entries: Entry 목록 (순서 무관, 시가총액 순으로 번호를 다시 매김)
+    """
+
+    def __init__(self, entries):
+        self.entries = sorted(entries, key=lambda e: (-(e.market_cap or 0), e.code))
+        self.names = _KeyIndex([
+            (i, [normalize(e.name), e.code.lower()]) for i, e in enumerate(self.entries)
+        ])
+        self.choseong = _KeyIndex([
+            (i, [to_choseong(e.name)]) for i, e in enumerate(self.entries)
+        ])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def search(self, query, limit=10, kinds=None, active_only=False):
+        """
+        검색 (정확히 일치 > 접두어 > 부분 일치, 그룹 안에서는 시가총액 순)
+
+        Args:
+            kinds: ('stock', 'etf') 중 포함할 종류 (기본값: 전체)
+            active_only: 활성 항목만
+            limit: 최대 결과 수 (None이면 전체)
+
+        Returns:
+            list[Entry]
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        index = self.choseong if is_choseong_query(query) else self.names
+
+        def allowed(entry_id):
+            entry = self.entries[entry_id]
+            return (kinds is None or entry.kind in kinds) and (entry.is_active or not active_only)
+
+        results = []
+        seen = set()
+        for group in (index.exact, index.prefix, index.contains):
+            remaining = None if limit is None else limit - len(results)
+            if remaining == 0:
+                break
+            ids = [entry_id for entry_id in group(query) - seen if allowed(entry_id)]
+            ids = sorted(ids) if remaining is None else heapq.nsmallest(remaining, ids)
+            seen.update(ids)
+            results += [self.entries[entry_id] for entry_id in ids]
+        return results
+
+
+# ============ 프로세스 인덱스 ============
+
+_lock = threading.Lock()
+_state = {'index': None, 'versions': None, 'checked_at': 0.0}
+
+
+def load_entries():
+    """DB에서 인덱스 항목 조회 (쿼리 2번)"""
+    from .models import Info, InfoETF
+
+    entries = [
+        Entry(code, name, market, 'stock', market_cap, is_active)
+        for code, name, market, market_cap, is_active in
+        Info.objects.values_list('code', 'name', 'market', 'market_cap', 'is_active')
+    ]
+    entries += [
+        Entry(code, name, 'ETF', 'etf', market_cap, is_active)
+        for code, name, market_cap, is_active in
+        InfoETF.objects.values_list('code', 'name', 'market_cap', 'is_active')
+    ]
+    return entries
+
+
+def get_index():
+    """
+    현재 인덱스 (데이터 버전이 바뀌었으면 재구축)
+
+    버전 확인은 VERSION_CHECK_INTERVAL초에 한 번, 재구축은 한 스레드만 수행하고
+    다른 스레드는 그동안 이전 인덱스를 사용합니다.
+    """
+    from .cache import get_data_versions
+
+    index = _state['index']
+    if index is not None and time.monotonic() - _state['checked_at'] < VERSION_CHECK_INTERVAL:
+        return index
+    if not _lock.acquire(blocking=index is None):
+        return index
+    try:
+        if _state['index'] is not None and time.monotonic() - _state['checked_at'] < VERSION_CHECK_INTERVAL:
+            return _state['index']
+        versions = get_data_versions(DATASETS)
+        if _state['index'] is None or versions != _state['versions']:
+            _state['index'] = StockSearchIndex(load_entries())
+            _state['versions'] = versions
+        _state['checked_at'] = time.monotonic()
+        return _state['index']
+    finally:
+        _lock.release()
+
+
+def search_stocks(query, limit=10, kinds=None, active_only=False):
+    """종목/ETF 검색 (StockSearchIndex.search 참고)"""
+    return get_index().search(query, limit=limit, kinds=kinds, active_only=active_only)
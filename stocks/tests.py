@@ -1,3 +1,378 @@
-from django.test import TestCase
+import asyncio
+import math
+import random
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
 
-# Create your tests here.
+from django.core.asgi import get_asgi_application
+from django.core.management import call_command
+from django.db import connection
+from django.http import HttpResponse
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import path
+
+from .models import DailyChart, Info, LatestQuote
+
+
+class QueryAuditTest(TestCase):
+    """주요 화면/수집 쿼리의 실행 계획 점검 (인덱스가 빠지거나 쿼리가 바뀌어 전체 스캔/정렬이 생기면 실패)"""
+
+    @classmethod
+    def setUpTestData(cls):
+        day = date(2024, 12, 30)
+        for code, name in (('005930', '삼성전자'), ('000660', 'SK하이닉스')):
+            stock = Info.objects.create(code=code, name=name, market='KOSPI', market_cap=1000)
+            LatestQuote.objects.create(stock=stock, name=name, market='KOSPI', market_cap=1000)
+            DailyChart.objects.bulk_create([
+                DailyChart(
+                    stock=stock, date=day - timedelta(days=i), opening_price=100, high_price=110, low_price=90,
+                    closing_price=105, price_change=5, trading_volume=1000, trading_value=100000,
+                )
+                for i in range(5)
+            ])
+        with connection.cursor() as cursor:
+            cursor.execute('ANALYZE')
+
+    def test_no_plan_issues(self):
+        try:
+            call_command('query_audit', strict=True, log_level='error')
+        except SystemExit as e:
+            self.fail(f'query_audit --strict 실패 (종료 코드 {e.code}): python manage.py query_audit로 문제 쿼리 확인')
+
+
+# === ASGI 테스트용 뷰/URL (ROOT_URLCONF=stocks.tests) ===
+
+_view_threads = []
+
+
+def slow_sync_view(request):
+    _view_threads.append(threading.get_ident())
+    time.sleep(0.2)
+    return HttpResponse('ok')
+
+
+def profiled_sync_work():
+    return sum(i * i for i in range(20000))
+
+
+def profiled_sync_view(request):
+    return HttpResponse(str(profiled_sync_work()))
+
+
+urlpatterns = [
+    path('slow/', slow_sync_view),
+    path('profiled/', profiled_sync_view),
+]
+
+
+async def asgi_get(app, url):
+    """ASGI 앱에 GET 요청 1건 (응답 본문 전송 후 연결 종료) → 응답 메시지 목록"""
+    messages = asyncio.Queue()
+    messages.put_nowait({'type': 'http.request', 'body': b'', 'more_body': False})
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+        if message['type'] == 'http.response.body' and not message.get('more_body'):
+            messages.put_nowait({'type': 'http.disconnect'})
+
+    scope = {
+        'type': 'http', 'method': 'GET', 'path': url, 'query_string': b'', 'headers': [],
+        'server': ('testserver', 80),
+    }
+    await app(scope, messages.get, send)
+    return sent
+
+
+@override_settings(ROOT_URLCONF='stocks.tests', MIDDLEWARE=[], ALLOWED_HOSTS=['*'])
+class AsgiSyncViewTest(SimpleTestCase):
+    """ASGI에서 동기 뷰(일반 페이지)가 요청마다 별도 스레드에서 실행되는지 (한 스레드에 줄 서지 않음)"""
+
+    def test_sync_views_run_in_per_request_threads(self):
+        app = get_asgi_application()
+        _view_threads.clear()
+
+        async def run():
+            begin = time.perf_counter()
+            responses = await asyncio.gather(*(asgi_get(app, '/slow/') for _ in range(4)))
+            return responses, time.perf_counter() - begin
+
+        responses, elapsed = asyncio.run(run())
+        self.assertTrue(all(r[0]['status'] == 200 for r in responses))
+        self.assertEqual(len(set(_view_threads)), 4)
+        self.assertLess(elapsed, 0.6)  # 한 스레드에서 차례로 실행하면 0.8초
+
+
+@override_settings(
+    ROOT_URLCONF='stocks.tests', MIDDLEWARE=['stocks.middleware.ProfilingMiddleware'], ALLOWED_HOSTS=['*'],
+    PROFILING_ENABLED=True,
+)
+class AsgiProfilingTest(SimpleTestCase):
+    """ASGI에서 동기 뷰의 cProfile 결과에 뷰 스레드의 함수가 기록되는지"""
+
+    def test_cprofile_includes_sync_view_frames(self):
+        from . import profiling
+
+        profiling.set_cprofile_target('/profiled/', 1)
+        response = asyncio.run(asgi_get(get_asgi_application(), '/profiled/'))
+        self.assertEqual(response[0]['status'], 200)
+
+        dump = profiling.summarize()['cprofile_dumps'][0]
+        self.assertEqual(dump['path'], '/profiled/')
+        self.assertIn('profiled_sync_view', dump['text'])
+        self.assertIn('profiled_sync_work', dump['text'])
+
+
+class CubeAppendTest(TestCase):
+    """append_cube: 기록된 변경일부터 다시 채우고 새 세대로 교체 (이전 세대 파일은 수정하지 않음)"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        settings_override = override_settings(OHLCV_CUBE_DIR=tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.stock = Info.objects.create(code='005930', name='삼성전자', market='KOSPI', market_cap=1000)
+        self.days = [date(2025, 1, 6) + timedelta(days=i) for i in range(5)]
+        DailyChart.objects.bulk_create([
+            DailyChart(
+                stock=self.stock, date=day, opening_price=100, high_price=110, low_price=90,
+                closing_price=100 + i, price_change=1, trading_volume=1000, trading_value=100000,
+            )
+            for i, day in enumerate(self.days)
+        ])
+
+    def test_append_rewrites_changed_history(self):
+        from .cube import _field_path, append_cube, build_cube, cube_dir, mark_cube_changed, open_cube
+
+        old_meta = build_cube('stock', 'daily')
+        old_file = _field_path(cube_dir('stock', 'daily'), 'closing_price', old_meta['generation'])
+        old_close = open_cube('stock', 'daily', require_current=False).series('005930', 'closing_price')
+
+        DailyChart.objects.filter(date=self.days[1]).update(closing_price=999)
+        DailyChart.objects.create(
+            stock=self.stock, date=self.days[-1] + timedelta(days=1), opening_price=100, high_price=110,
+            low_price=90, closing_price=200, price_change=1, trading_volume=1000, trading_value=100000,
+        )
+        mark_cube_changed('stock', 'daily', self.days[1])
+
+        meta, rebuilt = append_cube('stock', 'daily')
+        self.assertFalse(rebuilt)
+        self.assertEqual(meta['generation'], old_meta['generation'] + 1)
+        self.assertFalse(old_file.exists())
+        self.assertEqual(list(old_close), [100, 101, 102, 103, 104])  # 기존에 연 메모리 맵은 그대로
+
+        close = open_cube('stock', 'daily', require_current=False).series('005930', 'closing_price')
+        self.assertEqual(list(close), [100, 999, 102, 103, 104, 200])
+
+        # 변경 기록은 반영 후 삭제 → 다음 append는 마지막 날짜부터
+        DailyChart.objects.filter(date=self.days[0]).update(closing_price=555)
+        meta, rebuilt = append_cube('stock', 'daily')
+        close = open_cube('stock', 'daily', require_current=False).series('005930', 'closing_price')
+        self.assertEqual(close[0], 100)
+
+    def test_append_rebuilds_before_first_date(self):
+        from .cube import append_cube, build_cube, mark_cube_changed
+
+        build_cube('stock', 'daily')
+        mark_cube_changed('stock', 'daily', date.min)
+        _, rebuilt = append_cube('stock', 'daily')
+        self.assertTrue(rebuilt)
+
+
+# === 지표 기준 구현 (numpy 전환 전 반복문 버전, IndicatorOverlayTest 비교용) ===
+
+def loop_sma(values, period):
+    result = [None] * len(values)
+    window_sum = 0
+    for i, value in enumerate(values):
+        window_sum += value
+        if i >= period:
+            window_sum -= values[i - period]
+        if i >= period - 1:
+            result[i] = window_sum / period
+    return result
+
+
+def loop_ema(values, period):
+    """지수이동평균 (첫 period개 단순평균으로 시작)"""
+    result = [None] * len(values)
+    if len(values) < period:
+        return result
+    alpha = 2 / (period + 1)
+    prev = sum(values[:period]) / period
+    result[period - 1] = prev
+    for i in range(period, len(values)):
+        prev = prev + alpha * (values[i] - prev)
+        result[i] = prev
+    return result
+
+
+def loop_wilder(values, period, start=0):
+    """Wilder 평활 (RSI/ATR), values[start:]부터 유효"""
+    result = [None] * len(values)
+    if len(values) - start < period:
+        return result
+    prev = sum(values[start:start + period]) / period
+    result[start + period - 1] = prev
+    for i in range(start + period, len(values)):
+        prev = (prev * (period - 1) + values[i]) / period
+        result[i] = prev
+    return result
+
+
+def loop_bollinger(closes, period=20, k=2):
+    """볼린저 밴드 (중심선 = SMA, 폭 = k * 모표준편차)"""
+    n = len(closes)
+    middle = loop_sma(closes, period)
+    upper = [None] * n
+    lower = [None] * n
+    sq_sum = 0
+    for i, close in enumerate(closes):
+        sq_sum += close * close
+        if i >= period:
+            sq_sum -= closes[i - period] ** 2
+        if middle[i] is not None:
+            variance = max(sq_sum / period - middle[i] ** 2, 0)
+            width = k * variance ** 0.5
+            upper[i] = middle[i] + width
+            lower[i] = middle[i] - width
+    return {'upper': upper, 'middle': middle, 'lower': lower}
+
+
+def loop_rsi(closes, period=14):
+    n = len(closes)
+    gains = [0] * n
+    losses = [0] * n
+    for i in range(1, n):
+        change = closes[i] - closes[i - 1]
+        gains[i] = max(change, 0)
+        losses[i] = max(-change, 0)
+    avg_gain = loop_wilder(gains, period, start=1)
+    avg_loss = loop_wilder(losses, period, start=1)
+
+    result = [None] * n
+    for i in range(n):
+        if avg_gain[i] is None:
+            continue
+        if avg_loss[i] == 0:
+            result[i] = 100.0 if avg_gain[i] > 0 else 50.0
+        else:
+            result[i] = 100 - 100 / (1 + avg_gain[i] / avg_loss[i])
+    return result
+
+
+def loop_macd(closes, fast=12, slow=26, signal=9):
+    fast_ema = loop_ema(closes, fast)
+    slow_ema = loop_ema(closes, slow)
+    line = [
+        f - s if f is not None and s is not None else None
+        for f, s in zip(fast_ema, slow_ema)
+    ]
+
+    # 시그널: MACD 유효 구간에 대한 EMA
+    first = next((i for i, v in enumerate(line) if v is not None), len(line))
+    signal_line = [None] * first + loop_ema(line[first:], signal)
+    hist = [
+        m - s if m is not None and s is not None else None
+        for m, s in zip(line, signal_line)
+    ]
+    return {'macd': line, 'signal': signal_line, 'hist': hist}
+
+
+def loop_atr(highs, lows, closes, period=14):
+    n = len(closes)
+    true_ranges = [0] * n
+    for i in range(n):
+        if i == 0:
+            true_ranges[i] = highs[i] - lows[i]
+        else:
+            prev_close = closes[i - 1]
+            true_ranges[i] = max(highs[i] - lows[i], abs(highs[i] - prev_close), abs(lows[i] - prev_close))
+    return loop_wilder(true_ranges, period)
+
+
+def loop_obv(closes, volumes):
+    result = [0] * len(closes)
+    total = 0
+    for i in range(1, len(closes)):
+        if closes[i] > closes[i - 1]:
+            total += volumes[i]
+        elif closes[i] < closes[i - 1]:
+            total -= volumes[i]
+        result[i] = total
+    return result
+
+
+def loop_vwap(highs, lows, closes, volumes, period=20):
+    """구간 VWAP (대표가 = (고가 + 저가 + 종가) / 3, 거래량 가중)"""
+    n = len(closes)
+    result = [None] * n
+    pv_sum = 0
+    volume_sum = 0
+    for i in range(n):
+        pv_sum += (highs[i] + lows[i] + closes[i]) / 3 * volumes[i]
+        volume_sum += volumes[i]
+        if i >= period:
+            old = i - period
+            pv_sum -= (highs[old] + lows[old] + closes[old]) / 3 * volumes[old]
+            volume_sum -= volumes[old]
+        if i >= period - 1 and volume_sum > 0:
+            result[i] = pv_sum / volume_sum
+    return result
+
+
+class IndicatorOverlayTest(SimpleTestCase):
+    """numpy 지표 계산이 반복문 기준 구현과 같은 값인지 (빈 구간 None 위치 포함)"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = random.Random(7)
+        closes = [50000]
+        for _ in range(599):
+            closes.append(max(1000, closes[-1] + rng.randint(-1500, 1500)))
+        closes[100:130] = [closes[100]] * 30  # 보합 구간 (RSI 50, 볼린저 폭 0)
+        cls.closes = closes
+        cls.highs = [c + rng.randint(0, 800) for c in closes]
+        cls.lows = [c - rng.randint(0, 800) for c in closes]
+        cls.volumes = [rng.choice([0, rng.randint(1, 10 ** 7)]) for _ in closes]
+
+    def assertSeriesEqual(self, actual, expected):
+        if isinstance(expected, dict):
+            self.assertEqual(actual.keys(), expected.keys())
+            for key in expected:
+                self.assertSeriesEqual(actual[key], expected[key])
+            return
+        self.assertEqual(len(actual), len(expected))
+        for i, (a, e) in enumerate(zip(actual, expected)):
+            if e is None:
+                self.assertIsNone(a, f'{i}번째 값')
+            else:
+                self.assertTrue(math.isclose(a, e, rel_tol=1e-9, abs_tol=1e-6), f'{i}번째 값: {a} != {e}')
+
+    def test_matches_loop_implementation(self):
+        from . import indicators
+
+        h, l, c, v = self.highs, self.lows, self.closes, self.volumes
+        for n in (0, 1, 10, 40, len(c)):  # 구간보다 짧은 배열 포함
+            for period in (1, 2, 14, 20, 250):
+                with self.subTest(n=n, period=period):
+                    self.assertSeriesEqual(indicators.sma(c[:n], period), loop_sma(c[:n], period))
+                    self.assertSeriesEqual(indicators.ema(c[:n], period), loop_ema(c[:n], period))
+                    self.assertSeriesEqual(indicators.bollinger(c[:n], period, 2.5), loop_bollinger(c[:n], period, 2.5))
+                    self.assertSeriesEqual(indicators.rsi(c[:n], period), loop_rsi(c[:n], period))
+                    self.assertSeriesEqual(
+                        indicators.atr(h[:n], l[:n], c[:n], period), loop_atr(h[:n], l[:n], c[:n], period)
+                    )
+                    self.assertSeriesEqual(
+                        indicators.vwap(h[:n], l[:n], c[:n], v[:n], period),
+                        loop_vwap(h[:n], l[:n], c[:n], v[:n], period),
+                    )
+            with self.subTest(n=n):
+                self.assertSeriesEqual(indicators.macd(c[:n]), loop_macd(c[:n]))
+                self.assertSeriesEqual(indicators.macd(c[:n], 1, 2, 1), loop_macd(c[:n], 1, 2, 1))
+                self.assertEqual(indicators.obv(c[:n], v[:n]), loop_obv(c[:n], v[:n]))
@@ -8,11 +8,15 @@ urlpatterns = [
     path('stocks/', views.stock_list, name='stock_list'),
     path('stocks/<str:code>/', views.stock_detail, name='stock_detail'),
     path('stocks/<str:code>/edit/', views.stock_edit, name='stock_edit'),
+    path('stocks/<str:code>/edit/tab/<str:tab>/', views.stock_edit_tab, name='stock_edit_tab'),
     path('stocks/<str:code>/analysis/', views.stock_analysis_html, name='stock_analysis_html'),
     path('stocks/<str:code>/analysis/summary/', views.stock_analysis_summary_html, name='stock_analysis_summary_html'),
     path('stocks/<str:code>/insight/summary/', views.stock_insight_summary_html, name='stock_insight_summary_html'),
     path('stocks/<str:code>/insight/report/', views.stock_insight_report_html, name='stock_insight_report_html'),
+    path('api/stock/signal-chart/batch/', views.signal_chart_batch, name='signal_chart_batch'),
     path('api/stock/<str:code>/signal-chart/', views.signal_chart_data, name='signal_chart_data'),
+    path('api/stock/<str:code>/chart/', views.stock_chart_data, name='stock_chart_data'),
+    path('api/stock/<str:code>/indicators/', views.stock_indicator_data, name='stock_indicator_data'),
     path('market/', views.market, name='market'),
     path('sector/', views.sector, name='sector'),
     path('sector/<int:sector_id>/', views.sector_detail, name='sector_detail'),
@@ -22,12 +26,16 @@ urlpatterns = [
     path('api/etf/add/', views.add_etf, name='add_etf'),
     path('api/etf/save/', views.save_etf, name='save_etf'),
     path('api/etf/<str:code>/delete/', views.delete_etf, name='delete_etf'),
+    path('api/etf/signal-chart/batch/', views.etf_signal_chart_batch, name='etf_signal_chart_batch'),
     path('api/etf/<str:code>/signal-chart/', views.etf_signal_chart_data, name='etf_signal_chart_data'),
+    path('api/etf/<str:code>/chart/', views.etf_chart_data, name='etf_chart_data'),
+    path('api/etf/<str:code>/indicators/', views.etf_indicator_data, name='etf_indicator_data'),
     path('nodaji/<int:nodaji_id>/summary/', views.nodaji_summary, name='nodaji_summary'),
     path('report/<int:report_id>/summary/', views.report_summary, name='report_summary'),
     path('api/report/<str:code>/more/', views.fetch_more_reports, name='fetch_more_reports'),
     path('api/nodaji/<str:code>/more/', views.fetch_more_nodaji, name='fetch_more_nodaji'),
     path('api/stock/search/', views.search_stock, name='search_stock'),
+    path('api/search/', views.search_text, name='search_text'),
     path('api/stock/<str:code>/prompt-data/', views.fetch_stock_prompt_data, name='fetch_stock_prompt_data'),
     path('youtube/<int:video_id>/summary/', views.youtube_summary, name='youtube_summary'),
     path('api/telegram/search/', views.search_telegram, name='search_telegram'),
@@ -36,8 +44,10 @@ urlpatterns = [
     path('api/nodaji/search/', views.search_nodaji, name='search_nodaji'),
     path('api/nodaji/brief/', views.fetch_nodaji_brief, name='fetch_nodaji_brief'),
     path('api/dart/<str:code>/', views.fetch_dart, name='fetch_dart'),
+    path('api/jobs/<str:job_id>/', views.job_status, name='job_status'),
     path('api/sector/date/', views.sector_date_data, name='sector_date_data'),
     path('settings/', views.settings, name='settings'),
+    path('profiling/', views.profiling, name='profiling'),
     path('api/category/add/', views.category_add, name='category_add'),
     path('api/category/<int:category_id>/delete/', views.category_delete, name='category_delete'),
     path('api/theme/add/', views.theme_add, name='theme_add'),
@@ -86,7 +96,9 @@ urlpatterns = [
     path('api/market/trend/<str:market>/refresh/', views.refresh_market_trend, name='refresh_market_trend'),
     path('api/sector/<str:market>/refresh/', views.refresh_sector, name='refresh_sector'),
     path('api/stock/<str:code>/refresh/', views.refresh_stock, name='refresh_stock'),
+    path('api/stocks/refresh/', views.refresh_stocks_batch, name='refresh_stocks_batch'),
     path('api/stock/<str:code>/investor-trend/', views.fetch_investor_trend, name='fetch_investor_trend'),
     path('api/stock/<str:code>/short-selling/', views.fetch_short_selling, name='fetch_short_selling'),
+    path('api/export/<str:table>/', views.export_data, name='export_data'),
     path('api/setting/save/', views.save_setting, name='save_setting'),
 ]
@@ -8,88 +8,85 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
-from decouple import config
-from telethon import TelegramClient
 from django.views.decorators.http import require_POST
-from .models import Info, Financial, DailyChart, WeeklyChart, MonthlyChart, Report, Nodaji, Gongsi, IndexChart, MarketTrend, InvestorTrend, ShortSelling
+from .models import Info, Financial, DailyChart, Report, Nodaji, Gongsi, IndexChart, MarketTrend, InvestorTrend, ShortSelling, DashboardCard
+from .indicators import get_indicator_states
+from .cache import render_cached_page, bump_data_version
+from .jobs import background_job, SEARCH_RESULT_TTL
 
 
 def index(request):
     """종목 대시보드 (관심종목)"""
-    from django.db.models import Max
-
-    # 대분류명, 소분류명 순으로 정렬 (테마 없는 종목은 맨 뒤)
-    base_qs = Info.objects.filter(is_active=True).prefetch_related('themes__category', 'custom_sectors')
-
-    def sort_by_theme(stocks):
-        """대분류, 소분류 순 정렬"""
-        result = []
-        for stock in stocks:
-            themes = list(stock.themes.all())
-            if themes:
-                # 첫 번째 테마 기준 정렬 키
-                first_theme = min(themes, key=lambda t: (t.category.name, t.name))
-                result.append((first_theme.category.name, first_theme.name, stock))
-            else:
-                result.append(('zzz', 'zzz', stock))  # 테마 없는 종목은 뒤로
-        result.sort(key=lambda x: (x[0], x[1]))
-        return [item[2] for item in result]
+    return render_cached_page(request, 'index', 'stocks/index.html', build_index_context)
+
 
-    super_stocks = sort_by_theme(base_qs.filter(interest_level='super'))
-    normal_stocks = sort_by_theme(base_qs.filter(interest_level='normal'))
-    incubator_stocks = sort_by_theme(base_qs.filter(interest_level='incubator'))
+def build_index_context():
+    """종목 대시보드 (관심종목) context (데이터 버전별 캐시 대상)"""
+    from django.db.models import OuterRef, Subquery, F
+    from .models import Theme
+
+    # 관심종목 (super, normal, incubator) 한 번에 조회
+    # 첫 번째 테마(대분류명, 소분류명) 기준 DB 정렬, 테마 없는 종목은 맨 뒤
+    first_theme = Theme.objects.filter(stocks=OuterRef('pk')).order_by('category__name', 'name')
+    target_stocks = list(
+        Info.objects.lean().filter(is_active=True, interest_level__in=['super', 'normal', 'incubator'])
+        .annotate(
+            theme_category_sort=Subquery(first_theme.values('category__name')[:1]),
+            theme_sort=Subquery(first_theme.values('name')[:1]),
+        )
+        .order_by(
+            F('theme_category_sort').asc(nulls_last=True),
+            F('theme_sort').asc(nulls_last=True),
+            'code',
+        )
+        .prefetch_related('themes__category', 'custom_sectors')
+    )
+
+    super_stocks = [s for s in target_stocks if s.interest_level == 'super']
+    normal_stocks = [s for s in target_stocks if s.interest_level == 'normal']
+    incubator_stocks = [s for s in target_stocks if s.interest_level == 'incubator']
 
     # ============ 대시보드 카드 ============
-    # 관심종목만 대상 (super, normal, incubator)
-    target_stocks = list(base_qs.filter(interest_level__in=['super', 'normal', 'incubator']))
+    # 종목별 롤링 지표 상태 (일봉 저장 시 증분 갱신됨, 종목당 일봉 조회 없음)
+    indicator_states = get_indicator_states(target_stocks)
 
     # 카드 A: 장기 신호 (60일 신고거래량)
     card_a_stocks = []  # 급등 (양봉, MA20 위)
     card_a_down_stocks = []  # 급락 (음봉, MA20 아래)
 
     for stock in target_stocks:
-        # 최근 120일 일봉 데이터 (MA120 계산용)
-        daily_data = list(DailyChart.objects.filter(
-            stock=stock
-        ).order_by('-date')[:120])
-
-        if len(daily_data) < 60:  # 최소 60일 필요
+        state = indicator_states.get(stock.code)
+        if not state or state.bar_count < 60:  # 최소 60일 필요
             continue
 
         # 오늘 데이터
-        today = daily_data[0]
+        today = state.recent_bars()[0]
 
         # 60일 중 최대 거래량
-        max_volume_60 = max(d.trading_volume for d in daily_data[:60])
+        max_volume_60 = state.max_volume(60)
 
         # 조건 1: 오늘 거래량 == 60일 최대 거래량
-        if today.trading_volume != max_volume_60 or today.trading_volume <= 0:
+        if today['trading_volume'] != max_volume_60 or today['trading_volume'] <= 0:
             continue
 
-        # 이평선 계산
-        ma10 = sum(d.closing_price for d in daily_data[:10]) / 10 if len(daily_data) >= 10 else 0
-        ma20 = sum(d.closing_price for d in daily_data[:20]) / 20 if len(daily_data) >= 20 else 0
-        ma60 = sum(d.closing_price for d in daily_data[:60]) / 60 if len(daily_data) >= 60 else 0
-        ma120 = sum(d.closing_price for d in daily_data[:120]) / 120 if len(daily_data) >= 120 else 0
+        # 이평선
+        ma20 = state.ma(20)
+        ma120 = state.ma(120) or 0
 
         # MA120 위 여부 (정배열 체크)
-        above_ma120 = today.closing_price > ma120 if ma120 else False
+        above_ma120 = today['closing_price'] > ma120 if ma120 else False
 
         # 52주(약 250일) 최고가 대비 위치 (마이너스 %)
         high_52w = stock.high_250 or stock.year_high
         high_position = 0
         if high_52w and high_52w > 0:
-            high_position = round((today.closing_price / high_52w - 1) * 100, 1)
+            high_position = round((today['closing_price'] / high_52w - 1) * 100, 1)
 
         # 등락률
         change_rate = stock.change_rate or 0
 
         # 거래대금 (백만원 → 억원 변환)
-        trading_value = round(today.trading_value / 100) if today.trading_value else 0
-
-        # 10일 스파크라인 데이터 (종가)
-        sparkline = [d.closing_price for d in daily_data[:10]]
-        sparkline.reverse()  # 과거 → 현재 순서로
+        trading_value = round(today['trading_value'] / 100) if today['trading_value'] else 0
 
         stock_data = {
             'stock': stock,
@@ -97,12 +94,12 @@ def index(request):
             'above_ma120': above_ma120,
             'high_position': high_position,
             'trading_value': trading_value,
-            'sparkline': sparkline,
+            'sparkline': state.sparkline(),  # 10일 종가 (과거 → 현재)
         }
 
         # 급등: 양봉 + MA20 위
-        is_bullish = today.closing_price >= today.opening_price
-        above_ma20 = today.closing_price > ma20
+        is_bullish = today['closing_price'] >= today['opening_price']
+        above_ma20 = today['closing_price'] > ma20
 
         if is_bullish and above_ma20:
             card_a_stocks.append(stock_data)
@@ -126,49 +123,38 @@ def index(request):
         if stock.code in card_a_codes:
             continue
 
-        # 최근 120일 일봉 데이터 (MA120 계산용)
-        daily_data = list(DailyChart.objects.filter(
-            stock=stock
-        ).order_by('-date')[:120])
-
-        if len(daily_data) < 20:  # 최소 20일 필요
+        state = indicator_states.get(stock.code)
+        if not state or state.bar_count < 20:  # 최소 20일 필요
             continue
 
         # 오늘 데이터
-        today = daily_data[0]
+        today = state.recent_bars()[0]
 
         # 20일 중 최대 거래량
-        recent_20 = daily_data[:20]
-        max_volume_20 = max(d.trading_volume for d in recent_20)
+        max_volume_20 = state.max_volume(20)
 
         # 조건 1: 오늘 거래량 == 20일 최대 거래량
-        if today.trading_volume != max_volume_20 or today.trading_volume <= 0:
+        if today['trading_volume'] != max_volume_20 or today['trading_volume'] <= 0:
             continue
 
-        # 이평선 계산
-        ma10 = sum(d.closing_price for d in daily_data[:10]) / 10 if len(daily_data) >= 10 else 0
-        ma20 = sum(d.closing_price for d in daily_data[:20]) / 20 if len(daily_data) >= 20 else 0
-        ma60 = sum(d.closing_price for d in daily_data[:60]) / 60 if len(daily_data) >= 60 else 0
-        ma120 = sum(d.closing_price for d in daily_data[:120]) / 120 if len(daily_data) >= 120 else 0
+        # 이평선
+        ma20 = state.ma(20)
+        ma120 = state.ma(120) or 0
 
         # MA120 위 여부 (정배열 체크)
-        above_ma120 = today.closing_price > ma120 if ma120 else False
+        above_ma120 = today['closing_price'] > ma120 if ma120 else False
 
         # 52주(약 250일) 최고가 대비 위치 (마이너스 %)
         high_52w = stock.high_250 or stock.year_high
         high_position = 0
         if high_52w and high_52w > 0:
-            high_position = round((today.closing_price / high_52w - 1) * 100, 1)
+            high_position = round((today['closing_price'] / high_52w - 1) * 100, 1)
 
         # 등락률
         change_rate = stock.change_rate or 0
 
         # 거래대금 (백만원 → 억원 변환)
-        trading_value = round(today.trading_value / 100) if today.trading_value else 0
-
-        # 10일 스파크라인 데이터 (종가)
-        sparkline = [d.closing_price for d in daily_data[:10]]
-        sparkline.reverse()  # 과거 → 현재 순서로
+        trading_value = round(today['trading_value'] / 100) if today['trading_value'] else 0
 
         stock_data = {
             'stock': stock,
@@ -176,12 +162,12 @@ def index(request):
             'above_ma120': above_ma120,
             'high_position': high_position,
             'trading_value': trading_value,
-            'sparkline': sparkline,
+            'sparkline': state.sparkline(),  # 10일 종가 (과거 → 현재)
         }
 
         # 급등: 양봉 + MA20 위
-        is_bullish = today.closing_price >= today.opening_price
-        above_ma20 = today.closing_price > ma20
+        is_bullish = today['closing_price'] >= today['opening_price']
+        above_ma20 = today['closing_price'] > ma20
 
         if is_bullish and above_ma20:
             card_b_stocks.append(stock_data)
@@ -205,23 +191,21 @@ def index(request):
         if stock.code in card_ab_codes:
             continue
 
-        # 최근 65일 일봉 데이터 (5일전 MA60 계산용)
-        daily_data = list(DailyChart.objects.filter(
-            stock=stock
-        ).order_by('-date')[:65])
-
-        if len(daily_data) < 65:  # MA60 + 5일 필요
+        state = indicator_states.get(stock.code)
+        if not state or state.bar_count < 65:  # MA60 + 5일 필요
             continue
 
+        recent_bars = state.recent_bars()
+
         # 오늘 데이터
-        today = daily_data[0]
+        today = recent_bars[0]
 
-        # MA20, MA60 계산 (오늘 기준)
-        ma20 = sum(d.closing_price for d in daily_data[:20]) / 20
-        ma60 = sum(d.closing_price for d in daily_data[:60]) / 60
+        # MA20, MA60 (오늘 기준)
+        ma20 = state.ma(20)
+        ma60 = state.ma(60)
 
-        # 5일 전 MA60 계산 (기울기 판단용)
-        ma60_5days_ago = sum(d.closing_price for d in daily_data[5:65]) / 60
+        # 5일 전 MA60 (기울기 판단용)
+        ma60_5days_ago = recent_bars[5]['ma60']
 
         # === 필터링 조건 (모두 AND) ===
         # 조건 A (정배열): MA20 > MA60
@@ -233,32 +217,28 @@ def index(request):
             continue
 
         # 조건 C (눌림 상태): 종가 < MA20
-        if today.closing_price >= ma20:
+        if today['closing_price'] >= ma20:
             continue
 
         # 조건 D (최대 하락폭): 종가 >= MA60 * 0.90
-        if today.closing_price < ma60 * 0.90:
+        if today['closing_price'] < ma60 * 0.90:
             continue
 
         # === 추가 정보 계산 ===
         # MA60 대비 괴리율 (얼마나 눌렸는지)
-        gap_from_ma60 = round((today.closing_price / ma60 - 1) * 100, 1)
+        gap_from_ma60 = round((today['closing_price'] / ma60 - 1) * 100, 1)
 
         # 52주(약 250일) 최고가 대비 위치 (마이너스 %)
         high_52w = stock.high_250 or stock.year_high
         high_position = 0
         if high_52w and high_52w > 0:
-            high_position = round((today.closing_price / high_52w - 1) * 100, 1)
+            high_position = round((today['closing_price'] / high_52w - 1) * 100, 1)
 
         # 등락률
         change_rate = stock.change_rate or 0
 
         # 거래대금 (백만원 → 억원 변환)
-        trading_value = round(today.trading_value / 100) if today.trading_value else 0
-
-        # 10일 스파크라인 데이터 (종가)
-        sparkline = [d.closing_price for d in daily_data[:10]]
-        sparkline.reverse()  # 과거 → 현재 순서로
+        trading_value = round(today['trading_value'] / 100) if today['trading_value'] else 0
 
         card_d_stocks.append({
             'stock': stock,
@@ -266,7 +246,7 @@ def index(request):
             'high_position': high_position,
             'gap_from_ma60': gap_from_ma60,
             'trading_value': trading_value,
-            'sparkline': sparkline,
+            'sparkline': state.sparkline(),  # 10일 종가 (과거 → 현재)
         })
 
     # MA60 대비 괴리율 순으로 정렬 (0에 가까울수록 = 60일선에 가까울수록 상위)
@@ -284,51 +264,47 @@ def index(request):
         if stock.code in card_abd_codes:
             continue
 
-        # 최근 125일 일봉 데이터 (5일 전 시점에서 60일 체크 + MA120 계산용)
-        daily_data = list(DailyChart.objects.filter(
-            stock=stock
-        ).order_by('-date')[:125])
-
-        if len(daily_data) < 65:
+        state = indicator_states.get(stock.code)
+        if not state or state.bar_count < 65:
             continue
 
+        recent_bars = state.recent_bars()
+
         signal_day = None
         signal_type = None
         signal_days_ago = 0  # 거래일 기준 며칠 전
 
         # 최근 5거래일 체크 (인덱스 0=오늘, 1=1거래일전, ..., 4=4거래일전)
+        # 각 스냅샷에는 해당 날짜 기준 MA20, 20/60일 최대 거래량이 저장되어 있음
         for day_idx in range(5):
-            check_day = daily_data[day_idx]
+            check_day = recent_bars[day_idx]
 
             # 조건 1: 양봉 (종가 >= 시가)
-            if check_day.closing_price < check_day.opening_price:
+            if check_day['closing_price'] < check_day['opening_price']:
                 continue
 
-            # 해당 날짜 기준 MA20 계산
-            ma20_data = daily_data[day_idx:day_idx + 20]
-            if len(ma20_data) < 20:
+            # 해당 날짜 기준 MA20
+            ma20 = check_day['ma20']
+            if ma20 is None:
                 continue
-            ma20 = sum(d.closing_price for d in ma20_data) / 20
 
             # 조건 2: 현재가 > MA20
-            if check_day.closing_price <= ma20:
+            if check_day['closing_price'] <= ma20:
                 continue
 
             # 60일 최대 거래량 체크
-            volume_60_data = daily_data[day_idx:day_idx + 60]
-            if len(volume_60_data) >= 60:
-                max_volume_60 = max(d.trading_volume for d in volume_60_data)
-                if check_day.trading_volume == max_volume_60 and check_day.trading_volume > 0:
+            max_volume_60 = check_day['max_volume_60']
+            if max_volume_60 is not None:
+                if check_day['trading_volume'] == max_volume_60 and check_day['trading_volume'] > 0:
                     signal_day = check_day
                     signal_type = '60일'
                     signal_days_ago = day_idx  # 거래일 기준
                     break
 
             # 20일 최대 거래량 체크
-            volume_20_data = daily_data[day_idx:day_idx + 20]
-            if len(volume_20_data) >= 20:
-                max_volume_20 = max(d.trading_volume for d in volume_20_data)
-                if check_day.trading_volume == max_volume_20 and check_day.trading_volume > 0:
+            max_volume_20 = check_day['max_volume_20']
+            if max_volume_20 is not None:
+                if check_day['trading_volume'] == max_volume_20 and check_day['trading_volume'] > 0:
                     signal_day = check_day
                     signal_type = '20일'
                     signal_days_ago = day_idx  # 거래일 기준
@@ -338,26 +314,22 @@ def index(request):
             continue
 
         # 오늘 데이터
-        today = daily_data[0]
+        today = recent_bars[0]
 
         # 52주(약 250일) 최고가 대비 위치
         high_52w = stock.high_250 or stock.year_high
         high_position = 0
         if high_52w and high_52w > 0:
-            high_position = round((today.closing_price / high_52w - 1) * 100, 1)
+            high_position = round((today['closing_price'] / high_52w - 1) * 100, 1)
 
         # 양봉대비 (신호일 종가 대비 현재가 %)
         signal_price_change = 0
-        if signal_day.closing_price > 0:
-            signal_price_change = round((today.closing_price / signal_day.closing_price - 1) * 100, 1)
+        if signal_day['closing_price'] > 0:
+            signal_price_change = round((today['closing_price'] / signal_day['closing_price'] - 1) * 100, 1)
 
         # MA120 위 여부
-        ma120 = sum(d.closing_price for d in daily_data[:120]) / 120 if len(daily_data) >= 120 else 0
-        above_ma120 = today.closing_price > ma120 if ma120 else False
-
-        # 10일 스파크라인 데이터 (종가)
-        sparkline = [d.closing_price for d in daily_data[:10]]
-        sparkline.reverse()  # 과거 → 현재 순서로
+        ma120 = state.ma(120) or 0
+        above_ma120 = today['closing_price'] > ma120 if ma120 else False
 
         card_c_stocks.append({
             'stock': stock,
@@ -365,104 +337,64 @@ def index(request):
             'signal_days_ago': signal_days_ago,
             'signal_price_change': signal_price_change,
             'high_position': high_position,
-            'sparkline': sparkline,
+            'sparkline': state.sparkline(),  # 10일 종가 (과거 → 현재)
             'above_ma120': above_ma120,
-            'signal_date': signal_day.date.strftime('%Y-%m-%d'),
-            'signal_open': signal_day.opening_price,
-            'signal_high': signal_day.high_price,
-            'signal_low': signal_day.low_price,
-            'signal_close': signal_day.closing_price,
+            'signal_date': signal_day['date'],
+            'signal_open': signal_day['opening_price'],
+            'signal_high': signal_day['high_price'],
+            'signal_low': signal_day['low_price'],
+            'signal_close': signal_day['closing_price'],
             'current_price': stock.current_price,
         })
 
     # 양봉대비 순으로 정렬 (하락폭 작은 순)
     card_c_stocks.sort(key=lambda x: x['signal_price_change'], reverse=True)
 
-    # ============ 리포트 카드 ============
-    # 거래일 기준 최근 3거래일 가져오기
-    recent_3_trading_dates = list(DailyChart.objects.values_list('date', flat=True)
-                                .order_by('-date').distinct()[:3])
-
+    # ============ 리포트 / 노다지 카드 ============
+    # 수집 명령어 완료 시 재구축되는 집계 테이블에서 한 번에 조회 (관심종목만)
+    # 종목은 위에서 조회한 관심종목을 재사용 (JOIN으로 전체 컬럼 다시 읽지 않음)
     card_report_stocks = []
-    if recent_3_trading_dates:
-        # 최근 3거래일 내 리포트 조회 (관심종목만)
-        reports = Report.objects.filter(
-            stock__in=target_stocks,
-            date__gte=min(recent_3_trading_dates)
-        ).select_related('stock').order_by('stock', 'date', '-target_price')
-
-        # 종목+날짜 별로 목표가 가장 높은 리포트만 선택, 총 개수 카운트
-        report_by_stock_date = defaultdict(list)
-        for report in reports:
-            key = (report.stock.code, report.date)
-            report_by_stock_date[key].append(report)
-
-        # 종목별로 그룹화 (가장 최신 날짜의 목표가 가장 높은 리포트)
-        stock_reports = defaultdict(list)
-        for (code, date), rpts in report_by_stock_date.items():
-            stock_reports[code].extend(rpts)
-
-        for code, rpts in stock_reports.items():
-            # 가장 최신 날짜 기준
-            latest_date = max(r.date for r in rpts)
-            latest_reports = [r for r in rpts if r.date == latest_date]
-
-            # 목표가 가장 높은 것 선택
-            best_report = max(latest_reports, key=lambda r: r.target_price or 0)
-            total_count = len(rpts)  # 해당 종목의 전체 리포트 개수
-
-            stock = best_report.stock
+    card_nodaji_stocks = []
+    stocks_by_code = {stock.code: stock for stock in target_stocks}
+
+    dashboard_cards = DashboardCard.objects.filter(
+        stock__is_active=True,
+        stock__interest_level__in=['super', 'normal', 'incubator'],
+    )
 
+    for card in dashboard_cards:
+        stock = stocks_by_code.get(card.stock_id)
+        if stock is None:  # 조회 사이에 관심 해제된 종목
+            continue
+
+        if card.card_type == 'report':
             # 괴리율 계산 (목표가 vs 현재가)
             gap_rate = 0
-            if best_report.target_price and stock.current_price:
-                gap_rate = round((best_report.target_price / stock.current_price - 1) * 100, 1)
+            if card.target_price and stock.current_price:
+                gap_rate = round((card.target_price / stock.current_price - 1) * 100, 1)
 
             card_report_stocks.append({
                 'stock': stock,
                 'change_rate': stock.change_rate or 0,
-                'title': best_report.title,
-                'target_price': best_report.target_price,
+                'title': card.title,
+                'target_price': card.target_price,
                 'gap_rate': gap_rate,
-                'date': best_report.date,
-                'provider': best_report.provider,
-                'total_count': total_count,
+                'date': card.date,
+                'provider': card.provider,
+                'total_count': card.total_count,
             })
-
-    # 괴리율 높은 순 정렬
-    card_report_stocks.sort(key=lambda x: x['gap_rate'], reverse=True)
-
-    # ============ 노다지 카드 ============
-    # 거래일 기준 최근 5거래일 가져오기
-    recent_5_trading_dates = list(DailyChart.objects.values_list('date', flat=True)
-                                .order_by('-date').distinct()[:5])
-
-    card_nodaji_stocks = []
-    if recent_5_trading_dates:
-        # 최근 5거래일 내 노다지 조회 (관심종목만)
-        nodajis = Nodaji.objects.filter(
-            stock__in=target_stocks,
-            date__gte=min(recent_5_trading_dates)
-        ).select_related('stock').order_by('-date')
-
-        # 종목별로 가장 최신 노다지만
-        seen_codes = set()
-        for nodaji in nodajis:
-            if nodaji.stock.code in seen_codes:
-                continue
-            seen_codes.add(nodaji.stock.code)
-
-            stock = nodaji.stock
+        else:
             card_nodaji_stocks.append({
                 'stock': stock,
-                'nodaji_id': nodaji.id,
+                'nodaji_id': card.source_id,
                 'change_rate': stock.change_rate or 0,
-                'title': nodaji.title,
-                'date': nodaji.date,
-                'link': nodaji.link,
+                'title': card.title,
+                'date': card.date,
+                'link': card.link,
             })
 
-    # 등락율 순 정렬
+    # 리포트: 괴리율 높은 순, 노다지: 등락율 순
+    card_report_stocks.sort(key=lambda x: x['gap_rate'], reverse=True)
     card_nodaji_stocks.sort(key=lambda x: x['change_rate'], reverse=True)
 
     context = {
@@ -478,22 +410,39 @@ def index(request):
         'card_report_stocks': card_report_stocks,
         'card_nodaji_stocks': card_nodaji_stocks,
     }
-    return render(request, 'stocks/index.html', context)
+    return context
+
+
+# 종목 목록 정렬 (LatestQuote 정렬 컬럼 인덱스가 있는 필드만 허용)
+STOCK_LIST_SORTS = (
+    '-market_cap', 'market_cap', '-change_rate', 'change_rate', '-trading_value', 'trading_value', 'name',
+)
 
 
 def stock_list(request):
-    """종목 리스트 페이지"""
+    """
+    종목 리스트 페이지
+
+    활성 종목 최신 시세 스냅샷(LatestQuote)을 (시장, 정렬 컬럼) 인덱스 순서로 읽어 상위 100개만 조회
+    """
+    from .models import LatestQuote
+
     # 검색어
     query = request.GET.get('q', '')
     # 시장 필터
     market = request.GET.get('market', '')
     # 정렬
     sort = request.GET.get('sort', '-market_cap')
+    if sort not in STOCK_LIST_SORTS:
+        sort = '-market_cap'
 
-    stocks = Info.objects.filter(is_active=True)
+    stocks = LatestQuote.objects.all()
 
     if query:
-        stocks = stocks.filter(name__icontains=query) | stocks.filter(code__icontains=query)
+        # 메모리 검색 인덱스 (초성 검색 포함, stocks/stock_search.py)
+        from .stock_search import search_stocks
+        codes = [e.code for e in search_stocks(query, limit=None, kinds=('stock',), active_only=True)]
+        stocks = stocks.filter(stock__in=codes)
 
     if market:
         stocks = stocks.filter(market=market)
@@ -539,110 +488,10 @@ def stock_detail(request, code):
     quarterly_op = [int(f.operating_profit / 100000000) if f.operating_profit else 0 for f in quarterly_financials]
     quarterly_estimated = [f.is_estimated for f in quarterly_financials]
 
-    # 일봉 차트 데이터 (최근 240일 + 이평선 계산용 60일 = 300일)
-    daily_charts = list(DailyChart.objects.filter(
-        stock=stock
-    ).order_by('-date')[:300])
-    daily_charts.reverse()
-
-    # 이평선 계산 (20일, 60일)
-    def calc_ma(data, period):
-        result = []
-        for i in range(len(data)):
-            if i < period - 1:
-                result.append(None)
-            else:
-                avg = sum(d.closing_price for d in data[i - period + 1:i + 1]) / period
-                result.append(round(avg))
-        return result
-
-    ma20 = calc_ma(daily_charts, 20)
-    ma60 = calc_ma(daily_charts, 60)
-
-    # 최근 240일만 사용
-    daily_charts = daily_charts[-240:]
-    ma20 = ma20[-240:]
-    ma60 = ma60[-240:]
-
-    daily_candle_data = [
-        {
-            'time': d.date.strftime('%Y-%m-%d'),
-            'open': d.opening_price,
-            'high': d.high_price,
-            'low': d.low_price,
-            'close': d.closing_price,
-        }
-        for d in daily_charts
-    ]
-    daily_volume_data = [
-        {
-            'time': d.date.strftime('%Y-%m-%d'),
-            'value': d.trading_volume,
-            'color': '#ef5350' if d.closing_price >= d.opening_price else '#26a69a',
-        }
-        for d in daily_charts
-    ]
-    daily_ma20_data = [
-        {'time': daily_charts[i].date.strftime('%Y-%m-%d'), 'value': ma20[i]}
-        for i in range(len(daily_charts)) if ma20[i] is not None
-    ]
-    daily_ma60_data = [
-        {'time': daily_charts[i].date.strftime('%Y-%m-%d'), 'value': ma60[i]}
-        for i in range(len(daily_charts)) if ma60[i] is not None
-    ]
-
-    # 주봉 차트 데이터 (최근 104주 = 2년)
-    weekly_charts = list(WeeklyChart.objects.filter(
-        stock=stock
-    ).order_by('-date')[:104])
-    weekly_charts.reverse()
-
-    weekly_candle_data = [
-        {
-            'time': w.date.strftime('%Y-%m-%d'),
-            'open': w.opening_price,
-            'high': w.high_price,
-            'low': w.low_price,
-            'close': w.closing_price,
-        }
-        for w in weekly_charts
-    ]
-    weekly_volume_data = [
-        {
-            'time': w.date.strftime('%Y-%m-%d'),
-            'value': w.trading_volume,
-            'color': '#ef5350' if w.closing_price >= w.opening_price else '#26a69a',
-        }
-        for w in weekly_charts
-    ]
-
-    # 월봉 차트 데이터 (최근 72개월 = 6년)
-    monthly_charts = list(MonthlyChart.objects.filter(
-        stock=stock
-    ).order_by('-date')[:72])
-    monthly_charts.reverse()
-
-    monthly_candle_data = [
-        {
-            'time': m.date.strftime('%Y-%m-%d'),
-            'open': m.opening_price,
-            'high': m.high_price,
-            'low': m.low_price,
-            'close': m.closing_price,
-        }
-        for m in monthly_charts
-    ]
-    monthly_volume_data = [
-        {
-            'time': m.date.strftime('%Y-%m-%d'),
-            'value': m.trading_volume,
-            'color': '#ef5350' if m.closing_price >= m.opening_price else '#26a69a',
-        }
-        for m in monthly_charts
-    ]
+    # 일/주/월봉 차트는 차트 데이터 API로 비동기 로드 (stock_chart_data)
 
-    # 섹터 (업종) - 고유한 이름만 추출
-    sectors = stock.sectors.values('code', 'name').distinct().order_by('name')
+    # 섹터 (업종 마스터, 종목당 몇 건)
+    sectors = stock.sectors.values('code', 'name').order_by('name')
 
     # 기업분석 HTML 파일 확인
     html_path = Path(django_settings.MEDIA_ROOT) / 'analysis' / f'{code}.html'
@@ -660,14 +509,6 @@ def stock_detail(request, code):
         'quarterly_revenue': json.dumps(quarterly_revenue),
         'quarterly_op': json.dumps(quarterly_op),
         'quarterly_estimated': json.dumps(quarterly_estimated),
-        'daily_candle_data': json.dumps(daily_candle_data),
-        'daily_volume_data': json.dumps(daily_volume_data),
-        'daily_ma20_data': json.dumps(daily_ma20_data),
-        'daily_ma60_data': json.dumps(daily_ma60_data),
-        'weekly_candle_data': json.dumps(weekly_candle_data),
-        'weekly_volume_data': json.dumps(weekly_volume_data),
-        'monthly_candle_data': json.dumps(monthly_candle_data),
-        'monthly_volume_data': json.dumps(monthly_volume_data),
     }
     return render(request, 'stocks/stock_detail.html', context)
 
@@ -789,6 +630,7 @@ def stock_edit(request, code):
         from .models import CustomSector
         sector_ids = request.POST.getlist('custom_sectors')
         stock.custom_sectors.set(CustomSector.objects.filter(id__in=sector_ids))
+        bump_data_version('watchlist')
 
         # 관심 종목 변경 시 데이터 수집/삭제
         if old_interest_level is None and new_interest_level is not None:
@@ -811,30 +653,101 @@ def stock_edit(request, code):
     # 관심 단계 선택지
     interest_choices = Info._meta.get_field('interest_level').choices
 
-    # 리포트 (최근 20개, 총 개수 포함)
-    reports_queryset = Report.objects.filter(stock=stock).order_by('-date')
-    total_reports = reports_queryset.count()
-    reports = list(reports_queryset[:20])
+    # 업종 (전체 및 현재 종목의 업종)
+    from .models import ThemeCategory, CustomSector
+    theme_categories = ThemeCategory.objects.prefetch_related('themes').all()
+    stock_theme_ids = list(stock.themes.values_list('id', flat=True))
+
+    # 관심섹터 (전체)
+    custom_sectors = CustomSector.objects.all()
+
+    # 기업분석 HTML 파일 확인 (기본정보 폼에서 함께 저장되므로 셸에 포함)
+    html_path = Path(django_settings.MEDIA_ROOT) / 'analysis' / f'{code}.html'
+    analysis_html_exists = html_path.exists()
+    analysis_html_content = html_path.read_text(encoding='utf-8') if analysis_html_exists else ''
+
+    # 나머지 탭(수급/공매도/공시/리포트/텔레그램/뉴스/노다지/유튜브)은 stock_edit_tab으로 지연 로딩
+    context = {
+        'stock': stock,
+        'interest_choices': interest_choices,
+        'theme_categories': theme_categories,
+        'stock_theme_ids': stock_theme_ids,
+        'custom_sectors': custom_sectors,
+        'analysis_html_exists': analysis_html_exists,
+        'analysis_html_content': analysis_html_content,
+    }
+    return render(request, 'stocks/stock_edit.html', context)
+
+
+# ============ 종목 편집 탭 (지연 로딩 조각) ============
+
+def build_edit_supply_context(stock):
+    """수급 탭: 투자자별 매매동향 최근 60일 + 누적 순매수 차트 데이터"""
+    investor_trends = list(InvestorTrend.objects.filter(stock=stock).order_by('-date')[:60])
+
+    # 수급 누적 차트 데이터 (오래된 날짜부터)
+    investor_chart_data = []
+    cum_individual = 0
+    cum_foreign = 0
+    cum_institution = 0
+    for t in reversed(investor_trends):
+        cum_individual += t.individual or 0
+        cum_foreign += t.foreign or 0
+        cum_institution += t.institution or 0
+        investor_chart_data.append({
+            'date': t.date.strftime('%m.%d'),
+            'individual': cum_individual,
+            'foreign': cum_foreign,
+            'institution': cum_institution,
+        })
+
+    return {
+        'investor_trends': investor_trends,
+        'investor_chart_data': investor_chart_data,
+    }
+
+
+def build_edit_shortsell_context(stock):
+    """공매도 탭: 최근 60일"""
+    return {'short_sellings': ShortSelling.objects.filter(stock=stock).order_by('-date')[:60]}
+
+
+def build_edit_disclosure_context(stock):
+    """공시 탭: 최근 20개"""
+    return {'gongsi_list': Gongsi.objects.filter(stock=stock).order_by('-date')[:20]}
+
+
+def build_edit_report_context(stock):
+    """리포트 탭: 최근 20개 (총 개수는 같은 쿼리의 윈도 함수로) + 주가 vs 목표가 차트 데이터"""
+    from django.db.models import Count, Window
+
+    reports = list(
+        Report.objects.full().filter(stock=stock)
+        .annotate(total_count=Window(Count('id')))
+        .order_by('-date')[:20]
+    )
+    total_reports = reports[0].total_count if reports else 0
+
+    price_chart_data = []
+    target_chart_data = []
+    gap_chart_data = []
 
     # 목표가 차트 데이터 (리포트 날짜 범위의 주가 + 목표가)
     if reports:
-        # 리포트 날짜 범위
-        report_dates = [r.date for r in reports]
-        min_date = min(report_dates)
+        min_date = min(r.date for r in reports)
 
         # 해당 기간의 일봉 데이터
         daily_prices = list(DailyChart.objects.filter(
             stock=stock,
             date__gte=min_date
-        ).order_by('date').values('date', 'closing_price'))
+        ).order_by('date').values_list('date', 'closing_price'))
 
         # 날짜별 종가 딕셔너리
-        price_by_date = {d['date']: d['closing_price'] for d in daily_prices}
+        price_by_date = dict(daily_prices)
 
-        # 차트 데이터 생성
         price_chart_data = [
-            {'x': d['date'].strftime('%Y-%m-%d'), 'y': d['closing_price']}
-            for d in daily_prices
+            {'x': d.strftime('%Y-%m-%d'), 'y': closing}
+            for d, closing in daily_prices
         ]
 
         # 목표가 데이터 (같은 날 여러 개면 평균)
@@ -857,101 +770,86 @@ def stock_edit(request, code):
                 r.gap_rate = None
 
         # 괴리율 차트 데이터 (날짜별 평균 목표가 기준)
-        gap_chart_data = []
         for date, prices in sorted(target_by_date.items()):
             if date in price_by_date:
                 avg_target = round(sum(prices) / len(prices))
                 closing = price_by_date[date]
                 gap = round((avg_target / closing - 1) * 100, 1)
                 gap_chart_data.append({'x': date.strftime('%Y-%m-%d'), 'y': gap})
-    else:
-        price_chart_data = []
-        target_chart_data = []
-        gap_chart_data = []
 
-    # 노다지 기사 (종목명 포함된 것만, 최근 20개)
-    nodaji_queryset = Nodaji.objects.filter(
-        stock=stock,
-        title__contains=stock.name
-    ).order_by('-date')
-    total_nodaji = nodaji_queryset.count()
-    nodaji_list = list(nodaji_queryset[:20])
+    return {
+        'reports': reports,
+        'total_reports': total_reports,
+        'price_target_chart_data': {
+            'price': price_chart_data,
+            'target': target_chart_data,
+            'gap': gap_chart_data,
+        },
+    }
 
-    # 공시 (최근 20개)
-    gongsi_list = Gongsi.objects.filter(stock=stock).order_by('-date')[:20]
 
-    # 수급 (투자자별 매매동향, 최근 60일)
-    investor_trends = list(InvestorTrend.objects.filter(stock=stock).order_by('-date')[:60])
+def build_edit_telegram_context(stock):
+    """텔레그램 탭: 저장된 메시지"""
+    from .models import TelegramMessage
+    return {'telegram_messages': TelegramMessage.objects.filter(stock=stock)}
 
-    # 수급 누적 차트 데이터 (오래된 날짜부터)
-    investor_chart_data = []
-    if investor_trends:
-        trends_asc = list(reversed(investor_trends))
-        cum_individual = 0
-        cum_foreign = 0
-        cum_institution = 0
-        for t in trends_asc:
-            cum_individual += t.individual or 0
-            cum_foreign += t.foreign or 0
-            cum_institution += t.institution or 0
-            investor_chart_data.append({
-                'date': t.date.strftime('%m.%d'),
-                'individual': cum_individual,
-                'foreign': cum_foreign,
-                'institution': cum_institution,
-            })
 
-    # 공매도 (최근 60일)
-    short_sellings = ShortSelling.objects.filter(stock=stock).order_by('-date')[:60]
+def build_edit_news_context(stock):
+    """뉴스 탭: 저장된 뉴스"""
+    from .models import News
+    return {'news_articles': News.objects.filter(stock=stock).with_exists()}
 
-    # 업종 (전체 및 현재 종목의 업종)
-    from .models import ThemeCategory, YoutubeVideo, CustomSector
-    theme_categories = ThemeCategory.objects.prefetch_related('themes').all()
-    stock_theme_ids = list(stock.themes.values_list('id', flat=True))
 
-    # 관심섹터 (전체)
-    custom_sectors = CustomSector.objects.all()
+def build_edit_nodaji_context(stock):
+    """노다지 탭: 종목명 포함 기사 최근 20개 (총 개수는 같은 쿼리의 윈도 함수로)"""
+    from django.db.models import Count, Window
 
-    # 저장된 유튜브 영상
-    youtube_videos = YoutubeVideo.objects.filter(stock=stock)
+    nodaji_list = list(
+        Nodaji.objects.full().filter(stock=stock, title__contains=stock.name)
+        .annotate(total_count=Window(Count('id')))
+        .order_by('-date')[:20]
+    )
+    return {
+        'nodaji_list': nodaji_list,
+        'total_nodaji': nodaji_list[0].total_count if nodaji_list else 0,
+    }
 
-    # 저장된 뉴스
-    from .models import News
-    news_articles = News.objects.filter(stock=stock)
 
-    # 저장된 텔레그램 메시지
-    from .models import TelegramMessage
-    telegram_messages = TelegramMessage.objects.filter(stock=stock)
+def build_edit_youtube_context(stock):
+    """유튜브 탭: 저장된 영상"""
+    from .models import YoutubeVideo
+    return {'youtube_videos': YoutubeVideo.objects.filter(stock=stock).with_exists()}
+
+
+# 탭 → context 함수 (템플릿: stocks/stock_edit/<탭>.html)
+EDIT_TABS = {
+    'supply': build_edit_supply_context,
+    'shortsell': build_edit_shortsell_context,
+    'disclosure': build_edit_disclosure_context,
+    'report': build_edit_report_context,
+    'telegram': build_edit_telegram_context,
+    'news': build_edit_news_context,
+    'nodaji': build_edit_nodaji_context,
+    'youtube': build_edit_youtube_context,
+}
 
-    # 기업분석 HTML 파일 확인
-    html_path = Path(django_settings.MEDIA_ROOT) / 'analysis' / f'{code}.html'
-    analysis_html_exists = html_path.exists()
-    analysis_html_content = html_path.read_text(encoding='utf-8') if analysis_html_exists else ''
 
-    context = {
-        'stock': stock,
-        'interest_choices': interest_choices,
-        'theme_categories': theme_categories,
-        'stock_theme_ids': stock_theme_ids,
-        'custom_sectors': custom_sectors,
-        'reports': reports,
-        'total_reports': total_reports,
-        'price_chart_data': json.dumps(price_chart_data),
-        'target_chart_data': json.dumps(target_chart_data),
-        'gap_chart_data': json.dumps(gap_chart_data),
-        'nodaji_list': nodaji_list,
-        'total_nodaji': total_nodaji,
-        'gongsi_list': gongsi_list,
-        'investor_trends': investor_trends,
-        'investor_chart_data': json.dumps(investor_chart_data),
-        'short_sellings': short_sellings,
-        'youtube_videos': youtube_videos,
-        'news_articles': news_articles,
-        'telegram_messages': telegram_messages,
-        'analysis_html_exists': analysis_html_exists,
-        'analysis_html_content': analysis_html_content,
-    }
-    return render(request, 'stocks/stock_edit.html', context)
+@require_GET
+def stock_edit_tab(request, code, tab):
+    """
+    종목 편집 탭 조각 (HTML)
+
+    편집 페이지는 기본정보 탭만 렌더링하고, 나머지 탭은 처음 열 때 이 조각을 불러옵니다.
+    """
+    from django.http import Http404
+
+    if tab not in EDIT_TABS:
+        raise Http404(f'알 수 없는 탭: {tab}')
+    stock = get_object_or_404(Info.objects.only('code', 'name'), code=code)
+
+    context = EDIT_TABS[tab](stock)
+    context['stock'] = stock
+    return render(request, f'stocks/stock_edit/{tab}.html', context)
 
 
 from django.views.decorators.clickjacking import xframe_options_sameorigin
@@ -1070,6 +968,155 @@ def etf_signal_chart_data(request, code):
     })
 
 
+def signal_chart_batch_response(request, asset):
+    """
+    신호 차트 일괄 응답 (codes=005930,000660,...)
+
+    대시보드 렌더링 직후 카드 종목 전체를 미리 받아 두고, 신호 차트 팝업은 요청 없이 표시합니다.
+    """
+    from .models import InfoETF
+    from .charts import SIGNAL_WINDOW, MAX_BATCH_CODES, load_recent_windows
+
+    codes = list(dict.fromkeys(filter(None, request.GET.get('codes', '').split(','))))
+    if not codes:
+        return JsonResponse({'error': '종목코드(codes)를 입력해주세요.'}, status=400)
+    if len(codes) > MAX_BATCH_CODES:
+        return JsonResponse({'error': f'한 번에 최대 {MAX_BATCH_CODES}개까지 조회할 수 있습니다.'}, status=400)
+
+    owner_model = Info if asset == 'stock' else InfoETF
+    owners = owner_model.objects.filter(code__in=codes).only('code', 'name', 'current_price')
+    windows = load_recent_windows(asset, codes, SIGNAL_WINDOW)
+
+    charts = {}
+    for owner in owners:
+        charts[owner.code] = {
+            'name': owner.name,
+            'current_price': owner.current_price,
+            **windows.get(owner.code, {}),
+        }
+    return JsonResponse({'success': True, 'charts': charts})
+
+
+@require_GET
+def signal_chart_batch(request):
+    """신호 차트 일괄 API (대시보드 카드 종목, 최근 120일봉 컬럼형)"""
+    return signal_chart_batch_response(request, 'stock')
+
+
+@require_GET
+def etf_signal_chart_batch(request):
+    """ETF 신호 차트 일괄 API (최근 120일봉 컬럼형)"""
+    return signal_chart_batch_response(request, 'etf')
+
+
+def chart_data_response(request, asset, code, overlays=False):
+    """
+    컬럼형 차트 데이터 응답 (조건부 GET 지원)
+
+    쿼리 파라미터:
+        timeframe: daily / weekly / monthly (기본값: daily)
+        limit: 봉 개수 (기본값: 일 240 / 주 104 / 월 72, 최대 MAX_LIMIT)
+        before: 이 날짜(YYYY-MM-DD) 이전 봉만 조회 (과거 구간 추가 로드)
+        points: 화면에 그릴 최대 포인트 수 (봉이 더 많으면 다운샘플링)
+        style: candle / line (차트 API, line은 종가 LTTB)
+        ind: (지표 API) 지표 목록 (예: sma:20,ema:12,bb:20:2,rsi:14,macd:12:26:9,atr:14,obv,vwap:20)
+    """
+    from django.utils.cache import get_conditional_response, patch_cache_control
+    from django.utils.http import http_date
+    from .charts import (
+        TIMEFRAMES, DEFAULT_LIMITS, MAX_LIMIT, CHART_STYLES,
+        load_chart, load_overlays, get_validators, bucket_size, count_bars,
+    )
+    from .indicators import parse_overlay_specs, overlay_key
+
+    timeframe = request.GET.get('timeframe', 'daily')
+    if timeframe not in TIMEFRAMES:
+        return JsonResponse({'error': f'timeframe은 {", ".join(TIMEFRAMES)} 중 하나입니다.'}, status=400)
+
+    try:
+        limit = int(request.GET.get('limit', DEFAULT_LIMITS[timeframe]))
+        points = int(request.GET.get('points', 0))
+    except ValueError:
+        return JsonResponse({'error': 'limit, points는 숫자여야 합니다.'}, status=400)
+    limit = max(1, min(limit, MAX_LIMIT))
+
+    style = request.GET.get('style', 'candle')
+    if style not in CHART_STYLES:
+        return JsonResponse({'error': f'style은 {", ".join(CHART_STYLES)} 중 하나입니다.'}, status=400)
+
+    before = None
+    if request.GET.get('before'):
+        try:
+            before = datetime.strptime(request.GET['before'], '%Y-%m-%d').date()
+        except ValueError:
+            return JsonResponse({'error': 'before는 YYYY-MM-DD 형식이어야 합니다.'}, status=400)
+
+    # 포인트 수 대신 묶음 크기로 정규화 (비슷한 화면 크기끼리 캐시 공유)
+    # 묶음 크기는 실제 봉 수 기준 (봉이 limit보다 적은 종목에서 과하게 묶지 않도록)
+    bucket = 1
+    if points > 0:
+        bucket = bucket_size(count_bars(asset, code, timeframe, limit, before), points)
+
+    params = f'limit={limit};before={before};bucket={bucket};style={style}'
+    if overlays:
+        try:
+            specs = parse_overlay_specs(request.GET.get('ind', ''))
+        except ValueError as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        if not specs:
+            return JsonResponse({'error': '지표(ind)를 지정해주세요.'}, status=400)
+        params += ';ind=' + ','.join(overlay_key(name, p) for name, p in specs)
+
+    etag, last_modified = get_validators(asset, code, timeframe, params)
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if overlays:
+            payload = load_overlays(asset, code, timeframe, limit, specs, etag, before, bucket)
+        else:
+            payload = load_chart(asset, code, timeframe, limit, etag, before, bucket, style)
+        response = JsonResponse({'success': True, 'timeframe': timeframe, **payload})
+
+    # 브라우저 캐시 보관, 매 요청 재검증 (변경 없으면 304)
+    response['ETag'] = etag
+    if last_modified:
+        response['Last-Modified'] = http_date(last_modified)
+    patch_cache_control(response, private=True, no_cache=True)
+    return response
+
+
+@require_GET
+def stock_chart_data(request, code):
+    """종목 차트 데이터 API (컬럼형 일/주/월봉)"""
+    get_object_or_404(Info.objects.only('code'), code=code)
+    return chart_data_response(request, 'stock', code)
+
+
+@require_GET
+def etf_chart_data(request, code):
+    """ETF 차트 데이터 API (컬럼형 일/주/월봉)"""
+    from .models import InfoETF
+
+    get_object_or_404(InfoETF.objects.only('code'), code=code)
+    return chart_data_response(request, 'etf', code)
+
+
+@require_GET
+def stock_indicator_data(request, code):
+    """종목 지표 오버레이 API (SMA/EMA/볼린저/RSI/MACD/ATR/OBV/VWAP)"""
+    get_object_or_404(Info.objects.only('code'), code=code)
+    return chart_data_response(request, 'stock', code, overlays=True)
+
+
+@require_GET
+def etf_indicator_data(request, code):
+    """ETF 지표 오버레이 API"""
+    from .models import InfoETF
+
+    get_object_or_404(InfoETF.objects.only('code'), code=code)
+    return chart_data_response(request, 'etf', code, overlays=True)
+
+
 # 텔레그램 채널 목록 (채널ID: 표시명)
 TELEGRAM_CHANNELS = {
     '@darthacking': '주식공시',
@@ -1103,8 +1150,10 @@ TELEGRAM_CHANNELS = {
 
 
 @require_GET
-def search_telegram(request):
-    """텔레그램 채널 검색 API"""
+async def search_telegram(request):
+    """텔레그램 채널 검색 API (채널별 검색을 동시에 진행)"""
+    from .external import telegram_client
+
     keyword = request.GET.get('keyword', '')
     limit = int(request.GET.get('limit', 30))
     days = int(request.GET.get('days', 7))  # 기본 7일, 최대 180일
@@ -1112,48 +1161,40 @@ def search_telegram(request):
     if not keyword:
         return JsonResponse({'error': '검색어가 필요합니다.'}, status=400)
 
-    api_id = config('TELEGRAM_API_ID')
-    api_hash = config('TELEGRAM_API_HASH')
+    # 지정된 기간 전 날짜
+    date_limit = datetime.now(timezone.utc) - timedelta(days=min(days, 180))
 
-    async def search():
-        async with TelegramClient('telegram_session', api_id, api_hash) as client:
-            # 지정된 기간 전 날짜
-            date_limit = datetime.now(timezone.utc) - timedelta(days=min(days, 180))
-
-            # 채널별 결과
-            by_channel = {}
-
-            for channel in TELEGRAM_CHANNELS.keys():
-                try:
-                    entity = await client.get_entity(channel)
-                    msgs = await client.get_messages(entity, search=keyword, limit=limit)
-
-                    channel_msgs = [m for m in msgs if m.text]
-
-                    # 기간 이내 메시지 필터링
-                    recent_msgs = [m for m in channel_msgs if m.date >= date_limit]
+    async def search_channel(client, channel):
+        try:
+            entity = await client.get_entity(channel)
+            msgs = await client.get_messages(entity, search=keyword, limit=limit)
+        except Exception:
+            return {}  # 채널 접근 실패
 
-                    # 3개 미만이면 날짜 상관없이 최대 3개
-                    if len(recent_msgs) < 3:
-                        recent_msgs = channel_msgs[:3]
+        channel_msgs = [m for m in msgs if m.text]
 
-                    # 날짜별 그룹핑
-                    by_date = defaultdict(list)
-                    for msg in recent_msgs:
-                        date_str = msg.date.strftime('%Y-%m-%d')
-                        by_date[date_str].append({
-                            'time': msg.date.strftime('%H:%M'),
-                            'text': msg.text
-                        })
+        # 기간 이내 메시지 필터링
+        recent_msgs = [m for m in channel_msgs if m.date >= date_limit]
 
-                    by_channel[channel] = dict(by_date)
-                except Exception:
-                    by_channel[channel] = {}  # 채널 접근 실패
+        # 3개 미만이면 날짜 상관없이 최대 3개
+        if len(recent_msgs) < 3:
+            recent_msgs = channel_msgs[:3]
 
-            return by_channel
+        # 날짜별 그룹핑
+        by_date = defaultdict(list)
+        for msg in recent_msgs:
+            date_str = msg.date.strftime('%Y-%m-%d')
+            by_date[date_str].append({
+                'time': msg.date.strftime('%H:%M'),
+                'text': msg.text
+            })
+        return dict(by_date)
 
     try:
-        results = asyncio.run(search())
+        async with telegram_client() as client:
+            channels = list(TELEGRAM_CHANNELS.keys())
+            found = await asyncio.gather(*(search_channel(client, channel) for channel in channels))
+        results = dict(zip(channels, found))
         return JsonResponse({
             'success': True,
             'keyword': keyword,
@@ -1202,7 +1243,8 @@ def search_report(request):
 
 
 @require_GET
-def search_nodaji(request):
+@background_job(ttl=SEARCH_RESULT_TTL)
+async def search_nodaji(request):
     """노다지(네이버 프리미엄 콘텐츠) 검색 API - Playwright 사용"""
     keyword = request.GET.get('keyword', '')
 
@@ -1212,80 +1254,70 @@ def search_nodaji(request):
     url = f'https://contents.premium.naver.com/ystreet/irnote/search?searchQuery={keyword}'
 
     try:
-        from playwright.sync_api import sync_playwright
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle')
-
-            # 페이지 로드 대기 및 스크롤
-            page.wait_for_timeout(3000)
-            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            page.wait_for_timeout(2000)
-
-            # 디버그: HTML 구조 확인
-            html = page.content()
-            browser.close()
-
-            # HTML에서 검색 결과 파싱
-            from bs4 import BeautifulSoup
-            soup = BeautifulSoup(html, 'html.parser')
-
-            results = []
-            # 노다지 검색 결과 셀렉터
-            cards = soup.select('.psp_content_item')
-
-            for card in cards[:20]:
-                # 실제 기사 제목 (.psp_name)
-                title_el = card.select_one('strong.psp_name')
-                title = title_el.get_text(strip=True) if title_el else ''
-
-                # 카테고리
-                category_el = card.select_one('.psp_category_name')
-                category = category_el.get_text(strip=True) if category_el else ''
-
-                # 날짜
-                date_el = card.select_one('.psp_content_info_text')
-                date = date_el.get_text(strip=True) if date_el else ''
-
-                # 링크
-                link_el = card.select_one('a.psp_content_link')
-                link = ''
-                if link_el and link_el.get('href'):
-                    link = link_el.get('href')
-                    if not link.startswith('http'):
-                        link = 'https://contents.premium.naver.com' + link
-
-                if title:
-                    results.append({
-                        'title': title,
-                        'category': category,
-                        'date': date,
-                        'link': link,
-                    })
+        from .external import render_html
+
+        # 검색 결과가 나타날 때까지 대기 후 스크롤
+        html = await render_html(url, selector='.psp_content_item', scroll=True)
+
+        # HTML에서 검색 결과 파싱
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, 'html.parser')
+
+        results = []
+        # 노다지 검색 결과 셀렉터
+        cards = soup.select('.psp_content_item')
+
+        for card in cards[:20]:
+            # 실제 기사 제목 (.psp_name)
+            title_el = card.select_one('strong.psp_name')
+            title = title_el.get_text(strip=True) if title_el else ''
+
+            # 카테고리
+            category_el = card.select_one('.psp_category_name')
+            category = category_el.get_text(strip=True) if category_el else ''
+
+            # 날짜
+            date_el = card.select_one('.psp_content_info_text')
+            date = date_el.get_text(strip=True) if date_el else ''
+
+            # 링크
+            link_el = card.select_one('a.psp_content_link')
+            link = ''
+            if link_el and link_el.get('href'):
+                link = link_el.get('href')
+                if not link.startswith('http'):
+                    link = 'https://contents.premium.naver.com' + link
+
+            if title:
+                results.append({
+                    'title': title,
+                    'category': category,
+                    'date': date,
+                    'link': link,
+                })
 
-            # 날짜순 정렬 (최신순)
-            def parse_date_for_sort(item):
-                date_str = item.get('date', '')
-                # "2024.12.06" 형식
-                if '.' in date_str and len(date_str) >= 10:
-                    try:
-                        return datetime.strptime(date_str[:10], '%Y.%m.%d')
-                    except ValueError:
-                        pass
-                # "12월 6일" 형식
-                if '월' in date_str and '일' in date_str:
-                    try:
-                        import re
-                        match = re.match(r'(\d+)월\s*(\d+)일', date_str)
-                        if match:
-                            month, day = int(match.group(1)), int(match.group(2))
-                            return datetime(datetime.now().year, month, day)
-                    except:
-                        pass
-                return datetime.min
+        # 날짜순 정렬 (최신순)
+        def parse_date_for_sort(item):
+            date_str = item.get('date', '')
+            # "2024.12.06" 형식
+            if '.' in date_str and len(date_str) >= 10:
+                try:
+                    return datetime.strptime(date_str[:10], '%Y.%m.%d')
+                except ValueError:
+                    pass
+            # "12월 6일" 형식
+            if '월' in date_str and '일' in date_str:
+                try:
+                    import re
+                    match = re.match(r'(\d+)월\s*(\d+)일', date_str)
+                    if match:
+                        month, day = int(match.group(1)), int(match.group(2))
+                        return datetime(datetime.now().year, month, day)
+                except:
+                    pass
+            return datetime.min
 
-            results.sort(key=parse_date_for_sort, reverse=True)
+        results.sort(key=parse_date_for_sort, reverse=True)
 
         return JsonResponse({
             'success': True,
@@ -1298,50 +1330,45 @@ def search_nodaji(request):
 
 
 @require_GET
-def search_disclosure(request):
+async def search_disclosure(request):
     """공시 검색 API (darthacking 채널만, 2주)"""
+    from .external import telegram_client
+
     keyword = request.GET.get('keyword', '')
     limit = int(request.GET.get('limit', 50))
 
     if not keyword:
         return JsonResponse({'error': '검색어가 필요합니다.'}, status=400)
 
-    api_id = config('TELEGRAM_API_ID')
-    api_hash = config('TELEGRAM_API_HASH')
-
-    async def search():
-        async with TelegramClient('telegram_session', api_id, api_hash) as client:
-            # 2주 전 날짜
-            two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14)
+    # 2주 전 날짜
+    two_weeks_ago = datetime.now(timezone.utc) - timedelta(days=14)
 
+    try:
+        async with telegram_client() as client:
             try:
                 entity = await client.get_entity('@darthacking')
                 msgs = await client.get_messages(entity, search=keyword, limit=limit)
+            except Exception:
+                msgs = []
 
-                channel_msgs = [m for m in msgs if m.text]
-
-                # 2주 이내 메시지 필터링
-                recent_msgs = [m for m in channel_msgs if m.date >= two_weeks_ago]
+        channel_msgs = [m for m in msgs if m.text]
 
-                # 날짜별 그룹핑
-                by_date = defaultdict(list)
-                for msg in recent_msgs:
-                    date_str = msg.date.strftime('%Y-%m-%d')
-                    by_date[date_str].append({
-                        'time': msg.date.strftime('%H:%M'),
-                        'text': msg.text
-                    })
+        # 2주 이내 메시지 필터링
+        recent_msgs = [m for m in channel_msgs if m.date >= two_weeks_ago]
 
-                return dict(by_date)
-            except Exception:
-                return {}
+        # 날짜별 그룹핑
+        by_date = defaultdict(list)
+        for msg in recent_msgs:
+            date_str = msg.date.strftime('%Y-%m-%d')
+            by_date[date_str].append({
+                'time': msg.date.strftime('%H:%M'),
+                'text': msg.text
+            })
 
-    try:
-        results = asyncio.run(search())
         return JsonResponse({
             'success': True,
             'keyword': keyword,
-            'results': results
+            'results': dict(by_date)
         })
     except Exception as e:
         return JsonResponse({'error': str(e)}, status=500)
@@ -1349,6 +1376,11 @@ def search_disclosure(request):
 
 def market(request):
     """시황 페이지"""
+    return render_cached_page(request, 'market', 'stocks/market.html', build_market_context)
+
+
+def build_market_context():
+    """시황 페이지 context (데이터 버전별 캐시 대상)"""
     # KOSPI 차트 데이터 (최근 240일)
     kospi_charts = list(IndexChart.objects.filter(code='KOSPI').order_by('-date')[:240])
     kospi_charts.reverse()
@@ -1463,71 +1495,64 @@ def market(request):
         'kosdaq_cumulative': json.dumps(kosdaq_cumulative),
         'futures_cumulative': json.dumps(futures_cumulative),
     }
-    return render(request, 'stocks/market.html', context)
+    return context
 
 
 @require_GET
-def fetch_nodaji_brief(request):
+@background_job(ttl=SEARCH_RESULT_TTL)
+async def fetch_nodaji_brief(request):
     """노다지 브리프 API (모닝브리프/마감브리프 최신 날짜만)"""
     try:
-        from playwright.sync_api import sync_playwright
+        import playwright.async_api  # noqa: F401
         from bs4 import BeautifulSoup
     except ImportError as e:
         return JsonResponse({'error': f'필수 모듈 없음: {e}'}, status=500)
 
+    from .external import render_html
+
     # 브리프 카테고리 페이지
     url = 'https://contents.premium.naver.com/ystreet/irnote/contents?categoryId=1949743df60000ube'
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle')
-
-            # 페이지 로드 대기
-            page.wait_for_timeout(3000)
-            page.evaluate('window.scrollTo(0, document.body.scrollHeight)')
-            page.wait_for_timeout(2000)
-
-            html = page.content()
-            browser.close()
-
-            # HTML 파싱
-            soup = BeautifulSoup(html, 'html.parser')
-            results = []
-            items = soup.select('.content_item')
-
-            for item in items:
-                # 제목
-                title_el = item.select_one('.content_title')
-                title = title_el.get_text(strip=True) if title_el else ''
-
-                # 모닝브리프, 마감브리프만 필터링
-                if not title.startswith('[모닝브리프]') and not title.startswith('[마감브리프]'):
-                    continue
+        # 목록이 나타날 때까지 대기 후 스크롤
+        html = await render_html(url, selector='.content_item', scroll=True)
 
-                # 카테고리 추출
-                category = '모닝브리프' if '[모닝브리프]' in title else '마감브리프'
+        # HTML 파싱
+        soup = BeautifulSoup(html, 'html.parser')
+        results = []
+        items = soup.select('.content_item')
 
-                # 날짜 (두번째 info_text)
-                info_texts = item.select('.content_info_text')
-                date = info_texts[1].get_text(strip=True) if len(info_texts) > 1 else ''
+        for item in items:
+            # 제목
+            title_el = item.select_one('.content_title')
+            title = title_el.get_text(strip=True) if title_el else ''
 
-                # 링크
-                link_el = item.select_one('a.content_text_link')
-                link = ''
-                if link_el and link_el.get('href'):
-                    link = link_el.get('href')
-                    if not link.startswith('http'):
-                        link = 'https://contents.premium.naver.com' + link
+            # 모닝브리프, 마감브리프만 필터링
+            if not title.startswith('[모닝브리프]') and not title.startswith('[마감브리프]'):
+                continue
 
-                if title:
-                    results.append({
-                        'category': category,
-                        'title': title,
-                        'date': date,
-                        'link': link,
-                    })
+            # 카테고리 추출
+            category = '모닝브리프' if '[모닝브리프]' in title else '마감브리프'
+
+            # 날짜 (두번째 info_text)
+            info_texts = item.select('.content_info_text')
+            date = info_texts[1].get_text(strip=True) if len(info_texts) > 1 else ''
+
+            # 링크
+            link_el = item.select_one('a.content_text_link')
+            link = ''
+            if link_el and link_el.get('href'):
+                link = link_el.get('href')
+                if not link.startswith('http'):
+                    link = 'https://contents.premium.naver.com' + link
+
+            if title:
+                results.append({
+                    'category': category,
+                    'title': title,
+                    'date': date,
+                    'link': link,
+                })
 
         # 모닝브리프, 마감브리프 각각 최신 1개씩
         morning = [r for r in results if r['category'] == '모닝브리프']
@@ -1550,7 +1575,7 @@ def fetch_nodaji_brief(request):
 
 def nodaji_summary(request, nodaji_id):
     """노다지 요약 편집 페이지"""
-    nodaji = get_object_or_404(Nodaji, id=nodaji_id)
+    nodaji = get_object_or_404(Nodaji.objects.full(), id=nodaji_id)
 
     if request.method == 'POST':
         summary = request.POST.get('summary', '')
@@ -1595,7 +1620,10 @@ def fetch_more_reports(request, code):
     offset = int(request.GET.get('offset', 20))
     limit = int(request.GET.get('limit', 20))
 
-    reports = Report.objects.filter(stock=stock).order_by('-date')[offset:offset + limit]
+    # limit + 1개를 읽어 다음 페이지 존재 여부 확인 (별도 count 쿼리 없음)
+    reports = list(Report.objects.full().filter(stock=stock).order_by('-date')[offset:offset + limit + 1])
+    has_more = len(reports) > limit
+    reports = reports[:limit]
 
     # 괴리율 계산을 위한 일봉 데이터
     report_dates = [r.date for r in reports]
@@ -1629,7 +1657,7 @@ def fetch_more_reports(request, code):
     return JsonResponse({
         'success': True,
         'reports': result,
-        'has_more': Report.objects.filter(stock=stock).count() > offset + limit
+        'has_more': has_more
     })
 
 
@@ -1640,10 +1668,13 @@ def fetch_more_nodaji(request, code):
     offset = int(request.GET.get('offset', 20))
     limit = int(request.GET.get('limit', 20))
 
-    nodaji_list = Nodaji.objects.filter(
+    # limit + 1개를 읽어 다음 페이지 존재 여부 확인 (별도 count 쿼리 없음)
+    nodaji_list = list(Nodaji.objects.full().filter(
         stock=stock,
         title__contains=stock.name
-    ).order_by('-date')[offset:offset + limit]
+    ).order_by('-date')[offset:offset + limit + 1])
+    has_more = len(nodaji_list) > limit
+    nodaji_list = nodaji_list[:limit]
 
     result = []
     for n in nodaji_list:
@@ -1655,32 +1686,99 @@ def fetch_more_nodaji(request, code):
             'summary': n.summary or '',
         })
 
-    total = Nodaji.objects.filter(stock=stock, title__contains=stock.name).count()
-
     return JsonResponse({
         'success': True,
         'nodaji': result,
-        'has_more': total > offset + limit
+        'has_more': has_more
     })
 
 
 @require_GET
 def search_stock(request):
-    """종목 검색 API"""
-    from django.db.models import Q
+    """
+    종목 검색 API (자동완성, DB 조회 없이 메모리 검색 인덱스 사용)
+
+    GET:
+        q: 종목명/코드/초성 (예: 삼성, 005930, ㅅㅅㅈㅈ)
+        kind: stock (기본값) / etf / all
+    """
+    from .stock_search import search_stocks
 
     query = request.GET.get('q', '').strip()
     if not query:
         return JsonResponse({'success': False, 'error': '검색어를 입력하세요.'})
 
-    stocks = Info.objects.filter(
-        Q(name__icontains=query) | Q(code__icontains=query)
-    )[:10]
+    kind = request.GET.get('kind', 'stock')
+    kinds = None if kind == 'all' else (kind,)
+    entries = search_stocks(query, limit=10, kinds=kinds)
 
-    result = [{'code': s.code, 'name': s.name} for s in stocks]
+    result = [{'code': e.code, 'name': e.name, 'market': e.market, 'kind': e.kind} for e in entries]
     return JsonResponse({'success': True, 'stocks': result})
 
 
+@require_GET
+def search_text(request):
+    """
+    저장된 텍스트 통합 검색 API (FTS5 색인, stocks/search.py 참고)
+
+    GET:
+        q: 검색어 (공백 구분, 모두 포함)
+        kind: 검색 대상 (쉼표 구분, 기본값: 전체) - stock, telegram, news, report, nodaji, youtube, sector_*
+        code: 종목코드 (해당 종목 문서만)
+        limit: 결과 수 (기본값: 30, 최대 100)
+
+    Returns:
+        results: 순위순 문서 (title_html, snippet_html에 <mark> 강조)
+        stocks: 검색어가 들어간 문서가 연결된 종목 (문서 수 많은 순)
+    """
+    from django.urls import reverse
+    from .search import SOURCES, mentioned_stocks, search
+
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'error': '검색어를 입력하세요.'}, status=400)
+
+    kinds = [k for k in request.GET.get('kind', '').split(',') if k]
+    unknown = [k for k in kinds if k not in SOURCES]
+    if unknown:
+        return JsonResponse({'error': f'알 수 없는 검색 대상입니다: {", ".join(unknown)}'}, status=400)
+
+    try:
+        limit = max(1, min(int(request.GET.get('limit') or 30), 100))
+    except ValueError:
+        limit = 30
+
+    results = search(query, kinds=kinds, stock_code=request.GET.get('code') or None, limit=limit)
+    mentions = mentioned_stocks(query, kinds=kinds)
+
+    codes = {r['stock_code'] for r in results if r['stock_code']} | {code for code, _ in mentions}
+    names = dict(Info.objects.filter(code__in=codes).values_list('code', 'name'))
+
+    detail_urls = {
+        'telegram': 'stocks:telegram_summary',
+        'news': 'stocks:news_summary',
+        'report': 'stocks:report_summary',
+        'nodaji': 'stocks:nodaji_summary',
+        'youtube': 'stocks:youtube_summary',
+        'sector_news': 'stocks:sector_news_summary',
+        'sector_youtube': 'stocks:sector_youtube_summary',
+    }
+    for r in results:
+        r['stock_name'] = names.get(r['stock_code'])
+        if r['kind'] in detail_urls:
+            r['url'] = reverse(detail_urls[r['kind']], args=[int(r['object_id'])])
+        elif r['kind'] == 'stock':
+            r['url'] = reverse('stocks:stock_detail', args=[r['stock_code']])
+        else:
+            r['url'] = reverse('stocks:sector_detail', args=[r['sector_id']])
+
+    return JsonResponse({
+        'success': True,
+        'results': results,
+        'stocks': [{'code': code, 'name': names.get(code), 'count': count} for code, count in mentions],
+    })
+
+
 @require_GET
 def fetch_stock_prompt_data(request, code):
     """종목 프롬프트 데이터 조회 API"""
@@ -1689,7 +1787,7 @@ def fetch_stock_prompt_data(request, code):
     stock = get_object_or_404(Info, code=code)
 
     # 리포트 최근 5개 (같은 날짜면 1개만)
-    all_reports = Report.objects.filter(stock=stock).order_by('-date')
+    all_reports = Report.objects.full().filter(stock=stock).order_by('-date')
     seen_dates = set()
     reports = []
     for r in all_reports:
@@ -1700,10 +1798,10 @@ def fetch_stock_prompt_data(request, code):
                 break
 
     # 유튜브 저장된 영상 (최근 5개)
-    youtube_videos = YoutubeVideo.objects.filter(stock=stock).order_by('-id')[:5]
+    youtube_videos = YoutubeVideo.objects.full().filter(stock=stock).order_by('-id')[:5]
 
     # 노다지 (요약 있는 것만, 최근 3개)
-    nodaji_list = Nodaji.objects.filter(
+    nodaji_list = Nodaji.objects.full().filter(
         stock=stock,
         title__contains=stock.name
     ).exclude(summary__isnull=True).exclude(summary='').order_by('-date')[:3]
@@ -1771,7 +1869,7 @@ def fetch_stock_prompt_data(request, code):
 def youtube_summary(request, video_id):
     """유튜브 영상 요약 편집 페이지"""
     from .models import YoutubeVideo
-    video = get_object_or_404(YoutubeVideo, id=video_id)
+    video = get_object_or_404(YoutubeVideo.objects.full(), id=video_id)
 
     if request.method == 'POST':
         summary = request.POST.get('summary', '')
@@ -1786,47 +1884,44 @@ def youtube_summary(request, video_id):
 
 
 @require_GET
-def fetch_dart(request, code):
+@background_job(ttl=SEARCH_RESULT_TTL)
+async def fetch_dart(request, code):
     """DART 공시 조회 API"""
     try:
-        from playwright.sync_api import sync_playwright
+        import playwright.async_api  # noqa: F401
         from bs4 import BeautifulSoup
     except ImportError as e:
         return JsonResponse({'error': f'필수 모듈 없음: {e}'}, status=500)
 
+    from .external import render_html
+
     url = f'https://dart.fss.or.kr/html/search/SearchCompany_M2.html?textCrpNM={code}'
 
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='domcontentloaded', timeout=60000)
-            page.wait_for_timeout(5000)
-
-            html = page.content()
-            browser.close()
-
-            soup = BeautifulSoup(html, 'html.parser')
-            table = soup.select_one('table')
-            rows = table.select('tbody tr') if table else []
-
-            results = []
-            for row in rows[:20]:
-                cells = row.select('td')
-                if len(cells) >= 5:
-                    report_el = cells[2].select_one('a')
-                    report_name = report_el.get_text(strip=True) if report_el else ''
-                    report_link = report_el.get('href', '') if report_el else ''
-
-                    if report_link and not report_link.startswith('http'):
-                        report_link = 'https://dart.fss.or.kr' + report_link
-
-                    results.append({
-                        'date': cells[4].get_text(strip=True),
-                        'title': report_name,
-                        'link': report_link,
-                        'submitter': cells[3].get_text(strip=True),
-                    })
+        # 공시 목록 행이 나타날 때까지 대기
+        html = await render_html(url, selector='table tbody tr', timeout=60000)
+
+        soup = BeautifulSoup(html, 'html.parser')
+        table = soup.select_one('table')
+        rows = table.select('tbody tr') if table else []
+
+        results = []
+        for row in rows[:20]:
+            cells = row.select('td')
+            if len(cells) >= 5:
+                report_el = cells[2].select_one('a')
+                report_name = report_el.get_text(strip=True) if report_el else ''
+                report_link = report_el.get('href', '') if report_el else ''
+
+                if report_link and not report_link.startswith('http'):
+                    report_link = 'https://dart.fss.or.kr' + report_link
+
+                results.append({
+                    'date': cells[4].get_text(strip=True),
+                    'title': report_name,
+                    'link': report_link,
+                    'submitter': cells[3].get_text(strip=True),
+                })
 
         return JsonResponse({
             'success': True,
@@ -1837,8 +1932,28 @@ def fetch_dart(request, code):
         return JsonResponse({'error': str(e)}, status=500)
 
 
+@require_GET
+def job_status(request, job_id):
+    """
+    백그라운드 작업 상태 API (job=1로 등록한 작업)
+
+    status: queued / running / done / error, 완료 시 result에 원래 API 응답
+    """
+    from .jobs import get_job
+
+    job = get_job(job_id)
+    if job is None:
+        return JsonResponse({'error': '작업을 찾을 수 없습니다. (만료 또는 잘못된 ID)'}, status=404)
+    return JsonResponse({'success': True, **job})
+
+
 def sector(request):
     """섹터 페이지"""
+    return render_cached_page(request, 'sector', 'stocks/sector.html', build_sector_context)
+
+
+def build_sector_context():
+    """섹터 페이지 context (데이터 버전별 캐시 대상)"""
     from .models import Sector, CustomSector
 
     # 사용자 정의 섹터
@@ -1920,7 +2035,7 @@ def sector(request):
         'kosdaq_chart_data': json.dumps(kosdaq_chart_data),
         'custom_sectors': custom_sectors,
     }
-    return render(request, 'stocks/sector.html', context)
+    return context
 
 
 def sector_detail(request, sector_id):
@@ -1928,19 +2043,19 @@ def sector_detail(request, sector_id):
     from .models import CustomSector, SectorTelegramMessage, SectorNews, SectorYoutubeVideo, SectorQuestionReport, Info, InfoETF
     from itertools import chain
 
-    sector = get_object_or_404(CustomSector, id=sector_id)
+    sector = get_object_or_404(CustomSector.objects.full(), id=sector_id)
 
     # 해당 섹터에 연결된 종목과 ETF
-    related_stocks = Info.objects.filter(custom_sectors=sector).order_by('name')
+    related_stocks = Info.objects.filter(custom_sectors=sector).only('code', 'name').order_by('name')
     related_etfs = InfoETF.objects.filter(custom_sectors=sector).order_by('name')
 
     # 질문-리포트 목록
-    question_reports = SectorQuestionReport.objects.filter(sector=sector)
+    question_reports = SectorQuestionReport.objects.full().filter(sector=sector)
 
     # 텔레그램, 뉴스, 유튜브 통합 리스트 (최신순)
     telegram_messages = SectorTelegramMessage.objects.filter(sector=sector)
-    news_articles = SectorNews.objects.filter(sector=sector)
-    youtube_videos = SectorYoutubeVideo.objects.filter(sector=sector)
+    news_articles = SectorNews.objects.filter(sector=sector).with_exists()
+    youtube_videos = SectorYoutubeVideo.objects.filter(sector=sector).with_exists()
 
     # 통합 리스트 생성
     all_items = []
@@ -1964,8 +2079,8 @@ def sector_detail(request, sector_id):
             'title': news.title,
             'source': news.source or '',
             'link': news.link,
-            'summary_url': f'/sector/news/{news.id}/summary/' if news.summary else None,
-            'has_summary': bool(news.summary),
+            'summary_url': f'/sector/news/{news.id}/summary/' if news.summary_exists else None,
+            'has_summary': news.summary_exists,
         })
     for video in youtube_videos:
         all_items.append({
@@ -1976,8 +2091,8 @@ def sector_detail(request, sector_id):
             'title': video.title,
             'source': video.channel or '',
             'link': video.link,
-            'summary_url': f'/sector/youtube/{video.id}/summary/' if video.summary else None,
-            'has_summary': bool(video.summary),
+            'summary_url': f'/sector/youtube/{video.id}/summary/' if video.summary_exists else None,
+            'has_summary': video.summary_exists,
         })
 
     # 날짜+시간 기준 정렬 (최신순)
@@ -2008,20 +2123,21 @@ def sector_edit(request, sector_id):
     """섹터 편집 페이지"""
     from .models import CustomSector, SectorTelegramMessage, SectorNews, SectorYoutubeVideo, SectorQuestionReport
 
-    sector = get_object_or_404(CustomSector, id=sector_id)
+    sector = get_object_or_404(CustomSector.objects.full(), id=sector_id)
 
     # POST 처리 (기본정보 저장)
     if request.method == 'POST' and request.POST.get('form_type') == 'info':
         sector.memo = request.POST.get('memo', '').strip()
         sector.basic_report = request.POST.get('basic_report', '')  # HTML이므로 strip 안함
         sector.save()
+        bump_data_version('watchlist')
         messages.success(request, f'{sector.name} 정보가 저장되었습니다.')
         return redirect('stocks:sector_edit', sector_id=sector_id)
 
     telegram_messages = SectorTelegramMessage.objects.filter(sector=sector).order_by('-date', '-time')
-    news_articles = SectorNews.objects.filter(sector=sector).order_by('-created_at')
-    youtube_videos = SectorYoutubeVideo.objects.filter(sector=sector).order_by('-created_at')
-    question_reports = SectorQuestionReport.objects.filter(sector=sector).order_by('-created_at')
+    news_articles = SectorNews.objects.filter(sector=sector).with_exists().order_by('-created_at')
+    youtube_videos = SectorYoutubeVideo.objects.filter(sector=sector).with_exists().order_by('-created_at')
+    question_reports = SectorQuestionReport.objects.full().filter(sector=sector).order_by('-created_at')
 
     context = {
         'sector': sector,
@@ -2074,7 +2190,7 @@ def settings(request):
 
     # 종목분류 프롬프트용 데이터 (종목 | 대분류 | 소분류)
     stock_classify_lines = []
-    stocks_with_themes = Info.objects.filter(themes__isnull=False).prefetch_related('themes__category').distinct()
+    stocks_with_themes = Info.objects.filter(themes__isnull=False).only('code', 'name').prefetch_related('themes__category').distinct()
     for stock in stocks_with_themes:
         for theme in stock.themes.all():
             stock_classify_lines.append(f"{stock.name} | {theme.category.name} | {theme.name}")
@@ -2098,9 +2214,52 @@ def settings(request):
     return render(request, 'stocks/settings.html', context)
 
 
+def profiling(request):
+    """
+    요청 프로파일 페이지 (관리자 전용, PROFILING_ENABLED=True일 때 기록)
+
+    POST action:
+        reset: 기록 초기화
+        cprofile: path로 시작하는 다음 요청 count개를 cProfile로 실행 (path 비우면 해제)
+    """
+    from django.core.exceptions import PermissionDenied
+    from . import profiling as request_profiling
+
+    if not request.user.is_superuser:
+        raise PermissionDenied
+
+    if request.method == 'POST':
+        action = request.POST.get('action')
+        if action == 'reset':
+            request_profiling.reset()
+            messages.success(request, '프로파일 기록을 초기화했습니다.')
+        elif action == 'cprofile':
+            path = request.POST.get('path', '').strip()
+            try:
+                count = max(1, min(int(request.POST.get('count') or 1), 20))
+            except ValueError:
+                count = 1
+            request_profiling.set_cprofile_target(path, count)
+            if path:
+                messages.success(request, f'{path} 요청 {count}건을 cProfile로 측정합니다.')
+            else:
+                messages.success(request, 'cProfile 측정을 해제했습니다.')
+        return redirect('stocks:profiling')
+
+    context = request_profiling.summarize()
+    context['enabled'] = django_settings.PROFILING_ENABLED
+    return render(request, 'stocks/profiling.html', context)
+
+
 def etf(request):
     """ETF 페이지"""
-    from .models import InfoETF, DailyChartETF
+    return render_cached_page(request, 'etf', 'stocks/etf.html', build_etf_context)
+
+
+def build_etf_context():
+    """ETF 페이지 context (데이터 버전별 캐시 대상)"""
+    from .models import InfoETF
+    from .charts import load_recent_bars
 
     # 관심 ETF 목록 (is_active=True)
     etfs = list(InfoETF.objects.filter(is_active=True).prefetch_related('custom_sectors').order_by('-market_cap'))
@@ -2110,13 +2269,8 @@ def etf(request):
     card_a_etfs = []  # 급등 (양봉, MA20 위)
     card_a_down_etfs = []  # 급락 (음봉, MA20 아래)
 
-    # 먼저 모든 ETF의 250일 데이터를 미리 가져옴
-    etf_daily_data_cache = {}
-    for etf_item in etfs:
-        daily_data = list(DailyChartETF.objects.filter(
-            etf=etf_item
-        ).order_by('-date')[:250])
-        etf_daily_data_cache[etf_item.code] = daily_data
+    # 모든 ETF의 최근 250일 데이터를 한 번에 가져옴 (최신 → 과거, OHLCV 큐브 또는 쿼리 1번)
+    etf_daily_data_cache = load_recent_bars('etf', [etf_item.code for etf_item in etfs], 250)
 
     for etf_item in etfs:
         # 캐시된 데이터 사용
@@ -2246,9 +2400,7 @@ def etf(request):
         if etf_item.code in card_ab_codes:
             continue
 
-        daily_data = list(DailyChartETF.objects.filter(
-            etf=etf_item
-        ).order_by('-date')[:65])
+        daily_data = etf_daily_data_cache.get(etf_item.code, [])[:65]
 
         if len(daily_data) < 65:
             continue
@@ -2296,9 +2448,7 @@ def etf(request):
         if etf_item.code in card_abd_codes:
             continue
 
-        daily_data = list(DailyChartETF.objects.filter(
-            etf=etf_item
-        ).order_by('-date')[:125])
+        daily_data = etf_daily_data_cache.get(etf_item.code, [])[:125]
 
         if len(daily_data) < 65:
             continue
@@ -2377,12 +2527,12 @@ def etf(request):
         'card_c_etfs': card_c_etfs,
         'card_d_etfs': card_d_etfs,
     }
-    return render(request, 'stocks/etf.html', context)
+    return context
 
 
 def etf_detail(request, code):
     """ETF 상세 페이지"""
-    from .models import InfoETF, DailyChartETF, WeeklyChartETF, MonthlyChartETF, CustomSector
+    from .models import InfoETF, CustomSector
 
     etf = get_object_or_404(InfoETF.objects.prefetch_related('custom_sectors'), code=code)
 
@@ -2390,84 +2540,12 @@ def etf_detail(request, code):
     if request.method == 'POST':
         sector_ids = request.POST.getlist('custom_sectors')
         etf.custom_sectors.set(CustomSector.objects.filter(id__in=sector_ids))
+        bump_data_version('etf')
         from django.contrib import messages
         messages.success(request, '관심섹터가 저장되었습니다.')
         return redirect('stocks:etf_detail', code=code)
 
-    # 일봉 차트 데이터 (최근 240일)
-    daily_charts = list(DailyChartETF.objects.filter(
-        etf=etf
-    ).order_by('-date')[:240])
-    daily_charts.reverse()
-
-    daily_candle_data = [
-        {
-            'time': d.date.strftime('%Y-%m-%d'),
-            'open': d.opening_price,
-            'high': d.high_price,
-            'low': d.low_price,
-            'close': d.closing_price,
-        }
-        for d in daily_charts
-    ]
-    daily_volume_data = [
-        {
-            'time': d.date.strftime('%Y-%m-%d'),
-            'value': d.trading_volume,
-            'color': '#ef5350' if d.closing_price >= d.opening_price else '#26a69a',
-        }
-        for d in daily_charts
-    ]
-
-    # 주봉 차트 데이터 (최근 104주 = 2년)
-    weekly_charts = list(WeeklyChartETF.objects.filter(
-        etf=etf
-    ).order_by('-date')[:104])
-    weekly_charts.reverse()
-
-    weekly_candle_data = [
-        {
-            'time': w.date.strftime('%Y-%m-%d'),
-            'open': w.opening_price,
-            'high': w.high_price,
-            'low': w.low_price,
-            'close': w.closing_price,
-        }
-        for w in weekly_charts
-    ]
-    weekly_volume_data = [
-        {
-            'time': w.date.strftime('%Y-%m-%d'),
-            'value': w.trading_volume,
-            'color': '#ef5350' if w.closing_price >= w.opening_price else '#26a69a',
-        }
-        for w in weekly_charts
-    ]
-
-    # 월봉 차트 데이터 (최근 72개월 = 6년)
-    monthly_charts = list(MonthlyChartETF.objects.filter(
-        etf=etf
-    ).order_by('-date')[:72])
-    monthly_charts.reverse()
-
-    monthly_candle_data = [
-        {
-            'time': m.date.strftime('%Y-%m-%d'),
-            'open': m.opening_price,
-            'high': m.high_price,
-            'low': m.low_price,
-            'close': m.closing_price,
-        }
-        for m in monthly_charts
-    ]
-    monthly_volume_data = [
-        {
-            'time': m.date.strftime('%Y-%m-%d'),
-            'value': m.trading_volume,
-            'color': '#ef5350' if m.closing_price >= m.opening_price else '#26a69a',
-        }
-        for m in monthly_charts
-    ]
+    # 일/주/월봉 차트는 차트 데이터 API로 비동기 로드 (etf_chart_data)
 
     # 관심섹터 전체 목록
     custom_sectors = CustomSector.objects.all()
@@ -2475,12 +2553,6 @@ def etf_detail(request, code):
     context = {
         'etf': etf,
         'custom_sectors': custom_sectors,
-        'daily_candle_data': json.dumps(daily_candle_data),
-        'daily_volume_data': json.dumps(daily_volume_data),
-        'weekly_candle_data': json.dumps(weekly_candle_data),
-        'weekly_volume_data': json.dumps(weekly_volume_data),
-        'monthly_candle_data': json.dumps(monthly_candle_data),
-        'monthly_volume_data': json.dumps(monthly_volume_data),
     }
     return render(request, 'stocks/etf_detail.html', context)
 
@@ -2785,6 +2857,7 @@ def save_etf(request):
             'weekly': f'+{weekly[0]}/={weekly[1]}',
             'monthly': f'+{monthly[0]}/={monthly[1]}',
         }
+    bump_data_version('etf')
 
     return JsonResponse({
         'success': True,
@@ -2798,6 +2871,8 @@ def save_etf(request):
 @require_POST
 def delete_etf(request, code):
     """ETF 관심종목 삭제 API"""
+    from datetime import date
+    from .cube import mark_cube_changed
     from .models import InfoETF, DailyChartETF, WeeklyChartETF, MonthlyChartETF
 
     etf = get_object_or_404(InfoETF, code=code)
@@ -2809,6 +2884,9 @@ def delete_etf(request, code):
 
     # ETF 삭제
     etf.delete()
+    for timeframe in ('daily', 'weekly', 'monthly'):
+        mark_cube_changed('etf', timeframe, date.min)  # 삭제한 열을 큐브에서 정리 (다음 갱신 때 재구축)
+    bump_data_version('etf')
 
     return JsonResponse({'success': True})
 
@@ -2830,6 +2908,7 @@ def category_add(request):
         return JsonResponse({'error': '이미 존재하는 대분류입니다.'}, status=400)
 
     category = ThemeCategory.objects.create(name=name)
+    bump_data_version('watchlist')
 
     return JsonResponse({
         'success': True,
@@ -2845,6 +2924,7 @@ def category_delete(request, category_id):
 
     category = get_object_or_404(ThemeCategory, id=category_id)
     category.delete()
+    bump_data_version('watchlist')
 
     return JsonResponse({'success': True})
 
@@ -2866,6 +2946,7 @@ def custom_sector_add(request):
         return JsonResponse({'error': '이미 존재하는 섹터입니다.'}, status=400)
 
     sector = CustomSector.objects.create(name=name)
+    bump_data_version('watchlist')
 
     return JsonResponse({
         'success': True,
@@ -2881,6 +2962,7 @@ def custom_sector_delete(request, sector_id):
 
     sector = get_object_or_404(CustomSector, id=sector_id)
     sector.delete()
+    bump_data_version('watchlist')
 
     return JsonResponse({'success': True})
 
@@ -2908,7 +2990,7 @@ def custom_sector_basic_report(request, sector_id):
     """관심섹터 기초리포트 조회 API"""
     from .models import CustomSector
 
-    sector = get_object_or_404(CustomSector, id=sector_id)
+    sector = get_object_or_404(CustomSector.objects.full(), id=sector_id)
 
     return JsonResponse({
         'success': True,
@@ -2922,7 +3004,7 @@ def custom_sector_integrated_report(request, sector_id):
     """관심섹터 기초리포트 조회 API (STEP4용 - 이름 유지)"""
     from .models import CustomSector
 
-    sector = get_object_or_404(CustomSector, id=sector_id)
+    sector = get_object_or_404(CustomSector.objects.full(), id=sector_id)
 
     if sector.basic_report:
         return JsonResponse({
@@ -3030,6 +3112,7 @@ def theme_add(request):
         return JsonResponse({'error': '같은 대분류에 이미 존재하는 소분류입니다.'}, status=400)
 
     theme = Theme.objects.create(category=category, name=name)
+    bump_data_version('watchlist')
 
     return JsonResponse({
         'success': True,
@@ -3046,12 +3129,14 @@ def theme_delete(request, theme_id):
 
     theme = get_object_or_404(Theme, id=theme_id)
     theme.delete()
+    bump_data_version('watchlist')
 
     return JsonResponse({'success': True})
 
 
 @require_GET
-def search_google_news(request):
+@background_job(ttl=SEARCH_RESULT_TTL)
+async def search_google_news(request):
     """Google News 검색 API - Playwright 사용"""
     from urllib.parse import quote
 
@@ -3063,115 +3148,107 @@ def search_google_news(request):
     url = f'https://news.google.com/search?q={quote(keyword)}&hl=ko&gl=KR&ceid=KR%3Ako'
 
     try:
-        from playwright.sync_api import sync_playwright
         from bs4 import BeautifulSoup
+        from .external import render_html
 
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until='networkidle', timeout=30000)
-
-            # 충분히 대기
-            page.wait_for_timeout(3000)
+        # 기사 링크가 나타날 때까지 대기
+        html = await render_html(url, selector='a[href^="./read/"], a[href^="./articles/"]')
 
-            html = page.content()
-            browser.close()
+        soup = BeautifulSoup(html, 'html.parser')
+        results = []
 
-            soup = BeautifulSoup(html, 'html.parser')
-            results = []
+        # Google News: div.UW0SDc 내에서 기사 링크 찾기
+        container = soup.select_one('div.UW0SDc')
+        if not container:
+            container = soup
 
-            # Google News: div.UW0SDc 내에서 기사 링크 찾기
-            container = soup.select_one('div.UW0SDc')
-            if not container:
-                container = soup
+        # 모든 기사 링크 찾기 (./articles/ 또는 ./read/로 시작하는 링크)
+        all_links = container.find_all('a', href=True)
+        seen_titles = set()
 
-            # 모든 기사 링크 찾기 (./articles/ 또는 ./read/로 시작하는 링크)
-            all_links = container.find_all('a', href=True)
-            seen_titles = set()
+        for a in all_links:
+            href = a.get('href', '')
+            text = a.get_text(strip=True)
 
-            for a in all_links:
-                href = a.get('href', '')
-                text = a.get_text(strip=True)
-
-                # 기사 링크만 처리
-                if not (href.startswith('./articles/') or href.startswith('./read/')):
-                    continue
-                if len(text) < 10:  # 제목은 최소 10자
-                    continue
-                if text in seen_titles:  # 중복 제거
-                    continue
+            # 기사 링크만 처리
+            if not (href.startswith('./articles/') or href.startswith('./read/')):
+                continue
+            if len(text) < 10:  # 제목은 최소 10자
+                continue
+            if text in seen_titles:  # 중복 제거
+                continue
 
-                seen_titles.add(text)
-                title = text
-                link = 'https://news.google.com' + href[1:]
+            seen_titles.add(text)
+            title = text
+            link = 'https://news.google.com' + href[1:]
 
-                # 상위 요소들에서 출처와 시간 찾기
-                source = ''
-                date = ''
+            # 상위 요소들에서 출처와 시간 찾기
+            source = ''
+            date = ''
 
-                # 여러 단계의 부모 요소 탐색
-                current = a
-                for _ in range(10):
-                    current = current.find_parent()
-                    if not current:
-                        break
+            # 여러 단계의 부모 요소 탐색
+            current = a
+            for _ in range(10):
+                current = current.find_parent()
+                if not current:
+                    break
 
-                    # 시간 찾기
-                    if not date:
-                        time_el = current.find('time')
-                        if time_el:
-                            datetime_attr = time_el.get('datetime', '')
-                            if datetime_attr:
-                                try:
-                                    dt = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
-                                    date = dt.strftime('%Y-%m-%d %H:%M')
-                                except:
-                                    date = time_el.get_text(strip=True)
-                            else:
+                # 시간 찾기
+                if not date:
+                    time_el = current.find('time')
+                    if time_el:
+                        datetime_attr = time_el.get('datetime', '')
+                        if datetime_attr:
+                            try:
+                                dt = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
+                                date = dt.strftime('%Y-%m-%d %H:%M')
+                            except:
                                 date = time_el.get_text(strip=True)
+                        else:
+                            date = time_el.get_text(strip=True)
+
+                # 출처 찾기 (보통 이미지 옆에 있거나 별도 div에 있음)
+                if not source:
+                    for el in current.find_all(['div', 'span', 'a'], recursive=False):
+                        el_text = el.get_text(strip=True)
+                        # '더보기' 제거
+                        el_text = el_text.replace('더보기', '').strip()
+                        if el_text and 2 <= len(el_text) <= 20 and el_text != title:
+                            if not any(x in el_text for x in ['시간', '분 전', '일 전', '주 전', '검색', '관련']):
+                                # 제목의 일부가 아닌지 확인
+                                if el_text not in title:
+                                    source = el_text
+                                    break
+
+                # 둘 다 찾았으면 종료
+                if date and source:
+                    break
 
-                    # 출처 찾기 (보통 이미지 옆에 있거나 별도 div에 있음)
-                    if not source:
-                        for el in current.find_all(['div', 'span', 'a'], recursive=False):
-                            el_text = el.get_text(strip=True)
-                            # '더보기' 제거
-                            el_text = el_text.replace('더보기', '').strip()
-                            if el_text and 2 <= len(el_text) <= 20 and el_text != title:
-                                if not any(x in el_text for x in ['시간', '분 전', '일 전', '주 전', '검색', '관련']):
-                                    # 제목의 일부가 아닌지 확인
-                                    if el_text not in title:
-                                        source = el_text
-                                        break
-
-                    # 둘 다 찾았으면 종료
-                    if date and source:
-                        break
-
-                results.append({
-                    'title': title,
-                    'source': source,
-                    'date': date,
-                    'link': link,
-                })
+            results.append({
+                'title': title,
+                'source': source,
+                'date': date,
+                'link': link,
+            })
 
-                if len(results) >= 15:
-                    break
+            if len(results) >= 15:
+                break
 
-            # 날짜순 정렬 (최신순)
-            def parse_news_date(item):
-                date_str = item.get('date', '')
-                if not date_str:
-                    return datetime.min
-                try:
-                    if '-' in date_str and ':' in date_str:
-                        return datetime.strptime(date_str[:16], '%Y-%m-%d %H:%M')
-                    if '-' in date_str:
-                        return datetime.strptime(date_str[:10], '%Y-%m-%d')
-                except:
-                    pass
+        # 날짜순 정렬 (최신순)
+        def parse_news_date(item):
+            date_str = item.get('date', '')
+            if not date_str:
                 return datetime.min
+            try:
+                if '-' in date_str and ':' in date_str:
+                    return datetime.strptime(date_str[:16], '%Y-%m-%d %H:%M')
+                if '-' in date_str:
+                    return datetime.strptime(date_str[:10], '%Y-%m-%d')
+            except:
+                pass
+            return datetime.min
 
-            results.sort(key=parse_news_date, reverse=True)
+        results.sort(key=parse_news_date, reverse=True)
 
         return JsonResponse({
             'success': True,
@@ -3390,6 +3467,7 @@ def preferred_channel_delete(request, channel_id):
 
 
 @require_GET
+@background_job(ttl=SEARCH_RESULT_TTL)
 def search_youtube_preferred(request):
     """유튜브 선호 채널 검색 API - 각 선호 채널별로 검색"""
     import requests as http_requests
@@ -3841,7 +3919,7 @@ def news_summary(request, news_id):
     """뉴스 요약 페이지"""
     from .models import News
 
-    news = get_object_or_404(News, id=news_id)
+    news = get_object_or_404(News.objects.full(), id=news_id)
 
     if request.method == 'POST':
         news.summary = request.POST.get('summary', '')
@@ -3909,7 +3987,7 @@ def telegram_summary(request, message_id):
     """텔레그램 메시지 요약 페이지"""
     from .models import TelegramMessage
 
-    msg = get_object_or_404(TelegramMessage, id=message_id)
+    msg = get_object_or_404(TelegramMessage.objects.full(), id=message_id)
 
     if request.method == 'POST':
         msg.summary = request.POST.get('summary', '')
@@ -4068,6 +4146,8 @@ def refresh_market_trend(request, market):
             'institution': cumulative_institution,
         })
 
+    bump_data_version('market')
+
     return JsonResponse({
         'success': True,
         'market': market,
@@ -4082,7 +4162,7 @@ def refresh_market_trend(request, market):
 def refresh_sector(request, market):
     """업종별 순매수 새로고침 API (키움 API ka10051)"""
     import requests
-    from .models import Sector, DailyChart
+    from .models import Sector, SectorMaster, DailyChart
     from .utils import get_valid_token
 
     market = market.upper()
@@ -4144,6 +4224,9 @@ def refresh_sector(request, market):
 
         sector_list = response_data[data_key]
         saved_count = 0
+        masters = SectorMaster.objects.sync(market, {
+            item.get('inds_cd'): item.get('inds_nm', '') for item in sector_list if item.get('inds_cd')
+        })
 
         for item in sector_list:
             Sector.objects.update_or_create(
@@ -4151,6 +4234,7 @@ def refresh_sector(request, market):
                 date=latest_date,
                 market=market,
                 defaults={
+                    'master': masters[item.get('inds_cd')],
                     'name': item.get('inds_nm', ''),
                     'individual_net_buying': parse_number(item.get('ind_netprps')),
                     'foreign_net_buying': parse_number(item.get('frgnr_netprps')),
@@ -4186,6 +4270,8 @@ def refresh_sector(request, market):
             for s in sectors
         ]
 
+        bump_data_version('sector')
+
         return JsonResponse({
             'success': True,
             'market': market,
@@ -4200,11 +4286,9 @@ def refresh_sector(request, market):
 
 @require_POST
 def refresh_stock(request, code):
-    """종목 정보 새로고침 API (기본정보 + 수급 + 공매도)"""
-    import requests
-    from decimal import Decimal, InvalidOperation
-    from datetime import timedelta
-    from .models import Info, InvestorTrend, ShortSelling
+    """종목 정보 새로고침 API (기본정보 + 수급 + 공매도, 동시 호출)"""
+    from .models import Info
+    from .refresh import refresh_stocks
     from .utils import get_valid_token
 
     try:
@@ -4217,193 +4301,64 @@ def refresh_stock(request, code):
     if not token:
         return JsonResponse({'error': '토큰 발급 실패. 키움 API 설정을 확인하세요.'}, status=400)
 
-    results = {}
-
-    def parse_int(value, absolute=False):
-        if not value:
-            return None
-        try:
-            result = int(str(value).replace(',', '').replace('+', ''))
-            return abs(result) if absolute else result
-        except (ValueError, AttributeError):
-            return None
-
-    def parse_decimal(value):
-        if not value:
-            return None
-        try:
-            return Decimal(str(value).replace(',', '').replace('+', ''))
-        except (InvalidOperation, AttributeError):
-            return None
+    refreshed = refresh_stocks([stock], token)[code]
+    bump_data_version('stock_info')
 
-    # 1. 기본정보 (ka10001)
-    try:
-        url = 'https://api.kiwoom.com/api/dostk/stkinfo'
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {token}',
-            'cont-yn': 'N',
-            'next-key': '',
-            'api-id': 'ka10001',
-        }
-        params = {'stk_cd': code}
+    return JsonResponse({
+        'success': True,
+        'results': refreshed['results'],
+        'data': refreshed['data'],
+    })
 
-        response = requests.post(url, headers=headers, json=params, timeout=10)
-        if response.status_code == 200:
-            data = response.json()
-            stock.current_price = parse_int(data.get('cur_prc'), absolute=True)
-            stock.price_change = parse_int(data.get('pred_pre'))
-            stock.change_rate = parse_decimal(data.get('flu_rt'))
-            stock.volume = parse_int(data.get('trde_qty'))
-            stock.market_cap = parse_int(data.get('mac'))
-            stock.per = parse_decimal(data.get('per'))
-            stock.pbr = parse_decimal(data.get('pbr'))
-            stock.save()
-            results['info'] = 'success'
-        else:
-            results['info'] = f'error: {response.status_code}'
-    except Exception as e:
-        results['info'] = f'error: {str(e)}'
 
-    # 2. 투자자 매매동향 (ka10059)
-    try:
-        today = datetime.now().strftime('%Y%m%d')
-        url = 'https://api.kiwoom.com/api/dostk/stkinfo'
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {token}',
-            'cont-yn': 'N',
-            'next-key': '',
-            'api-id': 'ka10059',
-        }
-        params = {
-            'dt': today,
-            'stk_cd': code,
-            'amt_qty_tp': '1',
-            'trde_tp': '0',
-            'unit_tp': '1000',
-        }
+@require_POST
+def refresh_stocks_batch(request):
+    """
+    여러 종목 새로고침 API (대시보드 관심 단계 전체)
 
-        response = requests.post(url, headers=headers, json=params, timeout=10)
-        if response.status_code == 200:
-            response_data = response.json()
-            data_key = None
-            for key in ['stk_invsr_orgn', 'invsr_stk_daly', 'stk_invsr_daly', 'data', 'result', 'output']:
-                if key in response_data and isinstance(response_data[key], list):
-                    data_key = key
-                    break
+    POST:
+        level: 관심 단계 (super/normal/incubator) 또는
+        codes: 종목코드 목록 (쉼표 구분)
 
-            if data_key and response_data[data_key]:
-                all_data = response_data[data_key]
-                latest_date = max(item.get('dt', '') for item in all_data)
-                latest_data = [item for item in all_data if item.get('dt') == latest_date]
-
-                for item in latest_data:
-                    date = datetime.strptime(item['dt'], '%Y%m%d').date()
-                    InvestorTrend.objects.update_or_create(
-                        stock=stock,
-                        date=date,
-                        defaults={
-                            'individual': parse_int(item.get('ind_invsr')) or 0,
-                            'foreign': parse_int(item.get('frgnr_invsr')) or 0,
-                            'institution': parse_int(item.get('orgn')) or 0,
-                            'domestic_foreign': parse_int(item.get('natfor')) or 0,
-                            'financial': parse_int(item.get('fnnc_invt')) or 0,
-                            'insurance': parse_int(item.get('insrnc')) or 0,
-                            'investment_trust': parse_int(item.get('invtrt')) or 0,
-                            'other_finance': parse_int(item.get('etc_fnnc')) or 0,
-                            'bank': parse_int(item.get('bank')) or 0,
-                            'pension_fund': parse_int(item.get('penfnd_etc')) or 0,
-                            'private_fund': parse_int(item.get('samo_fund')) or 0,
-                            'other_corporation': parse_int(item.get('etc_corp')) or 0,
-                        }
-                    )
-                results['investor'] = 'success'
-            else:
-                results['investor'] = 'no data'
-        else:
-            results['investor'] = f'error: {response.status_code}'
-    except Exception as e:
-        results['investor'] = f'error: {str(e)}'
+    종목 수와 관계없이 키움 API 동시 호출 수는 MAX_CONCURRENT_CALLS 이하
+    """
+    from .models import Info
+    from .refresh import refresh_stocks, MAX_BATCH_CODES
+    from .utils import get_valid_token
 
-    # 3. 공매도 (ka10014)
-    try:
-        today = datetime.now()
-        week_ago = today - timedelta(days=7)
-        url = 'https://api.kiwoom.com/api/dostk/shsa'
-        headers = {
-            'Content-Type': 'application/json;charset=UTF-8',
-            'authorization': f'Bearer {token}',
-            'cont-yn': 'N',
-            'next-key': '',
-            'api-id': 'ka10014',
-        }
-        params = {
-            'stk_cd': code,
-            'tm_tp': '1',
-            'strt_dt': week_ago.strftime('%Y%m%d'),
-            'end_dt': today.strftime('%Y%m%d'),
-        }
+    level = request.POST.get('level')
+    codes = [c.strip() for c in request.POST.get('codes', '').split(',') if c.strip()]
+    if level:
+        if level not in dict(Info._meta.get_field('interest_level').choices):
+            return JsonResponse({'error': '잘못된 관심 단계입니다.'}, status=400)
+        stocks = Info.objects.filter(interest_level=level)
+    elif codes:
+        stocks = Info.objects.filter(code__in=codes)
+    else:
+        return JsonResponse({'error': 'level 또는 codes가 필요합니다.'}, status=400)
 
-        response = requests.post(url, headers=headers, json=params, timeout=10)
-        if response.status_code == 200:
-            response_data = response.json()
-            data_key = None
-            for key in ['shrts_trnsn', 'data', 'result', 'output']:
-                if key in response_data and isinstance(response_data[key], list):
-                    data_key = key
-                    break
+    stocks = list(stocks.order_by('code')[:MAX_BATCH_CODES + 1])
+    if len(stocks) > MAX_BATCH_CODES:
+        return JsonResponse({'error': f'한 번에 최대 {MAX_BATCH_CODES}종목까지 새로고침할 수 있습니다.'}, status=400)
+    if not stocks:
+        return JsonResponse({'success': True, 'stocks': {}, 'failed': []})
 
-            if data_key and response_data[data_key]:
-                all_data = response_data[data_key]
-                dates = [item.get('dt', '') for item in all_data if item.get('dt')]
-                if dates:
-                    latest_date = max(dates)
-                    latest_data = [item for item in all_data if item.get('dt') == latest_date]
-
-                    for item in latest_data:
-                        date = datetime.strptime(item['dt'], '%Y%m%d').date()
-                        ShortSelling.objects.update_or_create(
-                            stock=stock,
-                            date=date,
-                            defaults={
-                                'trading_volume': parse_int(item.get('trde_qty')) or 0,
-                                'short_volume': parse_int(item.get('shrts_qty')) or 0,
-                                'cumulative_short_volume': parse_int(item.get('ovr_shrts_qty')) or 0,
-                                'trading_weight': parse_decimal(item.get('trde_wght')) or Decimal('0'),
-                                'short_trading_value': parse_int(item.get('shrts_trde_prica')) or 0,
-                                'short_average_price': parse_int(item.get('shrts_avg_pric')) or 0,
-                            }
-                        )
-                    results['short'] = 'success'
-                else:
-                    results['short'] = 'no data'
-            else:
-                results['short'] = 'no data'
-        else:
-            results['short'] = f'error: {response.status_code}'
-    except Exception as e:
-        results['short'] = f'error: {str(e)}'
+    token = get_valid_token()
+    if not token:
+        return JsonResponse({'error': '토큰 발급 실패. 키움 API 설정을 확인하세요.'}, status=400)
 
-    # 업데이트된 데이터 반환
-    stock.refresh_from_db()
+    refreshed = refresh_stocks(stocks, token)
+    bump_data_version('stock_info')
 
-    return JsonResponse({
-        'success': True,
-        'results': results,
-        'data': {
-            'current_price': stock.current_price,
-            'price_change': stock.price_change,
-            'change_rate': float(stock.change_rate) if stock.change_rate else None,
-            'volume': stock.volume,
-            'market_cap': stock.market_cap,
-            'per': float(stock.per) if stock.per else None,
-            'pbr': float(stock.pbr) if stock.pbr else None,
-        }
-    })
+    failed = [
+        code for code, item in refreshed.items()
+        if any(status.startswith('error') for status in item['results'].values())
+    ]
+    return JsonResponse({'success': True, 'stocks': refreshed, 'failed': failed})
 
 
 @require_POST
+@background_job()
 def fetch_investor_trend(request, code):
     """수급 데이터 가져오기 API (6개월)"""
     import requests
@@ -4651,6 +4606,56 @@ def fetch_short_selling(request, code):
     })
 
 
+@require_GET
+def export_data(request, table):
+    """
+    데이터 내보내기 API (스트리밍 다운로드, stocks/export.py 참고)
+
+    GET:
+        format: csv (기본값) / parquet
+        start, end: 일자 범위 (YYYY-MM-DD 또는 YYYYMMDD)
+        codes: 종목코드/업종코드/시장 (쉼표 구분, 기본값: 전체)
+
+    DB 커서에서 청크 단위로 읽어 바로 전송하므로 행 수와 관계없이 메모리 사용량이 일정합니다.
+    """
+    from asgiref.sync import sync_to_async
+    from django.core.handlers.asgi import ASGIRequest
+    from django.http import StreamingHttpResponse
+    from .export import CONTENT_TYPES, EXPORT_TABLES, FORMATS, TableExport, parse_codes, parse_date, parquet_available
+
+    if table not in EXPORT_TABLES:
+        return JsonResponse({'error': f'지원하지 않는 테이블입니다. (가능: {", ".join(EXPORT_TABLES)})'}, status=404)
+
+    fmt = request.GET.get('format', 'csv')
+    if fmt not in FORMATS:
+        return JsonResponse({'error': f'지원하지 않는 형식입니다. (가능: {", ".join(FORMATS)})'}, status=400)
+    if fmt == 'parquet' and not parquet_available():
+        return JsonResponse({'error': '서버에 pyarrow가 설치되어 있지 않아 parquet을 사용할 수 없습니다.'}, status=400)
+
+    try:
+        start = parse_date(request.GET.get('start'))
+        end = parse_date(request.GET.get('end'))
+    except ValueError:
+        return JsonResponse({'error': '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD 또는 YYYYMMDD)'}, status=400)
+
+    export = TableExport(table, start=start, end=end, codes=parse_codes(request.GET.get('codes')))
+    chunks = export.chunks(fmt)
+
+    if isinstance(request, ASGIRequest):
+        # ASGI는 동기 이터레이터를 전부 list로 모은 뒤 전송하므로, 청크마다 스레드에서 꺼내는 비동기 이터레이터로 전달
+        async def stream():
+            done = object()
+            while (chunk := await sync_to_async(next)(chunks, done)) is not done:
+                yield chunk
+        content = stream()
+    else:
+        content = chunks
+
+    response = StreamingHttpResponse(content, content_type=CONTENT_TYPES[fmt])
+    response['Content-Disposition'] = f'attachment; filename="{export.filename(fmt)}"'
+    return response
+
+
 @require_POST
 def save_setting(request):
     """시스템 설정 저장"""
@@ -4855,7 +4860,7 @@ def sector_news_summary(request, news_id):
     from django.contrib import messages
     from .models import SectorNews
 
-    news = get_object_or_404(SectorNews, id=news_id)
+    news = get_object_or_404(SectorNews.objects.full(), id=news_id)
 
     if request.method == 'POST':
         summary = request.POST.get('summary', '')
@@ -5047,7 +5052,7 @@ def sector_youtube_summary(request, video_id):
     """섹터 유튜브 영상 요약 편집 페이지"""
     from .models import SectorYoutubeVideo
 
-    video = get_object_or_404(SectorYoutubeVideo, id=video_id)
+    video = get_object_or_404(SectorYoutubeVideo.objects.full(), id=video_id)
 
     if request.method == 'POST':
         summary = request.POST.get('summary', '')
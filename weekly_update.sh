@@ -24,9 +24,21 @@ echo "주간 업데이트 시작: $(date '+%Y-%m-%d %H:%M:%S')"
 echo "========================================"
 
 # 재무제표 (네이버)
-echo "[1/1] 재무제표..."
+echo "[1/4] 재무제표..."
 python manage.py save_financial_naver --code all --log-level info
 
+# 시계열 보관 기간 정리 (보관 파일 저장 후 삭제, 상폐 후 유예 기간이 지난 종목 포함)
+echo "[2/4] 보관 기간 정리..."
+python manage.py apply_retention --delisted --log-level info
+
+# OHLCV 큐브 전체 재구축 (삭제된 종목 정리)
+echo "[3/4] OHLCV 큐브 재구축..."
+python manage.py build_ohlcv_cube --mode all --log-level info
+
+# 통합 검색 색인 재구축 (시그널 밖에서 바뀐 텍스트 반영, FTS 세그먼트 병합)
+echo "[4/4] 검색 색인 재구축..."
+python manage.py rebuild_search_index --log-level info
+
 echo "========================================"
 echo "주간 업데이트 완료: $(date '+%Y-%m-%d %H:%M:%S')"
 echo "========================================"